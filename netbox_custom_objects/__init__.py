@@ -246,6 +246,54 @@ def _patch_graphql_view():
     _graphql_view_patched = True
 
 
+def _is_openapi_hook(hook):
+    return (
+        getattr(hook, "__module__", None) == "netbox_custom_objects.api.openapi"
+        and getattr(hook, "__qualname__", None) == "postprocess_schema"
+    )
+
+
+def _register_openapi_hook():
+    """
+    Add the custom object endpoints to NetBox's OpenAPI schema.
+
+    ``CustomObjectViewSet`` is excluded from introspection (its serializer
+    depends on the URL), so the concrete per-type paths are contributed by a
+    drf-spectacular post-processing hook (see
+    :mod:`netbox_custom_objects.api.openapi`).  Plugins cannot extend
+    ``SPECTACULAR_SETTINGS``, so the hook is prepended to the resolved setting;
+    running first lets the configured hooks (enum naming) see its components.
+    Registering again (a second ``ready()``) replaces the hook rather than
+    adding it twice, and it is re-applied when ``SPECTACULAR_SETTINGS`` changes.
+    """
+    from django.core.signals import setting_changed
+    from drf_spectacular.settings import spectacular_settings
+    from netbox_custom_objects.api.openapi import postprocess_schema
+
+    hooks = [hook for hook in spectacular_settings.POSTPROCESSING_HOOKS if not _is_openapi_hook(hook)]
+    spectacular_settings.POSTPROCESSING_HOOKS = [postprocess_schema, *hooks]
+    setting_changed.connect(_reapply_openapi_hook, dispatch_uid="netbox_custom_objects.openapi_hook")
+
+
+def _reapply_openapi_hook(setting, **kwargs):
+    """
+    Reload drf-spectacular's settings when ``SPECTACULAR_SETTINGS`` changes and
+    put the hook back.
+
+    drf-spectacular reads the setting once at import, and reloading its settings
+    object drops the hook along with every other resolved value.
+    """
+    if setting != "SPECTACULAR_SETTINGS":
+        return
+    from django.conf import settings
+    from drf_spectacular.settings import spectacular_settings
+
+    spectacular_settings.reload()
+    # APISettings.reload() forgets the user settings passed at construction.
+    spectacular_settings._user_settings = getattr(settings, "SPECTACULAR_SETTINGS", {})
+    _register_openapi_hook()
+
+
 # Plugin Configuration
 class CustomObjectsPluginConfig(PluginConfig):
     name = "netbox_custom_objects"
@@ -261,6 +309,12 @@ class CustomObjectsPluginConfig(PluginConfig):
     default_settings = {
         # The maximum number of Custom Object Types that may be created
         'max_custom_object_types': 50,
+        # Row count at or above which list views use PostgreSQL's estimate
+        # instead of an exact count(*); None disables estimation.
+        'approximate_count_threshold': None,
+        # Seconds to keep rendered REST list responses in the shared cache,
+        # keyed on the type's write version; None disables the cache.
+        'list_response_cache_timeout': None,
     }
     required_settings = []
     template_extensions = "template_content.template_extensions"
@@ -419,6 +473,9 @@ class CustomObjectsPluginConfig(PluginConfig):
         # are reflected in the schema without a NetBox restart.
         _patch_graphql_view()
 
+        # Publish the per-type custom object endpoints in the OpenAPI schema.
+        _register_openapi_hook()
+
         # Keep the live GraphQL schema's signature cache fresh across workers
         # event-driven, so the per-request hot path reads the cache instead of
         # polling the database.
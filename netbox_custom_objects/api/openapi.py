@@ -0,0 +1,198 @@
+"""
+OpenAPI (drf-spectacular) support for the dynamic custom object endpoints.
+
+``CustomObjectViewSet`` serves every custom object type from one pair of URL
+patterns (``<custom_object_type>/`` and ``<custom_object_type>/<pk>/``), so
+drf-spectacular cannot introspect it at startup and the viewset is excluded
+from the generated schema.  :func:`postprocess_schema` runs as a spectacular
+post-processing hook instead: for each custom object type it generates the
+concrete paths and components (serializers, request variants, filter
+parameters) and merges them into the schema.
+
+Generating a type's fragment builds its serializer and FilterSet and walks
+every field, which takes tens of seconds per schema hit with hundreds of
+types.  Fragments are therefore cached per process, keyed by the type's
+``cache_timestamp`` together with the ``cache_timestamp`` of every custom
+object type its fields point at (a related type's nested serializer is part of
+the fragment), so a schema request only regenerates the types that changed.
+"""
+import copy
+import logging
+import threading
+
+from django.db.utils import DatabaseError
+from django.urls import include, path, reverse
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.settings import spectacular_settings
+from netbox.api.viewsets import NetBoxModelViewSet
+from rest_framework.routers import SimpleRouter
+
+from netbox_custom_objects.constants import APP_LABEL
+from netbox_custom_objects.filtersets import get_filterset_class
+from netbox_custom_objects.models import CustomObjectType
+from netbox_custom_objects.pagination import ApproximateCountLimitOffsetPagination
+from netbox_custom_objects.utilities import extract_cot_id_from_model_name
+
+from . import serializers
+
+__all__ = (
+    "clear_schema_cache",
+    "get_schema_fragment",
+    "postprocess_schema",
+)
+
+logger = logging.getLogger(__name__)
+
+# (cot id, branch id) -> (cache key, fragment).  A fragment is
+# {"paths": {...}, "components": {section: {name: component}}}.
+_fragment_cache = {}
+_fragment_cache_lock = threading.Lock()
+
+
+def clear_schema_cache():
+    """Drop every cached fragment (used by tests)."""
+    with _fragment_cache_lock:
+        _fragment_cache.clear()
+
+
+def _related_cot_ids(custom_object_type):
+    """Ids of the custom object types referenced by ``custom_object_type``'s fields."""
+    ids = set()
+    for field in custom_object_type.fields.all():
+        object_types = list(field.related_object_types.all())
+        if field.related_object_type is not None:
+            object_types.append(field.related_object_type)
+        for object_type in object_types:
+            if object_type.app_label != APP_LABEL:
+                continue
+            cot_id = extract_cot_id_from_model_name(object_type.model)
+            if cot_id is not None:
+                ids.add(int(cot_id))
+    ids.discard(custom_object_type.id)
+    return ids
+
+
+def _fragment_key(custom_object_type, timestamps):
+    return (
+        custom_object_type.cache_timestamp,
+        tuple(sorted(
+            (cot_id, timestamps.get(cot_id)) for cot_id in _related_cot_ids(custom_object_type)
+        )),
+    )
+
+
+def _schema_viewset(model):
+    """
+    A concrete ``ModelViewSet`` for ``model``, used only for introspection.
+
+    It mirrors what ``CustomObjectViewSet`` resolves per request (serializer,
+    FilterSet, pagination) without the URL-kwarg lookup spectacular cannot do.
+    """
+    return type(
+        f"{model._meta.object_name}SchemaViewSet",
+        (NetBoxModelViewSet,),
+        {
+            "queryset": model.objects.all(),
+            "serializer_class": serializers.get_serializer_class(model),
+            "filterset_class": get_filterset_class(model),
+            "pagination_class": ApproximateCountLimitOffsetPagination,
+        },
+    )
+
+
+def _generate_fragment(custom_object_type):
+    model = custom_object_type.get_model()
+    # Same prefix the live endpoints are served under (including BASE_PATH).
+    list_path = reverse(
+        "plugins-api:netbox_custom_objects-api:customobject-list",
+        kwargs={"custom_object_type": custom_object_type.slug},
+    )
+    prefix = list_path.lstrip("/").removesuffix(f"{custom_object_type.slug}/")
+
+    router = SimpleRouter()
+    router.register(
+        custom_object_type.slug,
+        _schema_viewset(model),
+        basename=f"customobject-{custom_object_type.slug}",
+    )
+    generator = SchemaGenerator(patterns=[path(prefix, include(router.urls))])
+    # parse() + registry.build() is what get_schema() does, minus the
+    # post-processing hooks — those run once over the merged schema.
+    paths = generator.parse(None, True)
+    components = generator.registry.build(spectacular_settings.APPEND_COMPONENTS)
+    return {"paths": paths, "components": components}
+
+
+def get_schema_fragment(custom_object_type, branch_id=None, timestamps=None):
+    """
+    Return the cached OpenAPI fragment for ``custom_object_type``, generating
+    it if the type (or a type it references) changed since it was cached.
+
+    ``timestamps`` maps cot id -> ``cache_timestamp`` for every type; it is
+    looked up when omitted.
+    """
+    if timestamps is None:
+        timestamps = dict(CustomObjectType.objects.values_list("id", "cache_timestamp"))
+    key = _fragment_key(custom_object_type, timestamps)
+    cache_id = (custom_object_type.id, branch_id)
+    with _fragment_cache_lock:
+        cached = _fragment_cache.get(cache_id)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    fragment = _generate_fragment(custom_object_type)
+    with _fragment_cache_lock:
+        _fragment_cache[cache_id] = (key, fragment)
+    return fragment
+
+
+def postprocess_schema(result, generator, request, public, **kwargs):
+    """
+    drf-spectacular post-processing hook that adds every custom object type's
+    endpoints to the schema.  Registered ahead of the configured hooks in
+    ``CustomObjectsPluginConfig.ready()`` so that, for example, enum
+    post-processing also covers the custom object components.
+    """
+    try:
+        custom_object_types = list(
+            CustomObjectType.objects.order_by("slug").prefetch_related(
+                "fields__related_object_type", "fields__related_object_types"
+            )
+        )
+    except DatabaseError:
+        logger.warning("Could not load custom object types for the OpenAPI schema", exc_info=True)
+        return result
+
+    branch_id = CustomObjectType._active_branch_id()
+    timestamps = {cot.id: cot.cache_timestamp for cot in custom_object_types}
+    paths = result.setdefault("paths", {})
+    components = result.setdefault("components", {})
+
+    for custom_object_type in custom_object_types:
+        try:
+            fragment = get_schema_fragment(custom_object_type, branch_id, timestamps)
+        except Exception:  # noqa: BLE001 - one broken type must not break the schema
+            logger.warning(
+                "Failed to generate the OpenAPI schema for custom object type %s",
+                custom_object_type.slug,
+                exc_info=True,
+            )
+            continue
+        # Later hooks (enum post-processing) rewrite components in place, so
+        # merge copies and keep the cached fragment pristine.
+        fragment = copy.deepcopy(fragment)
+        paths.update(fragment["paths"])
+        for section, entries in fragment["components"].items():
+            target = components.setdefault(section, {})
+            for name, component in entries.items():
+                # Components shared with core (nested NetBox serializers, security
+                # schemes) are already present; keep the core definition.
+                target.setdefault(name, component)
+
+    # Forget types that no longer exist in this branch.
+    live_ids = set(timestamps)
+    with _fragment_cache_lock:
+        for cache_id in [k for k in _fragment_cache if k[1] == branch_id and k[0] not in live_ids]:
+            del _fragment_cache[cache_id]
+
+    return result
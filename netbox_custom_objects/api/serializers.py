@@ -5,6 +5,7 @@ import sys
 from core.models import ObjectType
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
+from django.db.models import Manager, prefetch_related_objects
 from django.urls import NoReverseMatch
 from django.utils.translation import gettext_lazy as _
 from extras.choices import CustomFieldTypeChoices
@@ -46,6 +47,121 @@ class ContentTypeSerializer(NetBoxModelSerializer):
         )
 
 
+# Serializer context key holding related instances pre-resolved for one request:
+# ``{model_class: {pk: instance}}``.  Filled by the generated serializer's
+# to_internal_value() before field validation so that relational fields resolve
+# their input from memory instead of issuing one query per referenced id.
+_RELATED_INSTANCES = "_related_instances"
+
+
+def _as_pk(value):
+    """Return ``value`` as an integer pk if it is a bare id (or ``{"id": n}``), else ``None``."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    if isinstance(value, dict) and set(value) == {"id"}:
+        return _as_pk(value["id"])
+    return None
+
+
+def _related_not_found(pk):
+    return serializers.ValidationError(
+        _("Related object not found using the provided numeric ID: %(id)s") % {"id": pk}
+    )
+
+
+class PrefetchedRelatedMixin:
+    """
+    Nested-serializer mixin that resolves bare primary keys from the related
+    instances pre-resolved for the request (see ``_RELATED_INSTANCES``).
+
+    Input the batch did not cover (attribute dicts, or a model that was not
+    prefetched) falls through to NetBox's per-object lookup unchanged.
+    """
+
+    def to_internal_value(self, data):
+        related = self.context.get(_RELATED_INSTANCES)
+        model = self.Meta.model
+        if getattr(self, "nested", False) and related is not None and model in related:
+            pk = _as_pk(data)
+            if pk is not None:
+                try:
+                    return related[model][pk]
+                except KeyError:
+                    raise _related_not_found(pk) from None
+        return super().to_internal_value(data)
+
+
+# NetBox serializer class -> PrefetchedRelatedMixin subclass.  Bounded by the set of
+# NetBox models that custom object fields point at.
+_prefetching_serializer_classes = {}
+
+
+def get_prefetching_serializer_class(serializer_class):
+    """Return ``serializer_class`` with :class:`PrefetchedRelatedMixin` mixed in."""
+    if issubclass(serializer_class, PrefetchedRelatedMixin):
+        return serializer_class
+    try:
+        return _prefetching_serializer_classes[serializer_class]
+    except KeyError:
+        subclass = type(
+            serializer_class.__name__,
+            (PrefetchedRelatedMixin, serializer_class),
+            {"__module__": serializer_class.__module__},
+        )
+        _prefetching_serializer_classes[serializer_class] = subclass
+        return subclass
+
+
+def _prefetch_related_input(serializer, items):
+    """
+    Resolve every related object referenced by ``items`` (the input dicts of
+    one or more objects) with one ``in_bulk()`` query per target model and
+    store the result in the serializer context.  Objects already resolved for
+    the request are not queried again.
+
+    Covers non-polymorphic OBJECT/MULTIOBJECT fields (bare ids) and polymorphic
+    fields (content type + object id).  Anything malformed is skipped here and
+    reported by the field's own validation.
+    """
+    wanted = {}
+    for name, value in ((name, value) for data in items for name, value in data.items()):
+        field = serializer.fields.get(name)
+        if field is None or field.read_only or value is None:
+            continue
+        if isinstance(field, (serializers.ListSerializer, serializers.ListField)):
+            if not isinstance(value, list):
+                continue
+            child, values = field.child, value
+        else:
+            child, values = field, [value]
+
+        if isinstance(child, PolymorphicObjectSerializerField):
+            for item in values:
+                try:
+                    model_class, obj_id = child.resolve_reference(item)
+                except serializers.ValidationError:
+                    continue
+                pk = _as_pk(obj_id)
+                if pk is not None:
+                    wanted.setdefault(model_class, set()).add(pk)
+        elif isinstance(child, PrefetchedRelatedMixin) and getattr(child, "nested", False):
+            for item in values:
+                pk = _as_pk(item)
+                if pk is not None:
+                    wanted.setdefault(child.Meta.model, set()).add(pk)
+
+    related = serializer.context.setdefault(_RELATED_INSTANCES, {})
+    for model_class, pks in wanted.items():
+        resolved = related.setdefault(model_class, {})
+        missing = pks - resolved.keys()
+        if missing:
+            resolved.update(model_class.objects.in_bulk(missing))
+
+
 class PolymorphicObjectSerializerField(serializers.Field):
     """
     Serializer field for polymorphic GenericForeignKey Object fields.
@@ -76,16 +192,21 @@ class PolymorphicObjectSerializerField(serializers.Field):
             "display": str(value),
         }
 
-    def to_internal_value(self, data):
+    def resolve_reference(self, data):
+        """
+        Validate the reference ``data`` and return ``(model_class, object_id)``
+        without loading the object.  ContentType lookups go through Django's
+        ContentType cache, so repeated references cost no queries.
+        """
         if not isinstance(data, dict):
             raise serializers.ValidationError(_("Expected a dict with object reference."))
 
         # Resolve ContentType
         try:
             if "content_type_id" in data:
-                ct = ContentType.objects.get(pk=data["content_type_id"])
+                ct = ContentType.objects.get_for_id(int(data["content_type_id"]))
             elif "app_label" in data and "model" in data:
-                ct = ContentType.objects.get(app_label=data["app_label"], model=data["model"])
+                ct = ContentType.objects.get_by_natural_key(data["app_label"], data["model"])
             else:
                 raise serializers.ValidationError(
                     _("Must provide content_type_id or (app_label + model).")
@@ -109,6 +230,18 @@ class PolymorphicObjectSerializerField(serializers.Field):
         obj_id = data.get("object_id") if "object_id" in data else data.get("id")
         if obj_id is None:
             raise serializers.ValidationError(_("Must provide object_id."))
+        return model_class, obj_id
+
+    def to_internal_value(self, data):
+        model_class, obj_id = self.resolve_reference(data)
+
+        related = self.context.get(_RELATED_INSTANCES)
+        pk = _as_pk(obj_id)
+        if related is not None and model_class in related and pk is not None:
+            try:
+                return related[model_class][pk]
+            except KeyError:
+                raise serializers.ValidationError(_("No matching object found.")) from None
 
         try:
             return model_class.objects.get(pk=obj_id)
@@ -148,6 +281,8 @@ class CustomObjectTypeFieldSerializer(NetBoxModelSerializer):
             "context",
             "required",
             "unique",
+            "indexed",
+            "trigram_indexed",
             "default",
             "choice_set",
             "validation_regex",
@@ -338,6 +473,9 @@ class CustomObjectTypeSerializer(NetBoxModelSerializer):
             "display_expression",
             "description",
             "config_context_enabled",
+            "restrict_quick_search",
+            "full_text_search",
+            "indexes",
             "tags",
             "created",
             "last_updated",
@@ -441,6 +579,35 @@ class CustomObjectSerializer(NetBoxModelSerializer):
         return result
 
 
+class CustomObjectListSerializer(serializers.ListSerializer):
+    """
+    List serializer for generated custom object serializers.
+
+    Before rendering, prefetches the relations behind the child's ``_context``
+    field (``context_prefetch``) for every object in the list, so ``_context``
+    costs one query per relation for the page rather than one per row — this
+    is the APISelect autocomplete path.  Relations already prefetched by the
+    view are left alone.  On bulk writes, the related objects referenced by
+    the whole payload are resolved before any item is validated.
+    """
+
+    def to_internal_value(self, data):
+        # Resolve the related objects referenced anywhere in a bulk payload up
+        # front, one query per target model for the whole list; each item's own
+        # prefetch then finds them resolved.
+        if isinstance(data, list) and not getattr(self.child, "nested", False):
+            _prefetch_related_input(self.child, [item for item in data if isinstance(item, dict)])
+        return super().to_internal_value(data)
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, Manager) else data
+        prefetch = getattr(self.child, "context_prefetch", ())
+        if prefetch:
+            iterable = list(iterable)
+            prefetch_related_objects(iterable, *prefetch)
+        return super().to_representation(iterable)
+
+
 def get_serializer_class(model, skip_object_fields=False):
     # This function is intentionally not cached at the serializer level.
     # It is called per-request (via CustomObjectViewSet.get_serializer_class →
@@ -468,10 +635,7 @@ def get_serializer_class(model, skip_object_fields=False):
     }
     # PolymorphicM2MDescriptor is attached via setattr(), not via _meta, so it does
     # not appear in any _meta.*fields list.  Add descriptor names explicitly.
-    model_field_names.update(
-        name for name, attr in model.__dict__.items()
-        if isinstance(attr, field_types.PolymorphicM2MDescriptor)
-    )
+    model_field_names.update(field_types.get_polymorphic_m2m_field_names(model))
 
     # If a COT field is named 'owner', it shadows the OwnerMixin FK on the dynamic model
     # (Django silently lets child attrs override abstract parent fields). The serializer
@@ -522,6 +686,7 @@ def get_serializer_class(model, skip_object_fields=False):
             "model": model,
             "fields": all_fields,
             "brief_fields": brief_fields,
+            "list_serializer_class": CustomObjectListSerializer,
         },
     )
 
@@ -565,16 +730,31 @@ def get_serializer_class(model, skip_object_fields=False):
         if f.type == CustomObjectFieldTypeChoices.TYPE_COORDINATES
     ]
 
+    # (name, FieldType instance) per context field, resolved once per serializer
+    # class.  The FieldType instances are the ones generated with the model.
+    _context_fields = [
+        (model._field_objects[field_id]["name"], model._field_objects[field_id]["type"])
+        for field_id in getattr(model, "_context_field_ids", [])
+        if field_id in getattr(model, "_field_objects", {})
+    ]
+    # Relation-backed context fields; CustomObjectListSerializer prefetches these
+    # for a whole page so get__context() does not fetch one related object per row.
+    _context_prefetch = tuple(
+        model._field_objects[field_id]["name"]
+        for field_id in getattr(model, "_context_field_ids", [])
+        if field_id in getattr(model, "_field_objects", {})
+        and model._field_objects[field_id]["field"].type in (
+            CustomFieldTypeChoices.TYPE_OBJECT, CustomFieldTypeChoices.TYPE_MULTIOBJECT
+        )
+    )
+
     def get__context(self, obj):
         """Return context field values as a nested display object for APISelect secondary text."""
         context_parts = []
-        for context_field_id in obj._context_field_ids:
-            context_field = obj._field_objects.get(context_field_id)
-            if context_field:
-                ctx_field_type = field_types.FIELD_TYPE_CLASS[context_field["field"].type]()
-                context_value = ctx_field_type.get_display_value(obj, context_field["name"])
-                if context_value:
-                    context_parts.append(str(context_value))
+        for name, ctx_field_type in _context_fields:
+            context_value = ctx_field_type.get_display_value(obj, name)
+            if context_value:
+                context_parts.append(str(context_value))
         if context_parts:
             return {"display": ", ".join(context_parts)}
         return None
@@ -679,6 +859,14 @@ def get_serializer_class(model, skip_object_fields=False):
 
         return instance
 
+    def to_internal_value(self, data):
+        # Resolve all related-object input up front (one query per target model)
+        # so the relational fields below read from memory.  Like validate(),
+        # this function has no __class__ cell, hence the explicit base call.
+        if not self.nested and isinstance(data, dict):
+            _prefetch_related_input(self, [data])
+        return PrefetchedRelatedMixin.to_internal_value(self, data)
+
     def validate(self, data):
         # When this serializer is used as a nested child (e.g. resolving a PK to a
         # model instance inside a many=True field), DRF calls validate() with the
@@ -738,6 +926,7 @@ def get_serializer_class(model, skip_object_fields=False):
         "get_display": get_display,
         "create": create,
         "update": update,
+        "to_internal_value": to_internal_value,
         "validate": validate,
     }
 
@@ -747,6 +936,7 @@ def get_serializer_class(model, skip_object_fields=False):
     if has_context_fields:
         attrs["_context"] = serializers.SerializerMethodField()
         attrs["get__context"] = get__context
+        attrs["context_prefetch"] = _context_prefetch
 
     for field in model_fields:
         if field.name not in model_field_names:
@@ -779,7 +969,7 @@ def get_serializer_class(model, skip_object_fields=False):
     serializer_name = f"{model._meta.object_name}Serializer"
     serializer = type(
         serializer_name,
-        (NetBoxModelSerializer,),
+        (PrefetchedRelatedMixin, NetBoxModelSerializer),
         attrs,
     )
 
@@ -11,6 +11,9 @@ from . import views
 custom_object_list = views.CustomObjectViewSet.as_view(
     {"get": "list", "post": "create"}
 )
+custom_object_upsert = views.CustomObjectViewSet.as_view({"post": "upsert"})
+custom_object_reconcile = views.CustomObjectViewSet.as_view({"post": "reconcile"})
+custom_object_changes = views.CustomObjectViewSet.as_view({"get": "changes"})
 custom_object_detail = views.CustomObjectViewSet.as_view(
     {"get": "retrieve", "put": "update", "patch": "partial_update", "delete": "destroy"}
 )
@@ -90,9 +93,14 @@ router.register("custom-object-type-fields", views.CustomObjectTypeFieldViewSet)
 urlpatterns = [
     path("", include(router.urls)),
     path("linked-objects/", views.LinkedObjectsView.as_view(), name="linked-objects"),
+    path("linked-objects/batch/", views.LinkedObjectsBatchView.as_view(), name="linked-objects-batch"),
     path("schema/preview/", views.SchemaPreviewView.as_view(), name="schema-preview"),
     path("schema/apply/", views.SchemaApplyView.as_view(), name="schema-apply"),
     path("<str:custom_object_type>/", custom_object_list, name="customobject-list"),
+    path("<str:custom_object_type>/upsert/", custom_object_upsert, name="customobject-upsert"),
+    path("<str:custom_object_type>/reconcile/", custom_object_reconcile, name="customobject-reconcile"),
+    path("<str:custom_object_type>/changes/", custom_object_changes, name="customobject-changes"),
+    path("<str:custom_object_type>/explain/", views.QueryPlanView.as_view(), name="customobject-explain"),
     path(
         "<str:custom_object_type>/<int:pk>/",
         custom_object_detail,
@@ -1,4 +1,7 @@
+import base64
+import datetime
 import functools
+import hashlib
 import json
 import logging
 from pathlib import Path
@@ -7,11 +10,17 @@ import jsonschema
 
 from django.apps import apps as django_apps
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db import connections, router, transaction
+from django.db.models import F, IntegerField, Q, Value
 from django.http import Http404
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import get_language, gettext_lazy as _
 from drf_spectacular.utils import extend_schema_view, extend_schema
+from core.choices import ObjectChangeActionChoices
 from extras.choices import CustomFieldTypeChoices
 from rest_framework import status
+from rest_framework.permissions import IsAdminUser
 try:
     from netbox.api.viewsets import ETagMixin  # NetBox 4.6+
 except ImportError:
@@ -25,11 +34,21 @@ from rest_framework.viewsets import ModelViewSet
 from rest_framework.exceptions import PermissionDenied, ValidationError
 
 from netbox.api.authentication import IsAuthenticatedOrLoginNotRequired, TokenWritePermission
+from netbox.api.pagination import OptionalLimitOffsetPagination
+from netbox.authentication import ObjectPermissionBackend
+from netbox.config import get_config
+from netbox.plugins import get_plugin_config
+from utilities.permissions import get_permission_for_model
 
 
+from netbox_custom_objects import field_types
 from netbox_custom_objects.constants import APP_LABEL
 from netbox_custom_objects.filtersets import get_filterset_class
 from netbox_custom_objects.models import CustomObjectType, CustomObjectTypeField
+from netbox_custom_objects.pagination import ApproximateCountLimitOffsetPagination
+from netbox_custom_objects.query_plan import explain_list_query
+from netbox_custom_objects import upsert
+from netbox_custom_objects.write_version import get_write_version
 from netbox_custom_objects.schema.comparator import diff_document
 from netbox_custom_objects.schema.executor import (
     apply_document,
@@ -100,6 +119,203 @@ def _serialize_diff(diff) -> dict:
     }
 
 
+# ---------------------------------------------------------------------------
+# List ETag / response cache helpers
+# ---------------------------------------------------------------------------
+
+_LIST_CACHE_PREFIX = "netbox_custom_objects:list_response"
+
+
+def _permission_key(user, model):
+    """
+    Identify the set of rows ``user`` may view on ``model``.
+
+    Users sharing the same view constraints (including all superusers, and all
+    anonymous users under EXEMPT_VIEW_PERMISSIONS) share cache entries.
+    Constraints that reference ``$user`` are resolved per user, so they pin the
+    key to the user's pk.
+    """
+    if not user.is_authenticated:
+        return "anonymous"
+    if user.is_superuser:
+        return "superuser"
+    perm = get_permission_for_model(model, "view")
+    constraints = ObjectPermissionBackend().get_all_permissions(user).get(perm)
+    serialized = json.dumps(constraints, sort_keys=True, default=str)
+    if "$user" in serialized:
+        serialized = f"{serialized}:{user.pk}"
+    return serialized
+
+
+def _list_etag(request, model):
+    """
+    Build the weak list ETag for ``model`` from values that change whenever
+    the rendered list could: the type's write version and cache_timestamp
+    (schema changes), the active branch, the normalized query string, the
+    negotiated format, language and host (absolute URLs are embedded), and the
+    caller's permission set.  Computing it requires no query on the CO table.
+    """
+    cot = model.custom_object_type
+    branch_id = CustomObjectType._active_branch_id()
+    query = sorted((key, sorted(request.query_params.getlist(key))) for key in request.query_params)
+    renderer = getattr(request, "accepted_renderer", None)
+    parts = [
+        cot.pk,
+        branch_id,
+        cot.cache_timestamp.isoformat() if cot.cache_timestamp else None,
+        get_write_version(cot.pk, branch_id),
+        query,
+        getattr(renderer, "format", None),
+        get_language(),
+        request.build_absolute_uri("/"),
+        _permission_key(request.user, model),
+    ]
+    digest = hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _etag_matches(request, etag):
+    """If-None-Match uses weak comparison (RFC 9110 §13.1.2)."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+# The change feed pages through a (time, id) keyset, served by the index from
+# migration 0019.  ObjectChange rows become visible at commit, not in (time, id)
+# order, so the feed only returns changes older than the start of the oldest
+# transaction still in progress: every change a running transaction records is
+# stamped after it began.  The margin covers clock skew between the workers
+# that stamp ``time`` and the database, and the moment between stamping a
+# change and starting the transaction that saves it.
+CHANGE_FEED_SETTLE_SECONDS = 2
+
+# Start of the oldest transaction in progress in this database (or now, if
+# there is none).  pg_stat_activity shows xact_start for sessions of the same
+# role, which is what NetBox's workers connect as.
+_CHANGE_FEED_BOUND_SQL = (
+    "SELECT LEAST(clock_timestamp(), MIN(xact_start)) FROM pg_stat_activity "
+    "WHERE datname = current_database() AND xact_start IS NOT NULL"
+)
+
+
+def _change_feed_bound(using):
+    """Return the newest change time the feed can return without skipping a late commit."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(_CHANGE_FEED_BOUND_SQL)
+        bound = cursor.fetchone()[0]
+    return bound - datetime.timedelta(seconds=CHANGE_FEED_SETTLE_SECONDS)
+
+
+def _encode_change_cursor(change):
+    raw = f"{change.time.isoformat()}|{change.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_change_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        time, pk = raw.split("|")
+        return datetime.datetime.fromisoformat(time), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationError({"cursor": [_("Invalid cursor.")]})
+
+
+def _include_field_names(request, model):
+    """
+    Parse ``?include=<field>[,<field>...]`` into object/multi-object field
+    names of ``model``; raise a 400 for anything else.
+    """
+    names = [
+        name.strip() for value in request.query_params.getlist("include")
+        for name in value.split(",") if name.strip()
+    ]
+    if not names:
+        return []
+    allowed = {
+        field_object["name"] for field_object in getattr(model, "_field_objects", {}).values()
+        if field_object["field"].type in (
+            CustomFieldTypeChoices.TYPE_OBJECT, CustomFieldTypeChoices.TYPE_MULTIOBJECT
+        )
+    }
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise ValidationError({
+            "include": [_("Not an object or multi-object field: {names}").format(names=", ".join(unknown))]
+        })
+    return list(dict.fromkeys(names))
+
+
+def _included_objects(request, model, instances, names):
+    """
+    Serialize the objects referenced by ``names`` on ``instances`` for the
+    ``included`` section of a compound document.
+
+    References are gathered from the loaded rows (object fields) or with one
+    through-table query per multi-object field.  The targets are then loaded
+    with one query per target model, limited to what the user may view, and
+    de-duplicated across rows and fields.
+    """
+    from utilities.api import get_prefetches_for_serializer, get_serializer_for_model  # noqa: PLC0415
+
+    refs = {}  # target model -> set of pks
+    pks = [instance.pk for instance in instances]
+    field_objects = {fo["name"]: fo["field"] for fo in model._field_objects.values()}
+    for name in names:
+        field = field_objects[name]
+        if field.type == CustomFieldTypeChoices.TYPE_OBJECT and not field.is_polymorphic:
+            model_field = model._meta.get_field(name)
+            refs.setdefault(model_field.related_model, set()).update(
+                pk for pk in (getattr(i, model_field.attname) for i in instances) if pk is not None
+            )
+        elif field.type == CustomFieldTypeChoices.TYPE_OBJECT:
+            gfk = model._meta.get_field(name)
+            ct_attname = model._meta.get_field(gfk.ct_field).attname
+            for instance in instances:
+                ct_id, object_id = getattr(instance, ct_attname), getattr(instance, gfk.fk_field)
+                if ct_id is not None and object_id is not None:
+                    target = ContentType.objects.get_for_id(ct_id).model_class()
+                    if target is not None:
+                        refs.setdefault(target, set()).add(object_id)
+        elif not field.is_polymorphic:
+            model_field = model._meta.get_field(name)
+            refs.setdefault(model_field.related_model, set()).update(
+                model_field.remote_field.through.objects.filter(source_id__in=pks)
+                .values_list("target_id", flat=True)
+            )
+        elif instances:
+            through = getattr(instances[0], name)._get_through_model()
+            for ct_id, object_id in through.objects.filter(source_id__in=pks).values_list(
+                "content_type_id", "object_id"
+            ):
+                target = ContentType.objects.get_for_id(ct_id).model_class()
+                if target is not None:
+                    refs.setdefault(target, set()).add(object_id)
+
+    included = []
+    context = {"request": request}
+    for target, target_pks in refs.items():
+        if not target_pks:
+            continue
+        serializer_class = get_serializer_for_model(target)
+        queryset = target.objects.filter(pk__in=target_pks)
+        if hasattr(queryset, "restrict"):
+            queryset = queryset.restrict(request.user, "view")
+        prefetches = get_prefetches_for_serializer(serializer_class)
+        if prefetches:
+            queryset = queryset.prefetch_related(*prefetches)
+        object_type = f"{target._meta.app_label}.{target._meta.model_name}"
+        included.extend(
+            {"object_type": object_type, **data}
+            for data in serializer_class(queryset.order_by("pk"), many=True, context=context).data
+        )
+    return included
+
+
 class RootView(APIRootView):
     def get_view_name(self):
         return "CustomObjects"
@@ -110,20 +326,25 @@ class CustomObjectTypeViewSet(ModelViewSet):
     serializer_class = serializers.CustomObjectTypeSerializer
 
 
-# TODO: Need to remove this for now, check if work-around in the future.
 # There is a catch-22 spectacular get the queryset and serializer class without
 # params at startup.  The suggested workaround is to return the model empty
-# queryset, but we can't get the model without params at startup.
+# queryset, but we can't get the model without params at startup.  The generic
+# endpoints are therefore excluded here, and the concrete per-type endpoints are
+# added to the schema by the post-processing hook in api/openapi.py.
 @extend_schema_view(
     list=extend_schema(exclude=True),
     retrieve=extend_schema(exclude=True),
     create=extend_schema(exclude=True),
     update=extend_schema(exclude=True),
     partial_update=extend_schema(exclude=True),
-    destroy=extend_schema(exclude=True)
+    destroy=extend_schema(exclude=True),
+    upsert=extend_schema(exclude=True),
+    reconcile=extend_schema(exclude=True),
+    changes=extend_schema(exclude=True)
 )
 class CustomObjectViewSet(ETagMixin, ModelViewSet):
     serializer_class = serializers.CustomObjectSerializer
+    pagination_class = ApproximateCountLimitOffsetPagination
     model = None
 
     def get_view_name(self):
@@ -142,14 +363,70 @@ class CustomObjectViewSet(ETagMixin, ModelViewSet):
         except CustomObjectType.DoesNotExist:
             raise Http404
         self.model = custom_object_type.get_model_with_serializer()
-        return self.model.objects.all()
+        queryset = self.model.objects.all()
+        if self.action == "list":
+            # Batch polymorphic multi-object relationships for the whole page
+            # instead of 1 + (#types) queries per row and field.
+            poly_m2m_names = field_types.get_polymorphic_m2m_field_names(self.model)
+            if poly_m2m_names:
+                queryset = queryset.prefetch_related(*poly_m2m_names)
+        return queryset
 
     @property
     def filterset_class(self):
         return get_filterset_class(self.model)
 
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        # Replicate DRF's ListModelMixin.list() so the list ETag and response
+        # cache can be consulted before the CO table is queried at all.
+        queryset = self.get_queryset()
+        include = _include_field_names(request, self.model)
+        # Included objects belong to other types and models whose writes do not
+        # move this type's write version, so compound documents are neither
+        # ETagged nor cached.
+        etag = None if include else _list_etag(request, self.model)
+        if etag and _etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        timeout = etag and get_plugin_config("netbox_custom_objects", "list_response_cache_timeout")
+        cache_key = f"{_LIST_CACHE_PREFIX}:{etag[3:-1]}" if etag else None
+        if timeout:
+            data = cache.get(cache_key)
+            if data is not None:
+                return Response(data, headers={"ETag": etag})
+
+        queryset = self.filter_queryset(queryset)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            response = self.get_paginated_response(serializer.data)
+        else:
+            page = list(queryset)
+            serializer = self.get_serializer(page, many=True)
+            response = Response(serializer.data)
+
+        if include and isinstance(response.data, dict):
+            response.data["included"] = _included_objects(request, self.model, page, include)
+
+        if timeout and response.status_code == status.HTTP_200_OK:
+            cache.set(cache_key, response.data, timeout)
+        if etag:
+            response["ETag"] = etag
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        include = _include_field_names(request, self.model)
+        if include and response.status_code == status.HTTP_200_OK:
+            response.data["included"] = _included_objects(request, self.model, [self._included_source], include)
+        return response
+
+    def get_object(self):
+        obj = super().get_object()
+        # Kept for retrieve(), which delegates to super() (and ETagMixin) and
+        # so has no other handle on the instance that was serialized.
+        self._included_source = obj
+        return obj
 
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
@@ -188,12 +465,288 @@ class CustomObjectViewSet(ETagMixin, ModelViewSet):
             instance.snapshot()
         super().perform_destroy(instance)
 
+    upsert_batch_size = 500
+
+    def upsert(self, request, *args, **kwargs):
+        """
+        Create or update custom objects matched on a natural key.
+
+        ``POST <slug>/upsert/?key=<field>[,<field>...]`` with an object or a
+        list of objects.  Existing objects are updated with the supplied fields
+        (PATCH semantics), missing ones are created, and objects whose values
+        already match are not written.  Rows are validated up front; any error
+        rejects the whole request.
+        """
+        self.get_queryset()
+        model = self.model
+        using = router.db_for_write(model)
+        try:
+            key_fields = upsert.resolve_natural_key(model, request.query_params.get("key", ""), using)
+        except ValueError as exc:
+            raise ValidationError({"key": [str(exc)]})
+
+        items = request.data if isinstance(request.data, list) else [request.data]
+        to_many = upsert.get_to_many_field_names(model) | {"tags"}
+
+        # Pass 1: match and validate every row, so nothing is written when any row is invalid.
+        errors = [{} for _item in items]
+        batches = []
+        seen = set()
+        for start in range(0, len(items), self.upsert_batch_size):
+            chunk = items[start:start + self.upsert_batch_size]
+            keys = []
+            for index, item in enumerate(chunk, start):
+                if not isinstance(item, dict):
+                    errors[index] = {"non_field_errors": [_("Expected an object.")]}
+                    keys.append(None)
+                    continue
+                try:
+                    key = tuple(upsert.natural_key_value(f, item.get(f.name)) for f in key_fields)
+                except (ValueError, DjangoValidationError) as exc:
+                    errors[index] = {"key": [str(getattr(exc, "message", exc))]}
+                    keys.append(None)
+                    continue
+                if key in seen:
+                    errors[index] = {"key": [_("Duplicate natural key in request.")]}
+                    key = None
+                seen.add(key)
+                keys.append(key)
+
+            prefetch = {name for item in chunk if isinstance(item, dict) for name in item if name in to_many}
+            existing = upsert.fetch_existing(
+                model, key_fields, [key for key in keys if key is not None], prefetch, using
+            )
+            # Matched rows are fetched unrestricted, so that a row outside the
+            # user's constraints is rejected rather than treated as missing and
+            # overwritten by the INSERT ... ON CONFLICT.
+            changeable = upsert.permitted_pks(
+                model, request.user, "change", [instance.pk for instance in existing.values()], using
+            )
+            rows = []
+            for index, (item, key) in enumerate(zip(chunk, keys), start):
+                if key is None:
+                    continue
+                instance = existing.get(key)
+                if instance is not None and instance.pk not in changeable:
+                    errors[index] = {"non_field_errors": [_("You do not have permission to change this object.")]}
+                    continue
+                serializer = self.get_serializer(instance, data=item, partial=instance is not None)
+                if serializer.is_valid():
+                    rows.append((instance, serializer.validated_data))
+                else:
+                    errors[index] = serializer.errors
+            batches.append(rows)
+
+        if any(errors):
+            raise ValidationError(errors)
+
+        for action, needed in (
+            ("add", any(instance is None for rows in batches for instance, _values in rows)),
+            ("change", any(instance is not None for rows in batches for instance, _values in rows)),
+        ):
+            if needed and not request.user.has_perm(get_permission_for_model(model, action)):
+                raise PermissionDenied()
+
+        # Pass 2: one INSERT ... ON CONFLICT DO UPDATE per batch.
+        results = []
+        with transaction.atomic(using=using):
+            for rows in batches:
+                results.extend(upsert.write_batch(model, key_fields, rows, using))
+            # As for any other write, the written objects must satisfy the user's
+            # constraints; raising here rolls the whole request back.
+            for action, result_status in (("add", upsert.UPSERT_CREATED), ("change", upsert.UPSERT_UPDATED)):
+                pks = {instance.pk for instance, result in results if result == result_status}
+                if pks - upsert.permitted_pks(model, request.user, action, pks, using):
+                    raise PermissionDenied()
+
+        counts = {s: 0 for s in (upsert.UPSERT_CREATED, upsert.UPSERT_UPDATED, upsert.UPSERT_UNCHANGED)}
+        for _instance, result in results:
+            counts[result] += 1
+        return Response({
+            **counts,
+            "results": [{"id": instance.pk, "status": result} for instance, result in results],
+        })
+
+    def changes(self, request, *args, **kwargs):
+        """
+        Return creates, updates and deletes of this type's objects after an
+        opaque cursor, oldest first, from the change log.
+
+        ``GET <slug>/changes/?cursor=<cursor>&limit=<n>``.  Omit ``cursor`` to
+        start from the oldest retained change.  Each response carries
+        ``next_cursor`` to pass on the next call, and ``has_more``.
+        """
+        from core.models import ObjectChange, ObjectType  # noqa: PLC0415
+
+        queryset = self.get_queryset()
+        try:
+            limit = int(request.query_params.get("limit", 100))
+        except ValueError:
+            raise ValidationError({"limit": [_("Must be an integer.")]})
+        limit = min(max(limit, 1), get_config().MAX_PAGE_SIZE or 1000)
+
+        using = router.db_for_read(ObjectChange)
+        changes = ObjectChange.objects.using(using).filter(
+            changed_object_type=ObjectType.objects.get_for_model(self.model),
+            time__lte=_change_feed_bound(using),
+        )
+        if cursor := request.query_params.get("cursor"):
+            time, pk = _decode_change_cursor(cursor)
+            changes = changes.filter(Q(time__gt=time) | Q(time=time, pk__gt=pk))
+
+        # Users limited to a subset of objects see changes to the objects they
+        # can currently view; deletions cannot be checked and are omitted.
+        visible = queryset.restrict(request.user, "view")
+        if visible.query.where:
+            changes = changes.filter(changed_object_id__in=visible.values("pk")).exclude(
+                action=ObjectChangeActionChoices.ACTION_DELETE
+            )
+
+        page = list(changes.order_by("time", "pk")[:limit + 1])
+        has_more = len(page) > limit
+        page = page[:limit]
+        return Response({
+            "results": [
+                {
+                    "id": change.changed_object_id,
+                    "action": change.action,
+                    "time": change.time,
+                    "request_id": change.request_id,
+                    "data": change.postchange_data,
+                }
+                for change in page
+            ],
+            "next_cursor": _encode_change_cursor(page[-1]) if page else cursor,
+            "has_more": has_more,
+        })
+
+    def reconcile(self, request, *args, **kwargs):
+        """
+        Reconcile the type's rows with a complete desired row set in a
+        background job.
+
+        ``POST <slug>/reconcile/?key=<field>[,<field>...][&delete=true]`` with a
+        list of objects.  Returns ``202 Accepted`` with the job; the job's data
+        carries the created/updated/deleted/unchanged counts once it completes.
+        The job fails, writing nothing, if any row it would create, update or
+        delete is outside the user's object permission constraints.
+        """
+        from core.api.serializers import JobSerializer  # noqa: PLC0415
+        from netbox_custom_objects.jobs import ReconcileCustomObjectTypeJob  # noqa: PLC0415
+
+        self.get_queryset()
+        model = self.model
+        try:
+            key_fields = upsert.resolve_natural_key(
+                model, request.query_params.get("key", ""), router.db_for_write(model)
+            )
+        except ValueError as exc:
+            raise ValidationError({"key": [str(exc)]})
+        if not isinstance(request.data, list):
+            raise ValidationError({"non_field_errors": [_("Expected a list of objects.")]})
+        delete = request.query_params.get("delete", "").lower() in ("1", "true", "yes")
+
+        actions = ["add", "change"] + (["delete"] if delete else [])
+        for action in actions:
+            if not request.user.has_perm(get_permission_for_model(model, action)):
+                raise PermissionDenied()
+
+        job = ReconcileCustomObjectTypeJob.enqueue(
+            cot_id=model.custom_object_type.pk,
+            key=[field.name for field in key_fields],
+            rows=request.data,
+            delete=delete,
+            user=request.user,
+        )
+        return Response(
+            JobSerializer(job, context={"request": request}).data, status=status.HTTP_202_ACCEPTED
+        )
+
 
 class CustomObjectTypeFieldViewSet(ModelViewSet):
     queryset = CustomObjectTypeField.objects.prefetch_related('related_object_types')
     serializer_class = serializers.CustomObjectTypeFieldSerializer
 
 
+def _resolve_content_type(object_type_str):
+    """Resolve an ``app_label.model`` string to its ContentType, raising a 400 if invalid."""
+    try:
+        app_label, model_name = object_type_str.split('.', 1)
+    except ValueError:
+        raise ValidationError(
+            _("'object_type' must be in the format 'app_label.model'.")
+        )
+
+    try:
+        return ContentType.objects.get(app_label=app_label, model=model_name)
+    except ContentType.DoesNotExist:
+        raise ValidationError(
+            _("Object type '%(object_type)s' does not exist.") % {'object_type': object_type_str}
+        )
+
+
+def _linking_fields(content_type):
+    """
+    Return every OBJECT/MULTIOBJECT field that can reference ``content_type``
+    (non-polymorphic via ``related_object_type``, polymorphic via
+    ``related_object_types``) in a stable order, with one query.
+    """
+    return list(
+        CustomObjectTypeField.objects.filter(
+            Q(related_object_type=content_type) | Q(related_object_types=content_type),
+            type__in=[CustomFieldTypeChoices.TYPE_OBJECT, CustomFieldTypeChoices.TYPE_MULTIOBJECT],
+        )
+        .select_related('custom_object_type')
+        .distinct()
+        .order_by('custom_object_type__name', 'custom_object_type__pk', 'name')
+    )
+
+
+def _link_queryset(field, model, content_type, object_ids, user):
+    """
+    Return a queryset of the links ``field`` holds to any of ``object_ids``
+    from the custom objects ``user`` may view.
+
+    Every family of field (FK, polymorphic GFK columns, M2M through table,
+    polymorphic through table) is reduced to the same two annotated columns —
+    ``link_source`` (the custom object's pk) and ``link_target`` (the referenced
+    object's pk) — so the results can be combined with ``union()``.  Returns
+    ``None`` if the field is missing from the generated model or the user may
+    not view any object of its type.
+    """
+    viewable = model.objects.restrict(user, "view")
+    if viewable.query.is_empty():
+        return None
+
+    if field.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
+        if field.is_polymorphic:
+            through = django_apps.get_model(APP_LABEL, field.through_model_name)
+            queryset = through.objects.filter(content_type_id=content_type.pk, object_id__in=object_ids)
+            target = F('object_id')
+        else:
+            try:
+                through = model._meta.get_field(field.name).remote_field.through
+            except FieldDoesNotExist:
+                return None
+            queryset = through.objects.filter(target_id__in=object_ids)
+            target = F('target_id')
+        if viewable.query.where:
+            # Constrained view permission: only links from permitted objects.
+            queryset = queryset.filter(source_id__in=viewable.values('pk'))
+        return queryset.annotate(link_source=F('source_id'), link_target=target)
+
+    if field.is_polymorphic:
+        queryset = viewable.filter(**{
+            f"{field.name}_content_type_id": content_type.pk,
+            f"{field.name}_object_id__in": object_ids,
+        })
+        target = F(f"{field.name}_object_id")
+    else:
+        queryset = viewable.filter(**{f"{field.name}_id__in": object_ids})
+        target = F(f"{field.name}_id")
+    return queryset.annotate(link_source=F('pk'), link_target=target)
+
+
 class LinkedObjectsView(APIView):
     """
     Returns all custom objects that link to a specific NetBox object via an `object` or
@@ -203,11 +756,14 @@ class LinkedObjectsView(APIView):
 
     * **`object_type`** *(required)* — target model in `app_label.model` form, e.g. `dcim.device`
     * **`object_id`** *(required)* — primary key of the target object
+    * **`limit`** / **`offset`** — standard NetBox pagination (`limit=0` returns up to `MAX_PAGE_SIZE`)
 
     ## Example Response
 
         {
             "count": 1,
+            "next": null,
+            "previous": null,
             "results": [
                 {
                     "custom_object_type": {"id": 1, "name": "My Type", "slug": "my-type"},
@@ -220,11 +776,14 @@ class LinkedObjectsView(APIView):
 
     # This view queries across multiple unrelated custom object type models so there is
     # no single queryset to derive object-type permissions from.  Authentication is still
-    # enforced; object-level permission checks are bypassed here and delegated to the
-    # individual serializers / querysets used when building the results.
+    # enforced, and each type's links are read through its queryset restricted to the
+    # objects the user may view (types the user cannot view are skipped).
     _ignore_model_permissions = True
 
-    def get(self, request, *args, **kwargs):
+    pagination_class = OptionalLimitOffsetPagination
+
+    def _resolve_target(self, request):
+        """Validate the query parameters and return ``(content_type, object_id)``."""
         object_type_str = request.query_params.get('object_type')
         object_id = request.query_params.get('object_id')
 
@@ -233,74 +792,207 @@ class LinkedObjectsView(APIView):
                 _("Both 'object_type' and 'object_id' query parameters are required.")
             )
 
-        try:
-            app_label, model_name = object_type_str.split('.', 1)
-        except ValueError:
-            raise ValidationError(
-                _("'object_type' must be in the format 'app_label.model'.")
-            )
-
-        try:
-            content_type = ContentType.objects.get(app_label=app_label, model=model_name)
-        except ContentType.DoesNotExist:
-            raise ValidationError(
-                _("Object type '%(object_type)s' does not exist.") % {'object_type': object_type_str}
-            )
-
+        content_type = _resolve_content_type(object_type_str)
         model_class = content_type.model_class()
         try:
-            target_obj = model_class.objects.get(pk=object_id)
+            target_pk = model_class.objects.only('pk').get(pk=object_id).pk
         except (model_class.DoesNotExist, ValueError):
             raise Http404
+        return content_type, target_pk
 
-        non_poly_fields = CustomObjectTypeField.objects.filter(
-            related_object_type=content_type,
-            type__in=[CustomFieldTypeChoices.TYPE_OBJECT, CustomFieldTypeChoices.TYPE_MULTIOBJECT],
-        ).select_related('custom_object_type')
-
-        poly_fields = CustomObjectTypeField.objects.filter(
-            related_object_types=content_type,
-            type__in=[CustomFieldTypeChoices.TYPE_OBJECT, CustomFieldTypeChoices.TYPE_MULTIOBJECT],
-        ).select_related('custom_object_type')
+    def get(self, request, *args, **kwargs):
+        content_type, target_pk = self._resolve_target(request)
+        fields = _linking_fields(content_type)
+
+        # One id query per field, combined with UNION ALL so that counting and
+        # LIMIT/OFFSET happen in the database.  ``link_field`` is the field's
+        # position in ``fields``, which also gives the result order.
+        link_querysets = []
+        for index, field in enumerate(fields):
+            model = field.custom_object_type.get_model()
+            queryset = _link_queryset(field, model, content_type, [target_pk], request.user)
+            if queryset is not None:
+                link_querysets.append(
+                    queryset.annotate(link_field=Value(index, output_field=IntegerField()))
+                    .values('link_field', 'link_source')
+                    .order_by()
+                )
+
+        paginator = self.pagination_class()
+        if not link_querysets:
+            rows = paginator.paginate_queryset([], request, view=self)
+        else:
+            links = link_querysets[0].union(*link_querysets[1:], all=True).order_by('link_field', 'link_source')
+            rows = paginator.paginate_queryset(links, request, view=self)
+
+        # Load the page's custom objects with one query per type, then serialize
+        # each type's objects with a single serializer instance.
+        pks_by_cot = {}
+        for row in rows:
+            cot = fields[row['link_field']].custom_object_type
+            pks_by_cot.setdefault(cot.pk, (cot, set()))[1].add(row['link_source'])
+
+        serialized = {}
+        cot_data = {}
+        context = {'request': request}
+        for cot_pk, (cot, pks) in pks_by_cot.items():
+            model = cot.get_model()
+            queryset = model.objects.filter(pk__in=pks)
+            poly_m2m_names = field_types.get_polymorphic_m2m_field_names(model)
+            if poly_m2m_names:
+                queryset = queryset.prefetch_related(*poly_m2m_names)
+            serializer = serializers.get_serializer_class(model)(queryset, many=True, context=context)
+            for data in serializer.data:
+                serialized[(cot_pk, data['id'])] = data
+            cot_data[cot_pk] = serializers.CustomObjectTypeSerializer(cot, nested=True, context=context).data
 
         results = []
-        for field in list(non_poly_fields) + list(poly_fields):
-            custom_object_model = field.custom_object_type.get_model()
-
-            if field.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
-                if field.is_polymorphic:
-                    through = django_apps.get_model(APP_LABEL, field.through_model_name)
-                    linked_ids = through.objects.filter(
-                        content_type_id=content_type.id,
-                        object_id=target_obj.pk,
-                    ).values_list('source_id', flat=True)
-                else:
-                    m2m_field = custom_object_model._meta.get_field(field.name)
-                    through_model = m2m_field.remote_field.through
-                    linked_ids = through_model.objects.filter(
-                        target_id=target_obj.pk
-                    ).values_list('source_id', flat=True)
-                linked_objects = custom_object_model.objects.filter(pk__in=linked_ids)
-            else:
-                if field.is_polymorphic:
-                    linked_objects = custom_object_model.objects.filter(**{
-                        f"{field.name}_content_type_id": content_type.id,
-                        f"{field.name}_object_id": target_obj.pk,
-                    })
-                else:
-                    linked_objects = custom_object_model.objects.filter(**{field.name: target_obj})
-
-            serializer_class = serializers.get_serializer_class(custom_object_model)
-            for linked_obj in linked_objects:
-                results.append({
-                    'custom_object_type': serializers.CustomObjectTypeSerializer(
-                        field.custom_object_type, nested=True, context={'request': request}
-                    ).data,
+        for row in rows:
+            field = fields[row['link_field']]
+            data = serialized.get((field.custom_object_type_id, row['link_source']))
+            if data is None:
+                continue  # deleted between the id query and the object fetch
+            results.append({
+                'custom_object_type': cot_data[field.custom_object_type_id],
+                'field_name': field.name,
+                'object': data,
+            })
+
+        return paginator.get_paginated_response(results)
+
+
+class LinkedObjectsBatchView(APIView):
+    """
+    Returns the custom objects linking to each of many objects of one type.
+
+    Answers "which custom objects reference each of these devices?" in a single
+    request: fields are discovered once, and each referencing field is queried
+    once with ``IN`` over all requested ids.  Only identifiers are returned;
+    fetch full representations from the custom object endpoints as needed.
+
+    ## Request body
+
+        {
+            "object_type": "dcim.device",
+            "object_ids": [7, 8, 9]
+        }
+
+    ## Response (200)
+
+    Every requested id appears in ``results``; ids with no links (or that do
+    not exist) map to an empty list.
+
+        {
+            "object_type": "dcim.device",
+            "results": {
+                "7": [
+                    {
+                        "custom_object_type": {"id": 1, "slug": "my-type"},
+                        "field_name": "device",
+                        "object_id": 42
+                    }
+                ],
+                "8": [],
+                "9": []
+            }
+        }
+    """
+
+    # Read-only despite using POST (id lists are too long for a query string), so
+    # write-enabled tokens are not required.  As with LinkedObjectsView, there is no
+    # single model to derive object permissions from; each type's links are read
+    # through its view-restricted queryset, so only objects the user may view are
+    # reported.
+    permission_classes = [IsAuthenticatedOrLoginNotRequired]
+
+    # Upper bound on object_ids per request; each field's query carries the full list.
+    max_object_ids = 10000
+
+    def post(self, request, *args, **kwargs):
+        object_type_str = request.data.get('object_type')
+        object_ids = request.data.get('object_ids')
+
+        if not object_type_str or not isinstance(object_ids, list):
+            raise ValidationError(
+                _("'object_type' and a list of 'object_ids' are required.")
+            )
+        if len(object_ids) > self.max_object_ids:
+            raise ValidationError(
+                _("At most %(max)d object_ids may be requested at once.") % {'max': self.max_object_ids}
+            )
+        try:
+            object_ids = sorted({int(pk) for pk in object_ids})
+        except (TypeError, ValueError):
+            raise ValidationError(_("'object_ids' must be a list of integers."))
+
+        content_type = _resolve_content_type(object_type_str)
+        results = {str(pk): [] for pk in object_ids}
+        if not object_ids:
+            return Response({'object_type': object_type_str, 'results': results})
+
+        for field in _linking_fields(content_type):
+            cot = field.custom_object_type
+            model = cot.get_model()
+            queryset = _link_queryset(field, model, content_type, object_ids, request.user)
+            if queryset is None:
+                continue
+            cot_ref = {'id': cot.pk, 'slug': cot.slug}
+            for row in queryset.values('link_target', 'link_source').order_by('link_target', 'link_source'):
+                results[str(row['link_target'])].append({
+                    'custom_object_type': cot_ref,
                     'field_name': field.name,
-                    'object': serializer_class(linked_obj, context={'request': request}).data,
+                    'object_id': row['link_source'],
                 })
 
-        return Response({'count': len(results), 'results': results})
+        return Response({'object_type': object_type_str, 'results': results})
+
+
+class QueryPlanView(APIView):
+    """
+    Explain the list query of a custom object type.  Staff only.
+
+    Takes the same filter query parameters (and ``limit``/``offset``) as the
+    type's list endpoint, builds the queryset that endpoint would run and
+    returns its SQL and PostgreSQL plan, without returning any objects.
+
+    ## Query Parameters
+
+    * Any filter accepted by ``<slug>/``, e.g. ``status=active&name__ic=rtr``
+    * **`ordering`** — as on ``<slug>/``
+    * **`analyze`** — ``true`` to execute the query (``EXPLAIN ANALYZE``) for
+      actual timings and row counts; the transaction is rolled back
+
+    ## Response (200)
+
+        {
+            "sql": "SELECT ... FROM \"custom_objects_7\" WHERE ...",
+            "params": ["active"],
+            "plan": {"Node Type": "Limit", "Plans": [ ... ]},
+            "indexes_used": ["custom_objects_7_status_idx"],
+            "sequential_scan": false,
+            "suggestions": [
+                {"field": "name", "attribute": "trigram_indexed", "reason": "..."}
+            ],
+            "prefetch_related": []
+        }
+
+    With ``analyze``, ``planning_time`` and ``execution_time`` (ms) are added.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            custom_object_type = CustomObjectType.objects.get(slug=kwargs["custom_object_type"])
+        except CustomObjectType.DoesNotExist:
+            raise Http404
+        params = request.query_params.copy()
+        analyze = params.pop("analyze", ["false"])[-1].lower() in ("true", "1")
+        try:
+            explanation = explain_list_query(custom_object_type, params, analyze=analyze)
+        except DjangoValidationError as exc:
+            raise ValidationError(exc.message_dict if hasattr(exc, "error_dict") else exc.messages)
+        return Response(explanation)
 
 
 class SchemaPreviewView(APIView):
@@ -58,6 +58,7 @@ RESERVED_FIELD_NAMES = [
     "pk",
     "refresh_from_db",
     "save",
+    "search_vector",
     "serialize_object",
     "snapshot",
     "subscriptions",
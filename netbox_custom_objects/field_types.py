@@ -1,3 +1,4 @@
+import copy
 import datetime
 import decimal
 import hashlib
@@ -13,12 +14,14 @@ from django.apps import apps
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.core.validators import (MaxValueValidator, MinValueValidator,
                                      RegexValidator)
 from django.db import models, router
 from django.db.utils import OperationalError, ProgrammingError
 from django.db.models.fields.related import ForeignKey, ManyToManyDescriptor
+from django.db.models.functions import Cast, Upper
 from django.db.models.manager import Manager
 from django.db.models.signals import m2m_changed
 from django.urls import reverse
@@ -127,6 +130,26 @@ def _safe_index_name(full_name: str) -> str:
     return _safe_pg_identifier(full_name)
 
 
+# Columns of the reverse-lookup index on a (non-polymorphic) multiobject
+# field's through table; unique_together already indexes (source, target).
+M2M_REVERSE_INDEX_COLUMNS = ["target_id", "source_id"]
+
+
+def get_m2m_reverse_index_name(through_table_name):
+    """Name of the (target_id, source_id) index on a multiobject through table."""
+    return _safe_index_name(f"{through_table_name}_tgt_src")
+
+
+def get_polymorphic_m2m_index_name(custom_object_type_id, field_name, legacy=False):
+    """
+    Name of the (content_type_id, object_id, source_id) lookup index on a
+    polymorphic multiobject field's through table.  ``legacy=True`` returns
+    the name of the (content_type_id, object_id) index it supersedes.
+    """
+    suffix = "pgfk" if legacy else "pgsrc"
+    return _safe_index_name(f"co_{custom_object_type_id}_{field_name}_{suffix}")
+
+
 def safe_table_name(full_name: str) -> str:
     """
     Return a DB-safe table name that fits within PostgreSQL's 63-char identifier limit.
@@ -228,6 +251,17 @@ def _make_lazy_cot_fk(cot, field, on_delete, **field_kwargs):
     )
 
 
+def get_field_index_name(field, suffix="idx"):
+    """
+    Name of the index declared by ``field.indexed`` (or, with ``suffix="trgm"``,
+    by ``field.trigram_indexed``).  Keyed on the field's ``schema_id`` so it
+    survives renames; the ``cot`` prefix keeps it out of the ``custom_objects_*``
+    namespace used by tables.
+    """
+    key = f"s{field.schema_id}" if field.schema_id is not None else field.name
+    return f"cot{field.custom_object_type_id}_{key}_{suffix}"
+
+
 class FieldType:
 
     # The Python annotation Strawberry should use when exposing this field type
@@ -239,9 +273,55 @@ class FieldType:
     # annotation sets it on its own subclass.
     graphql_annotation = None
 
+    # The index access method used when a field of this type is marked
+    # ``indexed``: "btree" for scalar columns, "gin" for array and JSON columns
+    # (containment lookups).  ``None`` means the type cannot be indexed — it has
+    # no single column (coordinates, multiobject), is indexed already (object
+    # fields get the foreign key's index) or is too wide for a btree (long text).
+    index_type = None
+
+    # Whether a field of this type can carry a trigram index
+    # (``trigram_indexed``), which serves case-insensitive substring filters.
+    trigram_indexable = False
+
     def get_graphql_annotation(self):
         return self.graphql_annotation
 
+    def get_index(self, field):
+        """
+        Return the Django index declared by ``field.indexed``, or None.
+
+        The index is named after the field's ``schema_id`` rather than its name,
+        so a rename (which PostgreSQL follows) leaves it in place.
+        """
+        if not field.indexed or self.index_type is None or field.is_polymorphic:
+            return None
+        name = get_field_index_name(field)
+        if self.index_type == "gin":
+            return GinIndex(fields=[field.name], name=name)
+        return models.Index(fields=[field.name], name=name)
+
+    def get_trigram_index(self, field):
+        """
+        Return the ``pg_trgm`` GIN index declared by ``field.trigram_indexed``,
+        or None.
+
+        The index is on ``UPPER(column::text)``, the expression Django compiles
+        ``icontains``, ``istartswith``, ``iendswith`` and ``iexact`` to, so the
+        planner can use it for those lookups (and the ``__ic``, ``__isw``,
+        ``__iew`` and ``__ie`` filters built on them).
+        """
+        if not field.trigram_indexed or not self.trigram_indexable or field.is_polymorphic:
+            return None
+        return GinIndex(
+            OpClass(Upper(Cast(field.name, output_field=models.TextField())), name="gin_trgm_ops"),
+            name=get_field_index_name(field, "trgm"),
+        )
+
+    def get_indexes(self, field):
+        """All indexes declared on ``field``'s column."""
+        return [index for index in (self.get_index(field), self.get_trigram_index(field)) if index is not None]
+
     def get_display_value(self, instance, field_name):
         """
         This value is used as the object title in the Custom Object detail view.
@@ -318,6 +398,8 @@ class FieldType:
 
 class TextFieldType(FieldType):
     graphql_annotation = str
+    index_type = "btree"
+    trigram_indexable = True
 
     def get_model_field(self, field, **kwargs):
         field_kwargs = self._safe_kwargs(**kwargs)
@@ -351,6 +433,7 @@ class TextFieldType(FieldType):
 
 class LongTextFieldType(FieldType):
     graphql_annotation = str
+    trigram_indexable = True
 
     def get_filterform_field(self, field, **kwargs):
         return forms.CharField(
@@ -390,6 +473,7 @@ class LongTextFieldType(FieldType):
 
 class IntegerFieldType(FieldType):
     graphql_annotation = int
+    index_type = "btree"
 
     def get_model_field(self, field, **kwargs):
         # TODO: handle all args for IntegerField
@@ -414,6 +498,7 @@ class IntegerFieldType(FieldType):
 
 class DecimalFieldType(FieldType):
     graphql_annotation = decimal.Decimal
+    index_type = "btree"
 
     def get_model_field(self, field, **kwargs):
         field_kwargs = self._safe_kwargs(**kwargs)
@@ -447,6 +532,7 @@ class DecimalFieldType(FieldType):
 
 class BooleanFieldType(FieldType):
     graphql_annotation = bool
+    index_type = "btree"
 
     def get_model_field(self, field, **kwargs):
         field_kwargs = self._safe_kwargs(**kwargs)
@@ -483,6 +569,7 @@ class BooleanFieldType(FieldType):
 
 class DateFieldType(FieldType):
     graphql_annotation = datetime.date
+    index_type = "btree"
 
     def get_model_field(self, field, **kwargs):
         field_kwargs = self._safe_kwargs(**kwargs)
@@ -504,6 +591,7 @@ class DateFieldType(FieldType):
 
 class DateTimeFieldType(FieldType):
     graphql_annotation = datetime.datetime
+    index_type = "btree"
 
     def get_model_field(self, field, **kwargs):
         field_kwargs = self._safe_kwargs(**kwargs)
@@ -525,6 +613,8 @@ class DateTimeFieldType(FieldType):
 
 class URLFieldType(FieldType):
     graphql_annotation = str
+    index_type = "btree"
+    trigram_indexable = True
 
     def get_model_field(self, field, **kwargs):
         field_kwargs = self._safe_kwargs(**kwargs)
@@ -545,6 +635,7 @@ class URLFieldType(FieldType):
 
 class JSONFieldType(FieldType):
     graphql_annotation = JSON
+    index_type = "gin"
 
     def get_model_field(self, field, **kwargs):
         field_kwargs = self._safe_kwargs(**kwargs)
@@ -558,14 +649,27 @@ class JSONFieldType(FieldType):
         )
 
     def get_filterform_field(self, field, **kwargs):
-        return forms.CharField(
-            label=field,
-            required=False,
-        )
+        # Key-exists and containment match the __has_key and __contains filters.
+        return {
+            field.name: forms.CharField(
+                label=field,
+                required=False,
+            ),
+            f"{field.name}__has_key": forms.CharField(
+                label=_("{field} (has key)").format(field=field),
+                required=False,
+            ),
+            f"{field.name}__contains": forms.CharField(
+                label=_("{field} (contains)").format(field=field),
+                required=False,
+                help_text=_('A JSON document the value must contain, e.g. {"vendor": "acme"}'),
+            ),
+        }
 
 
 class SelectFieldType(FieldType):
     graphql_annotation = str
+    index_type = "btree"
 
     def get_display_value(self, instance, field_name):
         value = getattr(instance, field_name)
@@ -646,17 +750,26 @@ class SelectFieldType(FieldType):
 
 class MultiSelectFieldType(FieldType):
     graphql_annotation = List[str]
+    index_type = "gin"
 
     def get_filterform_field(self, field, **kwargs):
+        # <name> matches any of the selected choices, <name>__all every one of them.
         choices = field.choice_set.choices
-        return DynamicMultipleChoiceField(
-            choices=choices,
-            label=field,
-            required=False,
-            widget=APISelectMultiple(
-                api_url=f'/api/extras/custom-field-choice-sets/{field.choice_set.pk}/choices/'
+        api_url = f'/api/extras/custom-field-choice-sets/{field.choice_set.pk}/choices/'
+        return {
+            field.name: DynamicMultipleChoiceField(
+                choices=choices,
+                label=field,
+                required=False,
+                widget=APISelectMultiple(api_url=api_url),
             ),
-        )
+            f"{field.name}__all": DynamicMultipleChoiceField(
+                choices=choices,
+                label=_("{field} (all of)").format(field=field),
+                required=False,
+                widget=APISelectMultiple(api_url=api_url),
+            ),
+        }
 
     def get_display_value(self, instance, field_name):
         values = getattr(instance, field_name) or []
@@ -932,7 +1045,8 @@ class ObjectFieldType(FieldType):
             from netbox_custom_objects.api.serializers import get_serializer_class
             serializer = get_serializer_class(related_model_class, skip_object_fields=True)
         else:
-            serializer = get_serializer_for_model(related_model_class)
+            from netbox_custom_objects.api.serializers import get_prefetching_serializer_class
+            serializer = get_prefetching_serializer_class(get_serializer_for_model(related_model_class))
         return serializer(required=field.required, allow_null=not field.required, nested=True)
 
     def after_model_generation(self, instance, model, field_name):
@@ -1319,6 +1433,14 @@ class MultiObjectFieldType(FieldType):
                 "apps": apps,
                 "managed": True,
                 "unique_together": ("source", "target"),
+                # Lookups by target (reverse accessors, linked objects, the
+                # target filter) scan (target_id, source_id) without the heap.
+                "indexes": [
+                    models.Index(
+                        fields=["target", "source"],
+                        name=get_m2m_reverse_index_name(field.through_table_name),
+                    )
+                ],
             },
         )
 
@@ -1350,6 +1472,8 @@ class MultiObjectFieldType(FieldType):
                 on_delete=models.CASCADE,
                 related_name="+",
                 db_column="target_id",
+                # Served by the (target, source) index above.
+                db_index=False,
                 # The real DB-level FK is added separately in create_m2m_table
                 # as DEFERRABLE INITIALLY DEFERRED so iterative branch merges
                 # (time-ordered) can insert through rows before the target CO
@@ -1504,7 +1628,8 @@ class MultiObjectFieldType(FieldType):
             from netbox_custom_objects.api.serializers import get_serializer_class
             serializer = get_serializer_class(related_model_class, skip_object_fields=True)
         else:
-            serializer = get_serializer_for_model(related_model_class)
+            from netbox_custom_objects.api.serializers import get_prefetching_serializer_class
+            serializer = get_prefetching_serializer_class(get_serializer_for_model(related_model_class))
         # Construct the ListSerializer explicitly so that allow_null is set only on
         # the outer list (permitting null to clear the whole field) and NOT on the
         # child (preventing individual null items like [null, 3] from slipping
@@ -1726,6 +1851,16 @@ class MultiObjectFieldType(FieldType):
                             connection.ops.quote_name(fk_conname),
                         )
                     )
+                else:
+                    # The table predates this field save (sync/merge); make sure
+                    # it has the reverse-lookup index, as migration 0026 does.
+                    # Matched by columns: a renamed field keeps its old index name.
+                    constraints = connection.introspection.get_constraints(cursor, table_name)
+                    if not any(
+                        c["index"] and c["columns"] == M2M_REVERSE_INDEX_COLUMNS for c in constraints.values()
+                    ):
+                        for index in through._meta.indexes:
+                            schema_editor.add_index(through, index)
 
     def get_polymorphic_through_model(self, field_instance, source_model_string):
         """
@@ -1742,12 +1877,14 @@ class MultiObjectFieldType(FieldType):
                 "apps": apps,
                 "managed": True,
                 "unique_together": (("source", "content_type_id", "object_id"),),
+                # Reverse lookups ("which objects link to these devices?") filter
+                # on (content_type_id, object_id) and only need source_id back,
+                # so the index covers it and the lookup never visits the heap.
                 "indexes": [
                     models.Index(
-                        fields=["content_type_id", "object_id"],
-                        name=_safe_index_name(
-                            f"co_{field_instance.custom_object_type_id}"
-                            f"_{field_instance.name}_pgfk"
+                        fields=["content_type_id", "object_id", "source"],
+                        name=get_polymorphic_m2m_index_name(
+                            field_instance.custom_object_type_id, field_instance.name
                         ),
                     )
                 ],
@@ -1833,6 +1970,18 @@ class MultiObjectFieldType(FieldType):
             existing_tables = conn.introspection.table_names(cursor)
             if table_name not in existing_tables:
                 schema_editor.create_model(through)
+                return
+            # The table predates this field save (sync/merge); bring its lookup
+            # index up to date as migration 0025 does for existing tables.
+            constraints = conn.introspection.get_constraints(cursor, table_name)
+        for index in through._meta.indexes:
+            if index.name not in constraints:
+                schema_editor.add_index(through, index)
+        legacy_name = get_polymorphic_m2m_index_name(
+            field_instance.custom_object_type_id, field_instance.name, legacy=True
+        )
+        if legacy_name in constraints:
+            schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(legacy_name)}")
 
     def drop_polymorphic_m2m_table(self, field_instance, model, schema_editor):
         """Drops the DB table for a polymorphic MultiObject through.
@@ -1873,19 +2022,25 @@ class PolymorphicResultList:
     model classes and cannot be combined into a single SQL result set.
     It supports the subset of the list/queryset interface that templates and
     common callers need: iteration, ``len()``, ``bool()``, and index access.
+
+    The ``_result_cache`` / ``_prefetch_done`` attribute names mirror QuerySet
+    so that Django's ``prefetch_one_level()`` can populate an instance obtained
+    from ``PolymorphicManyToManyManager.get_queryset()`` exactly as it would a
+    related-manager queryset.
     """
 
-    __slots__ = ("_factory", "_cache")
+    __slots__ = ("_factory", "_result_cache", "_prefetch_done")
 
     def __init__(self, factory):
         # factory is a zero-argument callable that returns an iterator of objects.
         self._factory = factory
-        self._cache = None
+        self._result_cache = None
+        self._prefetch_done = False
 
     def _evaluate(self):
-        if self._cache is None:
-            self._cache = list(self._factory())
-        return self._cache
+        if self._result_cache is None:
+            self._result_cache = list(self._factory())
+        return self._result_cache
 
     def __iter__(self):
         return iter(self._evaluate())
@@ -1913,6 +2068,14 @@ class PolymorphicManyToManyManager:
     instead of ``None`` so netbox-branching's change-capture can log the
     removal.  Receivers that branch on ``pk_set is None`` will misread it as
     removes.
+
+    Prefetching: the manager implements ``get_prefetch_querysets()``, so
+    ``model.objects.prefetch_related("<field>")`` batches the relationship for
+    a whole page of sources (one through-table query plus one query per
+    target model).  ``all()``, ``count()`` and ``exists()`` then read the
+    per-instance ``_prefetched_objects_cache`` entry; writes through
+    ``add()``/``remove()``/``clear()``/``set()`` drop it, as Django's related
+    managers do.
     """
 
     def __init__(self, instance, field_name, through_model_name):
@@ -1923,21 +2086,18 @@ class PolymorphicManyToManyManager:
     def _get_through_model(self):
         return apps.get_model(APP_LABEL, self.through_model_name)
 
-    def _get_objects(self):
-        through = self._get_through_model()
-        rows = list(
-            through.objects.filter(source_id=self.instance.pk)
-            .values_list("content_type_id", "object_id")
-            .order_by("id")
-        )
+    @staticmethod
+    def _fetch_targets(rows):
+        """Resolve ``(content_type_id, object_id)`` pairs to model instances.
 
-        # Group object IDs by content type so we can batch-fetch per model class
-        # (one SELECT per type) rather than issuing one SELECT per row.
+        Object IDs are grouped by content type so each target model is fetched
+        with a single ``pk__in`` SELECT rather than one SELECT per row.  Returns
+        a ``(ct_id, obj_pk) → object`` map; orphaned rows are simply absent.
+        """
         by_ct: dict[int, list] = {}
         for ct_id, obj_id in rows:
             by_ct.setdefault(ct_id, []).append(obj_id)
 
-        # Build a lookup map: (ct_id, obj_id) → object, preserving row order below.
         obj_map: dict[tuple, object] = {}
         for ct_id, obj_ids in by_ct.items():
             try:
@@ -1951,6 +2111,16 @@ class PolymorphicManyToManyManager:
                 continue
             for obj in model_class.objects.filter(pk__in=obj_ids):
                 obj_map[(ct_id, obj.pk)] = obj
+        return obj_map
+
+    def _get_objects(self):
+        through = self._get_through_model()
+        rows = list(
+            through.objects.filter(source_id=self.instance.pk)
+            .values_list("content_type_id", "object_id")
+            .order_by("id")
+        )
+        obj_map = self._fetch_targets(rows)
 
         # Collect objects and yield in consistent string-sorted order.
         objects = []
@@ -1960,13 +2130,87 @@ class PolymorphicManyToManyManager:
                 objects.append(obj)
         yield from sorted(objects, key=str)
 
-    def all(self):
+    def _get_prefetched(self):
+        """Return the prefetched result for this field, or ``None``."""
+        try:
+            return self.instance._prefetched_objects_cache[self.field_name]
+        except (AttributeError, KeyError):
+            return None
+
+    def _remove_prefetched_objects(self):
+        try:
+            self.instance._prefetched_objects_cache.pop(self.field_name, None)
+        except AttributeError:
+            pass  # nothing to clear
+
+    def get_queryset(self):
+        # Called by Django's prefetch_one_level() to obtain the container it
+        # fills with the prefetched objects (via _result_cache/_prefetch_done).
+        prefetched = self._get_prefetched()
+        if prefetched is not None:
+            return prefetched
         return PolymorphicResultList(self._get_objects)
 
+    def get_prefetch_querysets(self, instances, querysets=None):
+        """Batch-load this relationship for ``instances`` (prefetch_related hook).
+
+        Issues one through-table query covering every source on the page and
+        one ``pk__in`` query per target model.  Each returned object carries a
+        ``_prefetch_source_id`` attribute identifying the source it belongs to;
+        a target linked from several sources is shallow-copied per source so
+        that the attribute is not shared.  Returns the 6-tuple expected by
+        ``django.db.models.query.prefetch_one_level``.
+        """
+        if querysets:
+            # A single queryset cannot span the multiple target models.
+            raise ValueError(
+                f"Custom querysets are not supported when prefetching polymorphic field '{self.field_name}'."
+            )
+        through = self._get_through_model()
+        rows = list(
+            through.objects.filter(source_id__in={inst.pk for inst in instances})
+            .values_list("source_id", "content_type_id", "object_id")
+            .order_by("id")
+        )
+        obj_map = self._fetch_targets((ct_id, obj_id) for _, ct_id, obj_id in rows)
+
+        objects = []
+        seen = set()
+        for source_id, ct_id, obj_id in rows:
+            obj = obj_map.get((ct_id, obj_id))
+            if obj is None:
+                continue
+            if (ct_id, obj_id) in seen:
+                obj = copy.copy(obj)
+            seen.add((ct_id, obj_id))
+            obj._prefetch_source_id = source_id
+            objects.append(obj)
+        # Stable sort keeps each source's subsequence in the same order as
+        # _get_objects() would produce for that source alone.
+        objects.sort(key=str)
+
+        return (
+            objects,
+            lambda obj: obj._prefetch_source_id,
+            lambda inst: inst.pk,
+            False,
+            self.field_name,
+            False,
+        )
+
+    def all(self):
+        return self.get_queryset()
+
     def count(self):
+        prefetched = self._get_prefetched()
+        if prefetched is not None:
+            return len(prefetched)
         return self._get_through_model().objects.filter(source_id=self.instance.pk).count()
 
     def exists(self):
+        prefetched = self._get_prefetched()
+        if prefetched is not None:
+            return bool(prefetched)
         return self._get_through_model().objects.filter(source_id=self.instance.pk).exists()
 
     def _fire_m2m_changed(self, action, pk_set):
@@ -1991,6 +2235,7 @@ class PolymorphicManyToManyManager:
         )
 
     def add(self, *objs):
+        self._remove_prefetched_objects()
         through = self._get_through_model()
         candidate_keys = []
         for obj in objs:
@@ -2012,6 +2257,7 @@ class PolymorphicManyToManyManager:
             self._fire_m2m_changed('post_add', added)
 
     def remove(self, *objs):
+        self._remove_prefetched_objects()
         through = self._get_through_model()
         candidate_keys = []
         for obj in objs:
@@ -2033,6 +2279,7 @@ class PolymorphicManyToManyManager:
             self._fire_m2m_changed('post_remove', removed)
 
     def clear(self):
+        self._remove_prefetched_objects()
         through = self._get_through_model()
         existing = set(
             through.objects.filter(source_id=self.instance.pk)
@@ -2047,6 +2294,7 @@ class PolymorphicManyToManyManager:
         self._fire_m2m_changed('post_clear', existing)
 
     def set(self, objs, clear=False):
+        self._remove_prefetched_objects()
         if clear:
             self.clear()
             self.add(*objs)
@@ -2126,6 +2374,19 @@ class PolymorphicM2MDescriptor:
         return False
 
 
+def get_polymorphic_m2m_field_names(model):
+    """Return the names of the polymorphic multi-object fields on ``model``.
+
+    PolymorphicM2MDescriptor is attached via setattr(), not via _meta, so the
+    descriptors have to be discovered from the class dict.  List views pass
+    the result to ``prefetch_related()``.
+    """
+    return [
+        name for name, attr in model.__dict__.items()
+        if isinstance(attr, PolymorphicM2MDescriptor)
+    ]
+
+
 class PolymorphicObjectReverseManager:
     """Returned when a polymorphic GFK reverse relation is accessed on a target instance."""
 
@@ -6,7 +6,7 @@ from typing import Any, Dict, Optional, Type
 
 from django import forms as django_forms
 from django.apps import apps as django_apps
-from django.db.models import QuerySet, Q
+from django.db.models import Exists, OuterRef, QuerySet, Q
 from django.utils.dateparse import parse_date, parse_datetime
 from django.utils.timezone import make_aware, is_aware
 
@@ -17,10 +17,12 @@ from users.models import Owner, OwnerGroup
 from .choices import CustomObjectFieldTypeChoices
 from .constants import APP_LABEL
 from .models import CustomObjectType
+from .search_vector import search_vector_active, search_vector_filter
 
 __all__ = (
     "ArrayContainsFilter",
     "CustomObjectTypeFilterSet",
+    "JSONContainsFilter",
     "NonPolymorphicMultiObjectFilter",
     "NonPolymorphicObjectFilter",
     "NonPolymorphicObjectIdFilter",
@@ -98,9 +100,11 @@ class PolymorphicMultiObjectFilter(django_filters.Filter):
     """
     Filter for one allowed type of a polymorphic GFK multiobject field.
 
-    Accepts one or more raw integer PKs (list).  The through table is queried
-    for rows matching (content_type_id, object_id__in=pks) and the
-    corresponding source objects are returned (OR semantics, no duplicates).
+    Accepts one or more raw integer PKs (list).  Custom objects with a through
+    row matching (content_type_id, object_id__in=pks) are returned (OR
+    semantics).  The test is a correlated ``EXISTS`` semijoin, which needs no
+    ``DISTINCT`` and is answered from the through table's
+    (content_type_id, object_id, source_id) index.
 
     Using _IntegerListField (not ModelMultipleChoiceField) ensures the filter
     is applied regardless of whether the submitted PKs match existing objects.
@@ -114,37 +118,60 @@ class PolymorphicMultiObjectFilter(django_filters.Filter):
         kwargs.setdefault("required", False)
         super().__init__(**kwargs)
 
+    def _get_through_model(self, model):
+        # The generated model carries its context's through models; the app
+        # registry is only consulted for a model generated without them.
+        for through in getattr(model, "_through_models", None) or ():
+            if through.__name__ == self.through_model_name:
+                return through
+        return django_apps.get_model(APP_LABEL, self.through_model_name)
+
     def filter(self, qs, value):
         if not value:
             return qs
         try:
-            through = django_apps.get_model(APP_LABEL, self.through_model_name)
+            through = self._get_through_model(qs.model)
         except LookupError:
             return qs.none()
-        source_ids = through.objects.filter(
+        return qs.filter(Exists(through.objects.filter(
+            source_id=OuterRef("pk"),
             content_type_id=self.content_type_id,
             object_id__in=value,
-        ).values_list("source_id", flat=True)
-        return qs.filter(pk__in=source_ids).distinct()
+        )))
 
 
 class ArrayContainsFilter(django_filters.MultipleChoiceFilter):
     """
-    Filter for ArrayField (TYPE_MULTISELECT): checks if the array contains any
-    of the selected values using OR semantics with PostgreSQL array containment.
+    Filter for ArrayField (TYPE_MULTISELECT): matches arrays holding any of the
+    selected values (``&&``, overlap) or, with ``conjoined=True``, all of them
+    (``@>``, containment).
 
     Standard MultipleChoiceFilter uses ``exact`` lookup, which compares the
-    entire array rather than checking membership. This class uses
-    ``__contains=[v]`` instead, matching Django's array containment operator.
+    entire array rather than checking membership.  Both operators are a single
+    predicate a GIN index on the column (``indexed``) can serve.
     """
 
     def filter(self, qs, value):
         if not value:
             return qs
-        q = Q()
-        for v in value:
-            q |= Q(**{f"{self.field_name}__contains": [v]})
-        return qs.filter(q).distinct()
+        lookup = "contains" if self.conjoined else "overlap"
+        condition = Q(**{f"{self.field_name}__{lookup}": list(value)})
+        # NetBox derives a negated (__n) variant of this filter with exclude=True.
+        return qs.exclude(condition) if self.exclude else qs.filter(condition)
+
+
+class JSONContainsFilter(django_filters.Filter):
+    """
+    Filter for JSONField (TYPE_JSON): matches values containing the given JSON
+    document (``@>``), e.g. ``{"vendor": "acme"}``.  A GIN index on the column
+    (``indexed``) serves it.
+    """
+
+    field_class = django_forms.JSONField
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("lookup_expr", "contains")
+        super().__init__(**kwargs)
 
 
 class NonPolymorphicObjectFilter(django_filters.Filter):
@@ -412,6 +439,28 @@ def build_filter_for_field(field) -> dict:
         )
     }
 
+    # Containment operators (GIN-indexable, see CustomObjectTypeField.indexed):
+    # <name> matches any of the given choices, <name>__all every one of them;
+    # <name>__has_key matches JSON objects with a top-level key and
+    # <name>__contains JSON values containing the given document.
+    if field.type == CustomFieldTypeChoices.TYPE_MULTISELECT:
+        filters[f"{field.name}__all"] = ArrayContainsFilter(
+            field_name=field.name,
+            label=field.label or field.name,
+            conjoined=True,
+            **extra_kwargs,
+        )
+    elif field.type == CustomFieldTypeChoices.TYPE_JSON:
+        filters[f"{field.name}__has_key"] = django_filters.CharFilter(
+            field_name=field.name,
+            label=field.label or field.name,
+            lookup_expr="has_key",
+        )
+        filters[f"{field.name}__contains"] = JSONContainsFilter(
+            field_name=field.name,
+            label=field.label or field.name,
+        )
+
     # For FK Object fields, also register a <field_name>_id filter that accepts
     # a raw integer PK.  NetBox's Related Objects panel links use the _id suffix
     # form (e.g. ?tenant_id=5), so without this the links return unfiltered
@@ -425,7 +474,102 @@ def build_filter_for_field(field) -> dict:
     return filters
 
 
+def _parse_search_text(value):
+    return value
+
+
+def _parse_search_array_element(value):
+    # ArrayField does not support icontains; array containment checks whether
+    # the searched value is an element of the array.
+    return [value]
+
+
+def _parse_search_integer(value):
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_search_decimal(value):
+    try:
+        return Decimal(value)
+    except (ValueError, TypeError, InvalidOperation):
+        return None
+
+
+def _parse_search_date(value):
+    try:
+        return parse_date(value)
+    except ValueError:
+        # Well-formed but not a valid date, e.g. 2024-02-30.
+        return None
+
+
+def _parse_search_datetime(value):
+    try:
+        parsed = parse_datetime(value)
+    except ValueError:
+        return None
+    if parsed is not None and not is_aware(parsed):
+        parsed = make_aware(parsed)
+    return parsed
+
+
+# Field type → (lookup, parser) used by the quick search (``q``) filter.  A
+# parser returns the value to look up, or None if the search term cannot
+# match a field of that type (e.g. "abc" against an integer field).
+SEARCH_LOOKUPS = {
+    CustomFieldTypeChoices.TYPE_TEXT: ("icontains", _parse_search_text),
+    CustomFieldTypeChoices.TYPE_LONGTEXT: ("icontains", _parse_search_text),
+    CustomFieldTypeChoices.TYPE_JSON: ("icontains", _parse_search_text),
+    CustomFieldTypeChoices.TYPE_URL: ("icontains", _parse_search_text),
+    CustomFieldTypeChoices.TYPE_SELECT: ("icontains", _parse_search_text),
+    CustomFieldTypeChoices.TYPE_MULTISELECT: ("contains", _parse_search_array_element),
+    CustomFieldTypeChoices.TYPE_INTEGER: ("exact", _parse_search_integer),
+    CustomFieldTypeChoices.TYPE_DECIMAL: ("exact", _parse_search_decimal),
+    CustomFieldTypeChoices.TYPE_DATE: ("exact", _parse_search_date),
+    CustomFieldTypeChoices.TYPE_DATETIME: ("exact", _parse_search_datetime),
+}
+
+
+def build_search_plan(fields, weighted_only=False) -> tuple:
+    """
+    Return the quick search plan for a custom object type's fields: a tuple of
+    ``(field name, lookup, parser)`` for every field ``q`` searches.
+
+    With ``weighted_only``, fields whose search weight is 0 are left out, so a
+    wide type can limit ``q`` to the handful of fields worth scanning.
+    """
+    plan = []
+    for field in fields:
+        if weighted_only and not field.search_weight:
+            continue
+        if field.type in SEARCH_LOOKUPS:
+            lookup, parser = SEARCH_LOOKUPS[field.type]
+            plan.append((field.name, lookup, parser))
+    return tuple(plan)
+
+
 def get_filterset_class(model):
+    """
+    Return the filterset class for the given custom object model.
+
+    Building the class queries the type's fields and constructs every filter,
+    so it is cached on the model class itself and rebuilt only when the type's
+    ``cache_timestamp`` moves.  A regenerated model (schema change, other
+    branch) is a different class and so never sees another model's cache.
+    """
+    cache_timestamp = model.custom_object_type.cache_timestamp
+    cached = model.__dict__.get("_filterset_class_cache")
+    if cached is not None and cached[0] == cache_timestamp:
+        return cached[1]
+    filterset_class = _build_filterset_class(model)
+    model._filterset_class_cache = (cache_timestamp, filterset_class)
+    return filterset_class
+
+
+def _build_filterset_class(model):
     """
     Create and return a filterset class for the given custom object model.
     """
@@ -441,42 +585,26 @@ def get_filterset_class(model):
         },
     )
 
+    custom_object_type = model.custom_object_type
+    fields = list(custom_object_type.fields.all())
+    search_plan = build_search_plan(
+        fields, weighted_only=custom_object_type.restrict_quick_search
+    )
+    use_search_vector = search_vector_active(custom_object_type, fields)
+
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
+        if use_search_vector:
+            return search_vector_filter(queryset, value)
+        # Each parser runs at most once per search, however many fields use it.
+        parsed = {}
         q = Q()
-        for field in model.custom_object_type.fields.all():
-            if field.type in [
-                CustomFieldTypeChoices.TYPE_TEXT,
-                CustomFieldTypeChoices.TYPE_LONGTEXT,
-                CustomFieldTypeChoices.TYPE_JSON,
-                CustomFieldTypeChoices.TYPE_URL,
-                CustomFieldTypeChoices.TYPE_SELECT,
-            ]:
-                q |= Q(**{f"{field.name}__icontains": value})
-            elif field.type == CustomFieldTypeChoices.TYPE_MULTISELECT:
-                # ArrayField does not support icontains; use array containment
-                # to check whether the searched value is an element in the array.
-                q |= Q(**{f"{field.name}__contains": [value]})
-            elif field.type in [
-                CustomFieldTypeChoices.TYPE_INTEGER,
-                CustomFieldTypeChoices.TYPE_DECIMAL,
-            ]:
-                try:
-                    numeric = int(value) if field.type == CustomFieldTypeChoices.TYPE_INTEGER else Decimal(value)
-                    q |= Q(**{f"{field.name}__exact": numeric})
-                except (ValueError, TypeError, InvalidOperation):
-                    pass
-            elif field.type == CustomFieldTypeChoices.TYPE_DATE:
-                parsed = parse_date(value)
-                if parsed is not None:
-                    q |= Q(**{f"{field.name}__exact": parsed})
-            elif field.type == CustomFieldTypeChoices.TYPE_DATETIME:
-                parsed = parse_datetime(value)
-                if parsed is not None:
-                    if not is_aware(parsed):
-                        parsed = make_aware(parsed)
-                    q |= Q(**{f"{field.name}__exact": parsed})
+        for field_name, lookup, parser in search_plan:
+            if parser not in parsed:
+                parsed[parser] = parser(value)
+            if parsed[parser] is not None:
+                q |= Q(**{f"{field_name}__{lookup}": parsed[parser]})
         if not q:
             return queryset.none()
         return queryset.filter(q)
@@ -509,7 +637,7 @@ def get_filterset_class(model):
     # filter uses icontains, which BaseFilterSet.get_additional_lookups() does not
     # augment.
     loose_text_field_names = []
-    for field in model.custom_object_type.fields.all():
+    for field in fields:
         attrs.update(build_filter_for_field(field))
         if field.type in FILTER_LOGIC_AWARE_TYPES and field.filter_logic == CustomFieldFilterLogicChoices.FILTER_LOOSE:
             loose_text_field_names.append(field.name)
@@ -526,15 +654,22 @@ def get_filterset_class(model):
         from get_filters() on every instantiation, which would otherwise discard
         this. super(cls, cls): no __class__ cell for bare super() since this is
         attached via `attrs`, not a real `class` block.
+
+        The result only depends on the class, so it is resolved once and a
+        shallow copy handed to each instantiation (django-filter deep-copies
+        base_filters into per-instance filters itself).
         """
-        filters = super(cls, cls).get_filters()
-        for field_name in loose_text_field_names:
-            if field_name not in filters:
-                continue
-            reference_filter = copy.deepcopy(filters[field_name])
-            reference_filter.lookup_expr = 'exact'
-            filters.update(cls.get_additional_lookups(field_name, reference_filter))
-        return filters
+        resolved = cls.__dict__.get("_resolved_filters")
+        if resolved is None:
+            resolved = super(cls, cls).get_filters()
+            for field_name in loose_text_field_names:
+                if field_name not in resolved:
+                    continue
+                reference_filter = copy.deepcopy(resolved[field_name])
+                reference_filter.lookup_expr = 'exact'
+                resolved.update(cls.get_additional_lookups(field_name, reference_filter))
+            cls._resolved_filters = resolved
+        return dict(resolved)
 
     attrs['get_filters'] = classmethod(get_filters)
 
@@ -68,6 +68,8 @@ class CustomObjectTypeForm(NetBoxModelForm):
             name=_("Display"),
         ),
         FieldSet("slug", "version", "description", "config_context_enabled", "tags"),
+        FieldSet("restrict_quick_search", "full_text_search", name=_("Search")),
+        FieldSet("indexes", name=_("Indexes")),
     )
     comments = CommentField()
 
@@ -75,7 +77,8 @@ class CustomObjectTypeForm(NetBoxModelForm):
         model = CustomObjectType
         fields = (
             "name", "verbose_name", "verbose_name_plural", "slug", "version", "description",
-            "group_name", "display_expression", "config_context_enabled", "comments", "tags",
+            "group_name", "display_expression", "config_context_enabled", "restrict_quick_search",
+            "full_text_search", "indexes", "comments", "tags",
         )
 
     def __init__(self, *args, **kwargs):
@@ -128,6 +131,8 @@ class CustomObjectTypeImportForm(NetBoxModelImportForm):
             "display_expression",
             "group_name",
             "description",
+            "restrict_quick_search",
+            "full_text_search",
             "comments",
             "tags",
         )
@@ -224,6 +229,8 @@ class CustomObjectTypeFieldForm(CustomFieldForm):
             "type",
             "required",
             "unique",
+            "indexed",
+            "trigram_indexed",
             "default",
             name=_("Field"),
         ),
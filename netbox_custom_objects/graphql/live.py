@@ -18,7 +18,9 @@ every process, without a restart:
   it only when the signature changes.  Because each process checks the signature
   independently, a type created by a request handled in one process becomes
   visible to every process on its next request — no restart, no cross-process
-  messaging.
+  messaging.  A rebuild reuses the built GraphQL type of every custom object
+  type whose own signature is unchanged (see ``schema.build_query_classes``), so
+  editing one type rebuilds that type and those embedding it, not all of them.
 
 GraphQL resolves against whatever branch netbox-branching activated for the
 request — the ``X-NetBox-Branch`` header, the ``?_branch=`` query param, or the
@@ -40,15 +42,13 @@ from django.apps import apps as django_apps
 
 logger = logging.getLogger("netbox_custom_objects.graphql")
 
-# Single-flight rebuild lock.  Two roles:
-#   1. Correctness (required): build_query_classes() clears and repopulates the
-#      *process-global* type cache in graphql.types (clear_type_cache()).  Two
-#      rebuilds running at once — e.g. for different branches — would race on that
-#      cache, one wiping the other's freshly built entries mid-build.  This single
-#      lock (global, not per-branch) serialises ALL rebuilds so that can't happen.
-#   2. Performance: concurrent requests that find a stale schema serve it instead
-#      of blocking on the (potentially expensive) rebuild a peer is already doing.
-_rebuild_lock = threading.Lock()
+# Single-flight rebuild locks, one per branch (None = main): concurrent requests
+# that find a stale schema serve it instead of blocking on the rebuild a peer is
+# already doing.  Per branch, so a rebuild of one branch never holds up another:
+# the built types they share a cache for are keyed by branch (see
+# types._type_cache), and the per-rebuild build state is thread-local.
+_rebuild_locks = {}
+_rebuild_locks_guard = threading.Lock()
 # Per-branch cache of (signature, schema), keyed by branch identifier (None = main).
 # GraphQL reflects whichever branch netbox-branching activated for the request, so
 # each branch gets its own schema reflecting that branch's custom object types.  Each
@@ -60,6 +60,15 @@ _schema_cache = {}
 _signature_keys_seen = set()
 
 
+def _rebuild_lock(branch_key):
+    """Return the single-flight rebuild lock of ``branch_key``."""
+    with _rebuild_locks_guard:
+        lock = _rebuild_locks.get(branch_key)
+        if lock is None:
+            lock = _rebuild_locks[branch_key] = threading.Lock()
+        return lock
+
+
 def _active_branch_key():
     """
     Identifier for the active branch (``None`` for main), used to key the per-branch
@@ -172,6 +181,12 @@ def _evict_branch_schema(sender, instance, **kwargs):
     """
     branch_key = instance.pk
     _schema_cache.pop(branch_key, None)  # atomic dict op; no lock needed
+    with _rebuild_locks_guard:
+        _rebuild_locks.pop(branch_key, None)
+
+    from .types import prune_type_cache
+
+    prune_type_cache(branch_key, ())
 
     from django.core.cache import cache
 
@@ -245,9 +260,10 @@ def _get_static_query_parts():
     return _static_query_parts
 
 
-def build_full_schema():
+def build_full_schema(branch_key=None):
     """
-    Assemble a complete NetBox GraphQL schema with the current custom object types.
+    Assemble a complete NetBox GraphQL schema with the current custom object types
+    of the branch ``branch_key`` (``None`` = main).
 
     A ``strawberry.Schema`` is immutable once compiled, so adding/removing a root
     query field requires building a new schema — but only our custom-object slice
@@ -262,10 +278,12 @@ def build_full_schema():
     from .schema import build_query_classes
 
     static_bases, config = _get_static_query_parts()
-    bases = static_bases + tuple(build_query_classes())
+    bases = static_bases + tuple(build_query_classes(branch_key))
 
-    # Every rebuild creates fresh classes with names ("Query", "Table<id>ModelType",
-    # …) that were used by previous rebuilds' schemas.  This relies on Strawberry
+    # Every rebuild creates fresh classes with names ("Query", and "Table<id>ModelType"
+    # for each changed type, …) that were used by previous rebuilds' schemas, while
+    # unchanged types are the very classes an earlier schema was compiled from.
+    # This relies on Strawberry
     # building a *per-schema* type map at strawberry.Schema(...) time — same-named
     # types in different Schema objects don't collide; only duplicates *within* one
     # schema do (which build_query_classes avoids by uniquifying field/type names).
@@ -340,7 +358,8 @@ def get_live_schema():
     # would fall back to the custom-object-less static schema and spuriously reject
     # custom_objects_* queries that do resolve.
     blocking = schema is None
-    if not _rebuild_lock.acquire(blocking=blocking):
+    lock = _rebuild_lock(branch_key)
+    if not lock.acquire(blocking=blocking):
         # Another thread is already rebuilding and we have a valid (one signature
         # behind) schema to serve in the meantime.
         return schema
@@ -353,14 +372,14 @@ def get_live_schema():
         if schema is not None and sig == signature:
             return schema
         try:
-            new_schema = build_full_schema()
+            new_schema = build_full_schema(branch_key)
         except Exception:  # noqa: BLE001 - never break the endpoint
             logger.exception("Failed to rebuild live GraphQL schema")
             return schema
         _schema_cache[branch_key] = (signature, new_schema)
         return new_schema
     finally:
-        _rebuild_lock.release()
+        lock.release()
 
 
 def reset_cache():
@@ -0,0 +1,265 @@
+"""
+Request-scoped batch loading for custom object relationship fields.
+
+A GraphQL list of custom objects resolves each object's relationship fields
+one object at a time.  Loading the related objects (and checking the user may
+view them) per object costs a few queries per object and field: thousands for
+a page of a few hundred objects.
+
+Instead, every object fetched for a query is registered with the request's
+:class:`RelationshipLoader` together with the objects fetched alongside it —
+its *batch*.  The first time a relationship field is resolved for any object
+in a batch, the field is loaded for the whole batch at once: the related
+objects are fetched through the target model's permission-restricted
+queryset, so loading and the view-permission check are the same query (one
+per target model; multi-object fields add one through-table query).  The
+results are kept keyed by (field, parent id) and the rest of the batch reads
+them from there.
+
+The permission verdicts are cached for the request as well, keyed by
+(model, pk): an object referenced by many custom objects, through several
+fields or at several levels of the query (the same site, say) is fetched and
+checked once, and later loads query only the objects not seen yet.
+
+Batches are registered from two places, one per level of the query:
+
+* the root ``<type>`` / ``<type>_list`` querysets, whose evaluation registers
+  the fetched page (see :func:`batch_queryset`);
+* the loader itself, which registers the objects a field load returned as the
+  batch of parents for the next level down.
+
+Strawberry's ``DataLoader`` requires an async executor; NetBox executes
+GraphQL synchronously, hence this synchronous equivalent.
+"""
+
+import logging
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.query import ModelIterable
+from extras.choices import CustomFieldTypeChoices
+
+logger = logging.getLogger("netbox_custom_objects.graphql")
+
+__all__ = (
+    "RelationshipLoader",
+    "batch_queryset",
+    "get_loader",
+)
+
+# Attribute of the Django request that holds its loader.
+_REQUEST_ATTR = "_custom_objects_graphql_loader"
+
+
+class _BatchingModelIterable(ModelIterable):
+    """Model iterable that registers the instances it yields as one batch."""
+
+    loader = None
+
+    def __iter__(self):
+        instances = list(super().__iter__())
+        self.loader.prime(instances)
+        return iter(instances)
+
+
+class RelationshipLoader:
+    """
+    Batch loader for the relationship fields of custom objects, scoped to one
+    request (and so to one user).
+    """
+
+    def __init__(self, user):
+        self.user = user
+        # (model, pk) -> list of the instances fetched together with it.
+        self._batches = {}
+        # (field pk, parent pk) -> related object (or None), or list of related objects.
+        self._results = {}
+        # (model, pk) -> the object if the user may view it, else None.
+        self._viewable = {}
+        self.iterable_class = type("BatchingModelIterable", (_BatchingModelIterable,), {"loader": self})
+
+    def prime(self, instances):
+        """Register ``instances`` as fetched together, grouped by model."""
+        by_model = {}
+        for obj in instances:
+            if obj is not None and obj.pk is not None:
+                by_model.setdefault(type(obj), []).append(obj)
+        for model, batch in by_model.items():
+            for obj in batch:
+                self._batches[(model, obj.pk)] = batch
+
+    def load(self, field, parent):
+        """
+        Return the object(s) ``parent`` references through ``field`` (a
+        ``CustomObjectTypeField``) that the user may view: a list for
+        multi-object fields, an object or ``None`` otherwise.
+        """
+        key = (field.pk, parent.pk)
+        if key not in self._results:
+            batch = self._batches.get((type(parent), parent.pk)) or [parent]
+            parents = [obj for obj in batch if (field.pk, obj.pk) not in self._results]
+            if parent not in parents:
+                parents.append(parent)
+            loaded = _LOADERS[(field.type, field.is_polymorphic)](self, field, type(parent), parents)
+            for parent_pk, value in loaded.items():
+                self._results[(field.pk, parent_pk)] = value
+            related = []
+            for value in loaded.values():
+                if isinstance(value, list):
+                    related.extend(value)
+                elif value is not None:
+                    related.append(value)
+            self.prime(related)
+        return self._results[key]
+
+    def viewable(self, model):
+        """``model``'s queryset restricted to the objects the user may view."""
+        manager = model._default_manager
+        if not hasattr(manager, "restrict"):
+            return manager.all()
+        return manager.restrict(self.user, "view")
+
+    def fetch_viewable(self, model, pks):
+        """
+        Return ``{pk: object}`` for the objects of ``model`` among ``pks`` the
+        user may view.  Only pks not seen before in the request are queried,
+        in one restricted query.
+        """
+        pending = {pk for pk in pks if (model, pk) not in self._viewable}
+        if pending:
+            for pk in pending:
+                self._viewable[(model, pk)] = None
+            for obj in self.viewable(model).filter(pk__in=pending):
+                self._viewable[(model, obj.pk)] = obj
+        objects = {}
+        for pk in pks:
+            obj = self._viewable[(model, pk)]
+            if obj is not None:
+                objects[pk] = obj
+        return objects
+
+    def default_order(self, model, pks):
+        """
+        Return ``{pk: rank}`` placing ``pks`` in ``model``'s default ordering,
+        as its related managers return them, from one pk-only query.  The
+        database applies the ordering, so collations, expressions and
+        cross-relation terms behave exactly as for the related manager.
+        """
+        ordered = model._default_manager.filter(pk__in=list(pks)).values_list("pk", flat=True)
+        return {pk: rank for rank, pk in enumerate(ordered)}
+
+    def _fetch_by_content_type(self, pairs):
+        """Resolve ``(content_type_id, object_id)`` pairs to viewable objects, one query per new model."""
+        by_content_type = {}
+        for content_type_id, object_id in pairs:
+            by_content_type.setdefault(content_type_id, set()).add(object_id)
+        objects = {}
+        for content_type_id, object_ids in by_content_type.items():
+            try:
+                model = ContentType.objects.get_for_id(content_type_id).model_class()
+            except ContentType.DoesNotExist:
+                continue
+            if model is None:
+                continue
+            for pk, obj in self.fetch_viewable(model, object_ids).items():
+                objects[(content_type_id, pk)] = obj
+        return objects
+
+
+def _load_object(loader, field, model, parents):
+    model_field = model._meta.get_field(field.name)
+    target_ids = {getattr(parent, model_field.attname) for parent in parents} - {None}
+    objects = loader.fetch_viewable(model_field.related_model, target_ids)
+    return {parent.pk: objects.get(getattr(parent, model_field.attname)) for parent in parents}
+
+
+def _load_polymorphic_object(loader, field, model, parents):
+    content_type_attr = f"{field.name}_content_type_id"
+    object_id_attr = f"{field.name}_object_id"
+    pairs = {
+        (getattr(parent, content_type_attr), getattr(parent, object_id_attr))
+        for parent in parents
+    }
+    objects = loader._fetch_by_content_type(pair for pair in pairs if None not in pair)
+    return {
+        parent.pk: objects.get((getattr(parent, content_type_attr), getattr(parent, object_id_attr)))
+        for parent in parents
+    }
+
+
+def _load_multiobject(loader, field, model, parents):
+    model_field = model._meta.get_field(field.name)
+    rows = model_field.remote_field.through.objects.filter(
+        source_id__in=[parent.pk for parent in parents],
+    ).values_list("source_id", "target_id")
+    sources_by_target = {}
+    for source_id, target_id in rows:
+        sources_by_target.setdefault(target_id, []).append(source_id)
+    results = {parent.pk: [] for parent in parents}
+    for target_id, obj in loader.fetch_viewable(model_field.related_model, sources_by_target).items():
+        for source_id in sources_by_target[target_id]:
+            results[source_id].append(obj)
+    # Objects come from the request's cache as well as this load's query, so
+    # the default ordering is applied from a separate, ordered pk query.
+    if model_field.related_model._meta.ordering and any(len(related) > 1 for related in results.values()):
+        rank = loader.default_order(
+            model_field.related_model, {obj.pk for related in results.values() for obj in related}
+        )
+        for related in results.values():
+            related.sort(key=lambda obj: rank.get(obj.pk, len(rank)))
+    return results
+
+
+def _load_polymorphic_multiobject(loader, field, model, parents):
+    through = next(
+        (t for t in getattr(model, "_through_models", None) or () if t.__name__ == field.through_model_name),
+        None,
+    )
+    results = {parent.pk: [] for parent in parents}
+    if through is None:
+        return results
+    rows = list(
+        through.objects.filter(source_id__in=list(results))
+        .values_list("source_id", "content_type_id", "object_id")
+        .order_by("id")
+    )
+    objects = loader._fetch_by_content_type((ct_id, obj_id) for _, ct_id, obj_id in rows)
+    for source_id, content_type_id, object_id in rows:
+        obj = objects.get((content_type_id, object_id))
+        if obj is not None:
+            results[source_id].append(obj)
+    # The order PolymorphicManyToManyManager.all() returns.
+    for related in results.values():
+        related.sort(key=str)
+    return results
+
+
+_LOADERS = {
+    (CustomFieldTypeChoices.TYPE_OBJECT, False): _load_object,
+    (CustomFieldTypeChoices.TYPE_OBJECT, True): _load_polymorphic_object,
+    (CustomFieldTypeChoices.TYPE_MULTIOBJECT, False): _load_multiobject,
+    (CustomFieldTypeChoices.TYPE_MULTIOBJECT, True): _load_polymorphic_multiobject,
+}
+
+
+def get_loader(info):
+    """Return the :class:`RelationshipLoader` of the request behind ``info``."""
+    request = getattr(getattr(info, "context", None), "request", None)
+    if request is None:
+        # No request to scope it to: the field is loaded for this object alone.
+        return RelationshipLoader(None)
+    loader = getattr(request, _REQUEST_ATTR, None)
+    if loader is None:
+        loader = RelationshipLoader(getattr(request, "user", None))
+        setattr(request, _REQUEST_ATTR, loader)
+    return loader
+
+
+def batch_queryset(queryset, loader):
+    """Return ``queryset``, made to register the page it fetches with ``loader`` as one batch."""
+    if not issubclass(queryset._iterable_class, ModelIterable):
+        return queryset
+    queryset = queryset.all()
+    # _iterable_class survives filter(), order_by() and slicing, which
+    # strawberry-django applies after get_queryset().
+    queryset._iterable_class = loader.iterable_class
+    return queryset
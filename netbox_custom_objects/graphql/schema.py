@@ -22,7 +22,10 @@ from typing import List
 import strawberry
 import strawberry_django
 
-from .types import build_object_type, clear_type_cache, graphql_safe_name, reset_build_state, set_cot_map
+from netbox_custom_objects.constants import APP_LABEL
+from netbox_custom_objects.utilities import extract_cot_id_from_model_name
+
+from .types import build_object_type, graphql_safe_name, prune_type_cache, reset_build_state, set_cot_map
 
 logger = logging.getLogger("netbox_custom_objects.graphql")
 
@@ -73,7 +76,50 @@ def _query_field_name(custom_object_type, used_names):
     return name
 
 
-def build_query_classes():
+def _type_signatures(custom_object_types):
+    """
+    Return ``{cot id: signature}`` for the preloaded ``custom_object_types``.
+
+    A type's own structure is its ``cache_timestamp`` plus each field's pk,
+    ``last_updated`` and target content type(s).  Its GraphQL type embeds the
+    types of the custom object types its relationship fields point at, so the
+    signature covers the own structure of every type reachable that way: a
+    change to any of them rebuilds it, a change anywhere else does not.
+    """
+    own = {}
+    targets = {}
+    for cot in custom_object_types:
+        fields = []
+        reachable = set()
+        for field in cot.fields.all():
+            if field.is_polymorphic:
+                content_types = list(field.related_object_types.all())
+            else:
+                content_types = [field.related_object_type] if field.related_object_type_id else []
+            fields.append((field.pk, field.last_updated, tuple(sorted(ct.pk for ct in content_types))))
+            for content_type in content_types:
+                if content_type.app_label == APP_LABEL:
+                    cot_id = extract_cot_id_from_model_name(content_type.model)
+                    if cot_id is not None:
+                        reachable.add(int(cot_id))
+        own[cot.pk] = (cot.cache_timestamp, tuple(sorted(fields)))
+        targets[cot.pk] = reachable
+
+    signatures = {}
+    for cot_id in own:
+        seen = {cot_id}
+        pending = [cot_id]
+        while pending:
+            for target in targets.get(pending.pop(), ()):
+                if target not in seen:
+                    seen.add(target)
+                    pending.append(target)
+        # A deleted target contributes None, so its removal rebuilds the type too.
+        signatures[cot_id] = tuple(sorted((target, own.get(target)) for target in seen))
+    return signatures
+
+
+def build_query_classes(branch_key=None):
     """
     Build the list of Strawberry query classes contributed to NetBox's schema.
 
@@ -86,6 +132,12 @@ def build_query_classes():
     module-level ``schema`` export below deliberately does not call it (see the
     module docstring).  The returned class carries a ``_nco_query`` marker so live
     rebuilds can identify and replace a previously contributed instance.
+
+    Built types are reused across rebuilds for every custom object type whose
+    signature (see :func:`_type_signatures`) is unchanged, so a rebuild only
+    builds the types that changed.  ``branch_key`` identifies the branch being
+    built (``None`` = main); each branch has its own cached types, as the
+    models they are bound to are generated per branch.
     """
     # Import lazily to avoid import-time side effects and circular imports.
     # The skip-check must run *before* importing models: during migrations and
@@ -100,18 +152,7 @@ def build_query_classes():
 
     from netbox_custom_objects.models import CustomObjectType, CustomObjectTypeField
 
-    # Start each rebuild from an empty per-type cache.  The cache is keyed by
-    # (cot id, cache_timestamp), but a type that embeds another COT's type via a
-    # relationship field does NOT get its own cache_timestamp bumped when the
-    # referenced COT changes — so a cached entry could embed a stale child type.
-    # Clearing here makes every type fresh per rebuild (rebuilds only happen on an
-    # actual structural change), while the cache still memoizes within this single
-    # rebuild pass so shared and recursive references reuse one built type.
-    # NOTE: this clear+repopulate of the process-global cache is why rebuilds must
-    # be serialised — concurrent rebuilds (e.g. different branches) would race here.
-    # live.get_live_schema holds _rebuild_lock around the whole rebuild to enforce it.
-    clear_type_cache()
-    # Also drop any in-progress build state (stack / cycle taint) leaked by an
+    # Drop any in-progress build state (stack / cycle taint) leaked by an
     # exception during a previous rebuild on this pooled thread, so it can't
     # suppress caching or corrupt cycle detection on this rebuild.
     reset_build_state()
@@ -135,8 +176,15 @@ def build_query_classes():
 
     # Register the preloaded types by pk so a relationship field pointing at another
     # custom object resolves its target from the prefetched instance instead of
-    # re-querying it (build_object_type then reuses the per-rebuild type cache).
-    set_cot_map({cot.pk: cot for cot in custom_object_types})
+    # re-querying it, together with the key each type is cached under: the branch
+    # plus its signature, so build_object_type reuses every unchanged type.
+    signatures = _type_signatures(custom_object_types)
+    set_cot_map(
+        {cot.pk: cot for cot in custom_object_types},
+        {cot_id: (branch_key, cot_id, signature) for cot_id, signature in signatures.items()},
+    )
+    # Types deleted since the last rebuild of this branch.
+    prune_type_cache(branch_key, set(signatures))
 
     annotations = {}
     attrs = {}
@@ -40,6 +40,8 @@ from strawberry.types import Info
 from netbox_custom_objects.constants import APP_LABEL
 from netbox_custom_objects.utilities import extract_cot_id_from_model_name
 
+from .loaders import batch_queryset, get_loader
+
 logger = logging.getLogger("netbox_custom_objects.graphql")
 
 __all__ = (
@@ -48,18 +50,22 @@ __all__ = (
     "build_object_type",
     "clear_type_cache",
     "graphql_safe_name",
+    "prune_type_cache",
     "reset_build_state",
     "set_cot_map",
 )
 
-# Per-rebuild memoization of built GraphQL types, keyed by (cot id,
-# cache_timestamp).  It lets a single schema rebuild reuse one built type across
-# the many places that reference it (shared targets and recursive relationships)
-# instead of re-running build_object_type for each.  It is cleared at the start of
-# every rebuild (see schema.build_query_classes): a type that embeds another COT's
-# type does not get its own cache_timestamp bumped when that referenced COT
-# changes, so persisting entries across rebuilds could serve a stale embedded
-# type.  clear_type_cache() also lets tests reset it explicitly.
+# Memoization of built GraphQL types, keyed by (branch key, cot id, signature).
+# Within a rebuild it lets one built type serve the many places that reference it
+# (shared targets and recursive relationships); across rebuilds it lets a type
+# whose structure is unchanged be reused, so a rebuild only builds the types that
+# changed.  During a live rebuild the signature covers the type's own structure
+# *and* that of every custom object type it reaches through relationship fields
+# (see schema._type_signatures): a type that embeds another COT's type does not
+# get its own cache_timestamp bumped when the referenced COT changes, so its own
+# structure alone could serve a stale embedded type.  Direct callers outside a
+# rebuild fall back to (None, cot id, cache_timestamp).  clear_type_cache() lets
+# tests reset it explicitly.
 _type_cache = {}
 _type_cache_lock = threading.RLock()
 
@@ -86,6 +92,17 @@ def clear_type_cache():
         _type_cache.clear()
 
 
+def prune_type_cache(branch_key, cot_ids):
+    """
+    Drop the cached types built for ``branch_key`` whose custom object type is
+    not in ``cot_ids`` — types deleted since, or every type of a deleted branch
+    when ``cot_ids`` is empty.
+    """
+    with _type_cache_lock:
+        for key in [k for k in _type_cache if k[0] == branch_key and k[1] not in cot_ids]:
+            del _type_cache[key]
+
+
 def reset_build_state():
     """
     Clear this thread's in-progress build stack and cycle-taint set.
@@ -96,14 +113,15 @@ def reset_build_state():
     next one.  ``build_object_type`` only clears a type's taint on the success
     path, so a build that raises after a cyclic edge tainted an ancestor would
     otherwise leave that taint set on the thread indefinitely.  Also drops the
-    preloaded COT map (see :func:`set_cot_map`).
+    preloaded COT map and type cache keys (see :func:`set_cot_map`).
     """
     _building.cot_stack = []
     _building.cycle_tainted = set()
     _building.cot_map = None
+    _building.type_keys = None
 
 
-def set_cot_map(cot_map):
+def set_cot_map(cot_map, type_keys=None):
     """
     Register a ``{pk: CustomObjectType}`` map for the current rebuild.
 
@@ -111,9 +129,18 @@ def set_cot_map(cot_map):
     (and their related types) prefetched, then registers them here so a relationship
     field pointing at another custom object resolves its target from the prefetched
     instance — via :func:`_custom_object_graphql_type` — instead of issuing a fresh
-    query per reference.  Cleared by :func:`reset_build_state`.
+    query per reference.  ``type_keys`` maps the same pks to the key each type is
+    cached under in :data:`_type_cache`.  Cleared by :func:`reset_build_state`.
     """
     _building.cot_map = cot_map
+    _building.type_keys = type_keys
+
+
+def _type_cache_key(custom_object_type):
+    type_keys = getattr(_building, "type_keys", None)
+    if type_keys and custom_object_type.id in type_keys:
+        return type_keys[custom_object_type.id]
+    return (None, custom_object_type.id, custom_object_type.cache_timestamp)
 
 
 RELATIONSHIP_TYPES = (
@@ -154,7 +181,11 @@ class CustomObjectObjectType(ChangelogMixin, TagsMixin, BaseObjectType):
     type by :func:`build_object_type`.
     """
 
-    pass
+    @classmethod
+    def get_queryset(cls, queryset, info, **kwargs):
+        # The fetched page is the batch the relationship fields are loaded for.
+        queryset = super().get_queryset(queryset, info, **kwargs)
+        return batch_queryset(queryset, get_loader(info))
 
 
 def graphql_safe_name(value):
@@ -178,58 +209,6 @@ def _cycle_tainted_set():
     return tainted
 
 
-def _request_user(info):
-    """Best-effort extraction of the requesting user from the GraphQL info context."""
-    request = getattr(getattr(info, "context", None), "request", None)
-    return getattr(request, "user", None)
-
-
-def _filter_viewable(user, objects):
-    """
-    Return the subset of ``objects`` the user may view, preserving order.
-
-    The top-level query restricts the custom objects themselves, but the objects
-    reached through their relationship fields are *not* covered by that check, so
-    each one must be gated here or the field would leak objects the user cannot
-    see.  Used for both single- and multi-object fields so the permission rule
-    lives in one place; batches the check to one query per distinct model rather
-    than one ``.exists()`` per object (an N+1 explosion on multi-object fields):
-    the related objects are grouped by model and each model's permission-restricted
-    queryset is evaluated once with ``pk__in``.
-
-    The user (anonymous or ``None`` included) is passed straight to the model
-    manager's ``restrict(user, "view")``, mirroring NetBox's
-    ``BaseObjectType.get_queryset`` — superuser bypass, ``EXEMPT_VIEW_PERMISSIONS``
-    and anonymous handling are all left to ``restrict``.
-    """
-    objects = [obj for obj in objects if obj is not None]
-    if not objects:
-        return []
-    if getattr(user, "is_superuser", False):
-        return objects
-
-    # sentinel meaning "model isn't permission-aware → all allowed".
-    allowed_by_model = {}
-    by_model = {}
-    for obj in objects:
-        by_model.setdefault(type(obj), []).append(obj)
-    for model, model_objs in by_model.items():
-        manager = getattr(model, "_default_manager", None)
-        if manager is None or not hasattr(manager, "restrict"):
-            allowed_by_model[model] = None
-            continue
-        pks = [obj.pk for obj in model_objs]
-        allowed_by_model[model] = set(
-            manager.restrict(user, "view").filter(pk__in=pks).values_list("pk", flat=True)
-        )
-
-    return [
-        obj
-        for obj in objects
-        if (allowed_by_model[type(obj)] is None or obj.pk in allowed_by_model[type(obj)])
-    ]
-
-
 def _related_repr(obj):
     """Convert a referenced model instance into a ``CustomObjectRelatedObjectType``."""
     if obj is None:
@@ -420,7 +399,8 @@ def _make_relationship_resolver(field):
 
     The resolver returns the referenced object(s) as their native GraphQL
     type(s) (or the flat stub for targets without one), filtered to those the
-    requesting user may view.
+    requesting user may view.  Loading and the permission check are batched
+    across the parent objects of the request level (see :mod:`.loaders`).
     """
     field_name = field.name
     is_list = field.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT
@@ -430,41 +410,31 @@ def _make_relationship_resolver(field):
         return None
     annotation = _relationship_annotation(members, is_list, _relationship_union_name(field))
 
-    # Query-optimisation hints read by NetBox's DjangoOptimizerExtension. A
-    # non-polymorphic OBJECT field is a ForeignKey (select_related); a polymorphic
-    # one is a GenericForeignKey (prefetch_related only). A non-polymorphic
-    # MULTIOBJECT field is a real M2M (prefetch_related); a polymorphic one is a
-    # custom descriptor that can't be prefetched.
+    # The loader reads the relationship's columns off the parent objects, so the
+    # optimizer must not defer them; it must not select_related/prefetch the
+    # relationship either, which the loader fetches itself.  Multi-object fields
+    # only need the parent's pk.
     if is_list:
-        hint = {} if field.is_polymorphic else {"prefetch_related": field_name}
+        hint = {}
         description = f"Related objects referenced by '{field_name}'"
     else:
-        hint = {"prefetch_related": field_name} if field.is_polymorphic else {"select_related": field_name}
+        if field.is_polymorphic:
+            hint = {"only": [f"{field_name}_content_type", f"{field_name}_object_id"]}
+        else:
+            hint = {"only": [field_name]}
         description = f"Related object referenced by '{field_name}'"
 
     def resolver(self, info: Info):
-        user = _request_user(info)
-        value = getattr(self, field_name, None)
+        try:
+            value = get_loader(info).load(field, self)
+        except Exception:  # noqa: BLE001 - never let one field break the query
+            logger.warning("Failed to resolve relationship GraphQL field %r", field_name, exc_info=True)
+            return [] if is_list else None
         if is_list:
-            if value is None:
-                return []
-            try:
-                related = list(value.all())
-            except Exception:  # noqa: BLE001 - never let one field break the query
-                logger.warning(
-                    "Failed to resolve multi-object GraphQL field %r", field_name, exc_info=True
-                )
-                return []
-            return [
-                _coerce_related(obj, native_models)
-                for obj in _filter_viewable(user, related)
-            ]
+            return [_coerce_related(obj, native_models) for obj in value]
         if value is None:
             return None
-        viewable = _filter_viewable(user, [value])
-        if not viewable:
-            return None
-        return _coerce_related(viewable[0], native_models)
+        return _coerce_related(value, native_models)
 
     resolver.__annotations__ = {"info": Info, "return": annotation}
     return strawberry_django.field(description=description, **hint)(resolver)
@@ -494,9 +464,9 @@ def build_object_type(custom_object_type):
         return None
 
     # Reuse the already-built type when this COT's structure is unchanged (see
-    # _type_cache).  cache_timestamp moves on every structural change, so this can
-    # never serve a type that no longer matches the model.
-    cache_key = (custom_object_type.id, custom_object_type.cache_timestamp)
+    # _type_cache).  The key moves on every structural change, so this can never
+    # serve a type that no longer matches the model.
+    cache_key = _type_cache_key(custom_object_type)
     with _type_cache_lock:
         cached = _type_cache.get(cache_key)
     if cached is not None:
@@ -520,9 +490,10 @@ def build_object_type(custom_object_type):
         return gql_type
 
     with _type_cache_lock:
-        _type_cache[cache_key] = gql_type
-        # Bound growth: drop now-superseded entries for this COT.
-        for key in [k for k in _type_cache if k[0] == cache_key[0] and k != cache_key]:
+        # First build wins, so every reference to this key resolves to one class.
+        gql_type = _type_cache.setdefault(cache_key, gql_type)
+        # Bound growth: drop now-superseded entries for this COT (in this branch).
+        for key in [k for k in _type_cache if k[:2] == cache_key[:2] and k != cache_key]:
             del _type_cache[key]
     return gql_type
 
@@ -0,0 +1,211 @@
+"""
+Composite and partial indexes declared on a custom object type.
+
+``CustomObjectType.indexes`` holds a list of named index definitions::
+
+    [
+        {"name": "site_status", "fields": ["site", "status"]},
+        {"name": "open_by_date", "fields": ["-opened"], "condition": {"status": ["open", "pending"]}},
+    ]
+
+``fields`` lists one or more field names, in index column order; a leading
+``-`` makes a column descending.  The optional ``condition`` makes the index
+partial: it maps select field names to the choice value (or list of values)
+rows must hold to be indexed.
+
+Definitions are applied to the type's table with the schema editor when the
+type is saved (:func:`sync_indexes`).  Each physical index is named
+``cot<id>_ix_<name>``, distinct from the per-field ``indexed`` indexes.
+Renaming a field rewrites the definitions that use it; deleting a field drops
+the definitions that use it, as PostgreSQL drops their indexes with the column.
+"""
+import logging
+import re
+
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from extras.choices import CustomFieldTypeChoices
+
+from netbox_custom_objects.field_types import FIELD_TYPE_CLASS
+
+__all__ = (
+    "MAX_INDEX_FIELDS",
+    "build_index",
+    "get_index_name",
+    "normalize_index_definitions",
+    "remove_field_from_indexes",
+    "rename_field_in_indexes",
+    "sync_indexes",
+    "validate_index_definitions",
+)
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL allows 32 index columns; a handful is all a composite needs.
+MAX_INDEX_FIELDS = 8
+
+# Leaves room for the "cot<id>_ix_" prefix within PostgreSQL's 63-byte limit.
+_NAME_MAX_LENGTH = 40
+_NAME_RE = re.compile(r"^[a-z0-9]+(_[a-z0-9]+)*$")
+
+
+def get_index_name(custom_object_type, definition):
+    """Physical name of the index for ``definition`` on ``custom_object_type``'s table."""
+    return f"cot{custom_object_type.pk}_ix_{definition['name']}"
+
+
+def normalize_index_definitions(definitions):
+    """
+    Return ``definitions`` in canonical form, sorted by name: condition
+    values are lists, and an empty condition is omitted.  Used to store and
+    compare definitions, so ``{"status": "open"}`` equals ``{"status": ["open"]}``.
+    """
+    normalized = []
+    for definition in definitions or []:
+        entry = {"name": definition["name"], "fields": list(definition["fields"])}
+        condition = {
+            name: sorted(value) if isinstance(value, (list, tuple)) else [value]
+            for name, value in sorted((definition.get("condition") or {}).items())
+        }
+        if condition:
+            entry["condition"] = condition
+        normalized.append(entry)
+    return sorted(normalized, key=lambda entry: entry["name"])
+
+
+def _indexable(field):
+    if field.is_polymorphic:
+        return False
+    if field.type == CustomFieldTypeChoices.TYPE_OBJECT:
+        return True
+    return FIELD_TYPE_CLASS[field.type].index_type == "btree"
+
+
+def validate_index_definitions(definitions, fields):
+    """
+    Validate ``definitions`` against the type's ``fields`` (its
+    ``CustomObjectTypeField`` instances).  Raises ``ValidationError`` keyed on
+    ``indexes``.
+    """
+    if not isinstance(definitions, list):
+        raise ValidationError({"indexes": _("Indexes must be a list of index definitions.")})
+    fields_by_name = {field.name: field for field in fields}
+    names = set()
+    errors = []
+    for definition in definitions:
+        if not isinstance(definition, dict) or set(definition) - {"name", "fields", "condition"}:
+            errors.append(_("Each index must be an object with name, fields and an optional condition."))
+            continue
+        name = definition.get("name")
+        if not isinstance(name, str) or not _NAME_RE.match(name) or len(name) > _NAME_MAX_LENGTH:
+            errors.append(_(
+                "Invalid index name {name!r}: use up to {max} lowercase letters, digits and single underscores."
+            ).format(name=name, max=_NAME_MAX_LENGTH))
+            continue
+        if name in names:
+            errors.append(_("Duplicate index name {name!r}.").format(name=name))
+            continue
+        names.add(name)
+
+        index_fields = definition.get("fields")
+        if not isinstance(index_fields, list) or not 1 <= len(index_fields) <= MAX_INDEX_FIELDS:
+            errors.append(_("Index {name!r} must list 1 to {max} fields.").format(name=name, max=MAX_INDEX_FIELDS))
+            continue
+        columns = [field_name.removeprefix("-") if isinstance(field_name, str) else None for field_name in index_fields]
+        if len(set(columns)) != len(columns):
+            errors.append(_("Index {name!r} lists a field more than once.").format(name=name))
+        for column in columns:
+            field = fields_by_name.get(column)
+            if field is None:
+                errors.append(_("Index {name!r}: unknown field {field!r}.").format(name=name, field=column))
+            elif not _indexable(field):
+                errors.append(_("Index {name!r}: fields of type {type} cannot be indexed.").format(
+                    name=name, type=field.get_type_display(),
+                ))
+
+        condition = definition.get("condition") or {}
+        if not isinstance(condition, dict):
+            errors.append(_("The condition of index {name!r} must map field names to values.").format(name=name))
+            continue
+        for field_name, value in condition.items():
+            field = fields_by_name.get(field_name)
+            if field is None or field.type != CustomFieldTypeChoices.TYPE_SELECT:
+                errors.append(_("Index {name!r}: conditions may only use select fields, not {field!r}.").format(
+                    name=name, field=field_name,
+                ))
+                continue
+            values = value if isinstance(value, list) else [value]
+            valid = {choice[0] for choice in field.choices}
+            invalid = [v for v in values if v not in valid]
+            if not values or invalid:
+                errors.append(_("Index {name!r}: invalid choice(s) for {field}: {values}").format(
+                    name=name, field=field_name, values=", ".join(str(v) for v in invalid) or "-",
+                ))
+    if errors:
+        raise ValidationError({"indexes": errors})
+
+
+def build_index(custom_object_type, definition):
+    """Return the Django ``Index`` for ``definition``."""
+    condition = None
+    for field_name, values in (definition.get("condition") or {}).items():
+        if not isinstance(values, list):
+            values = [values]
+        q = Q(**{field_name: values[0]}) if len(values) == 1 else Q(**{f"{field_name}__in": values})
+        condition = q if condition is None else condition & q
+    return models.Index(
+        fields=list(definition["fields"]),
+        name=get_index_name(custom_object_type, definition),
+        condition=condition,
+    )
+
+
+def sync_indexes(custom_object_type, model, old_definitions, new_definitions, schema_editor):
+    """
+    Apply the difference between two sets of definitions to ``model``'s
+    table: indexes that were removed or changed are dropped, and new or
+    changed ones are created.  Unchanged indexes are left alone.
+    """
+    old = {d["name"]: d for d in normalize_index_definitions(old_definitions)}
+    new = {d["name"]: d for d in normalize_index_definitions(new_definitions)}
+    qn = schema_editor.quote_name
+    for name, definition in old.items():
+        if new.get(name) != definition:
+            # Dropped by name: the definition may reference fields that no
+            # longer exist, and the index may have gone with such a column.
+            schema_editor.execute(
+                f"DROP INDEX IF EXISTS {qn(get_index_name(custom_object_type, definition))}"
+            )
+    for name, definition in new.items():
+        if old.get(name) != definition:
+            schema_editor.add_index(model, build_index(custom_object_type, definition))
+            logger.info("Created index %s on %s", get_index_name(custom_object_type, definition), model._meta.db_table)
+
+
+def rename_field_in_indexes(definitions, old_name, new_name):
+    """Return ``definitions`` with field ``old_name`` renamed to ``new_name``."""
+    renamed = []
+    for definition in definitions or []:
+        entry = dict(definition)
+        entry["fields"] = [
+            f"-{new_name}" if field_name == f"-{old_name}" else new_name if field_name == old_name else field_name
+            for field_name in definition["fields"]
+        ]
+        if definition.get("condition"):
+            entry["condition"] = {
+                new_name if field_name == old_name else field_name: value
+                for field_name, value in definition["condition"].items()
+            }
+        renamed.append(entry)
+    return renamed
+
+
+def remove_field_from_indexes(definitions, name):
+    """Return ``definitions`` without those that use field ``name``."""
+    return [
+        definition for definition in definitions or []
+        if name not in {field_name.removeprefix("-") for field_name in definition["fields"]}
+        and name not in (definition.get("condition") or {})
+    ]
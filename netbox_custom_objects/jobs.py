@@ -1,3 +1,5 @@
+import uuid
+
 from netbox.jobs import JobRunner
 from netbox.search.backends import get_backend
 
@@ -58,3 +60,122 @@ class ReindexCustomObjectTypeJob(JobRunner):
             raise ValueError('cot_id is required to run ReindexCustomObjectTypeJob')
         cot = CustomObjectType.objects.get(pk=cot_id)
         get_backend().cache(cot.get_model().objects.all())
+
+
+class ReconcileCustomObjectTypeJob(JobRunner):
+    """
+    Background job that reconciles a CustomObjectType's rows with a submitted
+    desired state (see :mod:`netbox_custom_objects.reconcile`).
+
+    The desired rows are staged in the cache under ``rows_key`` rather than
+    pickled into the queued job's arguments, which the queue would otherwise
+    hold (and copy to the job result) in full.  The counts of each action are
+    stored in ``Job.data``.
+    """
+
+    class Meta:
+        name = 'Reconcile Custom Object Type'
+
+    # Seconds the staged rows are kept for a worker to pick them up.
+    ROWS_TIMEOUT = 24 * 60 * 60
+
+    @staticmethod
+    def _rows_cache_key(rows_key):
+        return f'netbox_custom_objects:reconcile_rows:{rows_key}'
+
+    @classmethod
+    def enqueue(cls, *args, **kwargs):
+        # Deferred to avoid circular import: models.py imports this module at the top level
+        from django.core.cache import cache
+
+        from netbox_custom_objects.models import CustomObjectType
+
+        if 'rows' in kwargs:
+            kwargs['rows_key'] = uuid.uuid4().hex
+            cache.set(cls._rows_cache_key(kwargs['rows_key']), kwargs.pop('rows'), timeout=cls.ROWS_TIMEOUT)
+
+        cot_id = kwargs.get('cot_id')
+        if 'name' not in kwargs and cot_id is not None:
+            try:
+                cot_name = CustomObjectType.objects.values_list('name', flat=True).get(pk=cot_id)
+                kwargs['name'] = f'{cls.name}: {cot_name}'
+            except CustomObjectType.DoesNotExist:
+                pass
+
+        job = super().enqueue(*args, **kwargs)
+        if job is not None:
+            job.data = {**(job.data or {}), 'cot_id': cot_id, 'job_class': cls.__name__}
+            job.save(update_fields=['data'])
+        return job
+
+    def run(self, *args, **kwargs):
+        # Deferred to avoid circular import: models.py imports this module at the top level
+        from contextlib import ExitStack
+
+        from django.core.cache import cache
+
+        from netbox.registry import registry
+        from utilities.request import NetBoxFakeRequest
+
+        from netbox_custom_objects.models import CustomObjectType
+        from netbox_custom_objects.reconcile import reconcile
+        from netbox_custom_objects.upsert import resolve_natural_key
+
+        cot_id = kwargs.get('cot_id')
+        if not cot_id:
+            raise ValueError('cot_id is required to run ReconcileCustomObjectTypeJob')
+        model = CustomObjectType.objects.get(pk=cot_id).get_model()
+        key_fields = resolve_natural_key(model, kwargs.get('key'))
+        rows_cache_key = self._rows_cache_key(kwargs.get('rows_key'))
+        rows = cache.get(rows_cache_key)
+        if rows is None:
+            raise ValueError('The staged rows for this reconcile have expired or were never stored')
+
+        # Attribute the changes to the requesting user, as script jobs do, so
+        # change logging and event rules see them as that user's writes.
+        request = NetBoxFakeRequest({
+            'META': {},
+            'POST': {},
+            'GET': {},
+            'FILES': {},
+            'user': self.job.user,
+            'path': '',
+            'id': self.job.job_id,
+        })
+        with ExitStack() as stack:
+            for request_processor in registry['request_processors']:
+                stack.enter_context(request_processor(request))
+            counts = reconcile(
+                model, key_fields, rows, delete=kwargs.get('delete', False), user=self.job.user,
+            )
+        cache.delete(rows_cache_key)
+
+        self.job.data = {**(self.job.data or {}), **counts}
+        self.logger.info(
+            'Reconciled: %(created)s created, %(updated)s updated, %(deleted)s deleted, %(unchanged)s unchanged',
+            counts,
+        )
+
+
+class RebuildSearchVectorJob(ReindexCustomObjectTypeJob):
+    """
+    Background job that rebuilds (or drops) a CustomObjectType's full-text search
+    vector column (see :mod:`netbox_custom_objects.search_vector`).
+
+    Triggered when full-text search is switched on or off for a type, or when its
+    searchable fields change.  Enqueueing is deduplicated per COT as for reindexing.
+    """
+
+    class Meta:
+        name = 'Rebuild Search Vector'
+
+    def run(self, *args, **kwargs):
+        # Deferred to avoid circular import: models.py imports this module at the top level
+        from netbox_custom_objects.models import CustomObjectType
+        from netbox_custom_objects.search_vector import build_search_vector
+
+        cot_id = kwargs.get('cot_id')
+        if not cot_id:
+            raise ValueError('cot_id is required to run RebuildSearchVectorJob')
+        signature = build_search_vector(CustomObjectType.objects.get(pk=cot_id))
+        self.job.data = {**(self.job.data or {}), 'signature': signature}
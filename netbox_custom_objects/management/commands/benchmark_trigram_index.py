@@ -0,0 +1,166 @@
+"""
+management command: benchmark_trigram_index
+
+Measures the case-insensitive substring filters of a text field with and
+without a trigram index (``CustomObjectTypeField.trigram_indexed``).
+
+A scratch Custom Object Type with a single text field is created and filled
+with generated rows straight from SQL (``generate_series``), the ``icontains``,
+``istartswith`` and ``iendswith`` lookups are timed, the trigram index is built
+through the regular field save path, and the lookups are timed again.  The
+scratch type is deleted afterwards unless ``--keep`` is given.
+
+Usage examples
+--------------
+    # Default: 2,000,000 rows, 5 timed runs per lookup
+    manage.py benchmark_trigram_index
+
+    # A larger table, printing the query plans as well
+    manage.py benchmark_trigram_index --rows 10000000 --explain
+"""
+import hashlib
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark case-insensitive substring filters on a generated multi-million-row "
+        "Custom Object Type, with and without a trigram index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=2_000_000,
+            help="Number of rows to generate (default: 2,000,000).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Timed runs per lookup; the median is reported (default: 5).",
+        )
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Print the EXPLAIN ANALYZE output of each lookup.",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the scratch Custom Object Type instead of deleting it.",
+        )
+
+    def handle(self, *args, **options):
+        from netbox_custom_objects.models import CustomObjectType, CustomObjectTypeField  # noqa: PLC0415
+
+        rows = options["rows"]
+        if rows < 1 or options["repeat"] < 1:
+            raise CommandError("--rows and --repeat must be positive.")
+
+        suffix = uuid.uuid4().hex[:8]
+        cot = CustomObjectType.objects.create(
+            name=f"trigram_benchmark_{suffix}",
+            slug=f"trigram-benchmark-{suffix}",
+            verbose_name_plural="Trigram benchmark rows",
+            description="Scratch type created by manage.py benchmark_trigram_index",
+        )
+        try:
+            field = CustomObjectTypeField.objects.create(
+                custom_object_type=cot, name="hostname", label="Hostname", type="text",
+            )
+            model = cot.get_model()
+            self.stdout.write(f"Generating {rows:,} rows in {model._meta.db_table}...")
+            elapsed = self._fill(model, rows)
+            self.stdout.write(f"  done in {elapsed:.1f}s")
+
+            lookups = self._lookups(rows)
+            before = self._time_lookups(model, lookups, options)
+
+            self.stdout.write("Building the trigram index...")
+            field = CustomObjectTypeField.objects.get(pk=field.pk)
+            field.trigram_indexed = True
+            start = time.perf_counter()
+            field.save()
+            self.stdout.write(f"  done in {time.perf_counter() - start:.1f}s")
+            model = CustomObjectType.objects.get(pk=cot.pk).get_model()
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}")
+            after = self._time_lookups(model, lookups, options)
+
+            self.stdout.write("")
+            self.stdout.write(
+                f"{'lookup':<12} {'matches':>9} {'no index (ms)':>14} {'trigram (ms)':>13} {'speedup':>8}"
+            )
+            for lookup, _value in lookups:
+                count, without = before[lookup]
+                _count, with_index = after[lookup]
+                self.stdout.write(
+                    f"{lookup:<12} {count:>9,} {without:>14.1f} {with_index:>13.1f} "
+                    f"{without / with_index if with_index else float('inf'):>7.1f}x"
+                )
+        finally:
+            if options["keep"]:
+                self.stdout.write(f"Kept custom object type {cot.slug} (id {cot.pk}).")
+            else:
+                cot.delete()
+
+    @staticmethod
+    def _fill(model, rows):
+        """Insert ``rows`` generated hostnames with one INSERT ... SELECT."""
+        qn = connection.ops.quote_name
+        hostname = model._meta.get_field("hostname")
+        # Every other non-null column takes its field default, as on insert.
+        defaults = [
+            f for f in model._meta.concrete_fields
+            if not f.primary_key and f is not hostname and not f.null
+            and f.name not in ("created", "last_updated")
+        ]
+        columns = [hostname.column] + [f.column for f in defaults] + ["created", "last_updated"]
+        now = timezone.now()
+        start = time.perf_counter()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {qn(model._meta.db_table)} ({', '.join(qn(c) for c in columns)}) "
+                f"SELECT 'rtr-' || lpad(i::text, 8, '0') || '-' || substr(md5(i::text), 1, 12) || '.example.net'"
+                f"{''.join(', %s' for _f in defaults)}, %s, %s "
+                f"FROM generate_series(1, %s) AS i",
+                [f.get_db_prep_save(f.get_default(), connection) for f in defaults] + [now, now, rows],
+            )
+            cursor.execute(f"ANALYZE {qn(model._meta.db_table)}")
+        return time.perf_counter() - start
+
+    @staticmethod
+    def _lookups(rows):
+        """Selective filter values drawn from a row in the middle of the table."""
+        i = rows // 2 + 1
+        digest = hashlib.md5(str(i).encode()).hexdigest()
+        return [
+            ("icontains", digest[3:9].upper()),
+            ("istartswith", f"RTR-{i:08d}"),
+            ("iendswith", f"{digest[:12]}.EXAMPLE.NET"),
+        ]
+
+    def _time_lookups(self, model, lookups, options):
+        """Return ``{lookup: (match count, median ms)}``."""
+        results = {}
+        for lookup, value in lookups:
+            queryset = model.objects.filter(**{f"hostname__{lookup}": value})
+            if options["explain"]:
+                self.stdout.write(f"-- hostname__{lookup}={value!r}")
+                self.stdout.write(queryset.explain(analyze=True))
+            timings = []
+            count = 0
+            for _run in range(options["repeat"]):
+                start = time.perf_counter()
+                count = queryset.count()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[lookup] = (count, statistics.median(timings))
+        return results
@@ -0,0 +1,52 @@
+"""
+Index core_objectchange on (changed_object_type_id, time, id) for the per-type
+change feed (``GET /api/plugins/custom-objects/<slug>/changes/``).
+
+NetBox's own ObjectChange indexes lead with (changed_object_type, changed_object_id),
+which cannot serve "changes to this type after a (time, id) cursor, in time
+order"; this index serves each page of the feed as one range scan.  The index
+lives on a core table, so it is created with raw SQL (IF NOT EXISTS) rather than
+by altering a model this plugin does not own.
+
+The change log is typically large and written on every request, so the index is
+built with ``CREATE INDEX CONCURRENTLY``, which does not block writes.  That
+cannot run inside a transaction, hence ``atomic = False``.  A concurrent build
+that is interrupted leaves an INVALID index behind; it is dropped and rebuilt on
+the next run.
+"""
+
+from django.db import migrations
+
+INDEX_NAME = 'netbox_custom_objects_oc_feed_idx'
+
+
+def add_feed_index(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)", [INDEX_NAME])
+        row = cursor.fetchone()
+        if row is not None and not row[0]:
+            # Left over from an interrupted concurrent build.
+            cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}')
+        cursor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} '
+            'ON core_objectchange (changed_object_type_id, time, id)'
+        )
+
+
+def remove_feed_index(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('core', '0021_job_queue_name'),
+        ('netbox_custom_objects', '0018_alter_customobjecttypefield_schema_id'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_feed_index, remove_feed_index, atomic=False),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_custom_objects", "0019_objectchange_feed_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customobjecttype",
+            name="restrict_quick_search",
+            field=models.BooleanField(default=False),
+        ),
+    ]
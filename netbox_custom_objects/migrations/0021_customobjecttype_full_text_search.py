@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_custom_objects", "0020_customobjecttype_restrict_quick_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customobjecttype",
+            name="full_text_search",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="customobjecttype",
+            name="search_vector_signature",
+            field=models.TextField(blank=True, editable=False),
+        ),
+    ]
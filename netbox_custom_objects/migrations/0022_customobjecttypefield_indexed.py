@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_custom_objects", "0021_customobjecttype_full_text_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customobjecttypefield",
+            name="indexed",
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_custom_objects", "0022_customobjecttypefield_indexed"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customobjecttype",
+            name="indexes",
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
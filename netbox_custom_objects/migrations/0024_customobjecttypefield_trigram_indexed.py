@@ -0,0 +1,20 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_custom_objects", "0023_customobjecttype_indexes"),
+    ]
+
+    operations = [
+        # pg_trgm is a trusted extension (PostgreSQL 13+), so the database owner
+        # can install it without superuser rights.
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="customobjecttypefield",
+            name="trigram_indexed",
+            field=models.BooleanField(default=False),
+        ),
+    ]
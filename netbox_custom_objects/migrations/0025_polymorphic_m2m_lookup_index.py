@@ -0,0 +1,68 @@
+"""
+Replace the (content_type_id, object_id) index on polymorphic multiobject
+through tables with a (content_type_id, object_id, source_id) index.
+
+Filtering custom objects by a polymorphic multiobject value is a correlated
+``EXISTS`` on the through table keyed by (content_type_id, object_id); carrying
+``source_id`` in the same index lets PostgreSQL answer it with an index-only
+scan.  New through tables get the index from the through model's Meta; tables
+created before this migration are updated in place here.
+
+Through tables can be large, so the index is built with ``CREATE INDEX
+CONCURRENTLY``, which does not block writes.  That cannot run inside a
+transaction, hence ``atomic = False``.  A concurrent build that is interrupted
+leaves an INVALID index behind; it is dropped and rebuilt on the next run.  The
+superseded index is only dropped once the new one has been built.
+
+The reverse is a no-op: the new index serves every query the old one did.
+"""
+
+from django.db import migrations
+
+
+def add_polymorphic_m2m_lookup_indexes(apps, schema_editor):
+    """Create the lookup index on every existing polymorphic through table and drop the one it supersedes."""
+    from netbox_custom_objects.field_types import (  # noqa: PLC0415
+        get_polymorphic_m2m_index_name,
+        safe_table_name,
+    )
+
+    CustomObjectTypeField = apps.get_model("netbox_custom_objects", "CustomObjectTypeField")
+    fields = CustomObjectTypeField.objects.filter(type="multiobject", is_polymorphic=True)
+    qn = schema_editor.quote_name
+
+    with schema_editor.connection.cursor() as cursor:
+        existing_tables = set(schema_editor.connection.introspection.table_names(cursor))
+        for field in fields:
+            table_name = safe_table_name(f"custom_objects_{field.custom_object_type_id}_{field.name}")
+            # Idempotent: skip tables that were never created (or were dropped
+            # out of band), and IF [NOT] EXISTS covers partial re-runs.
+            if table_name not in existing_tables:
+                continue
+            index_name = get_polymorphic_m2m_index_name(field.custom_object_type_id, field.name)
+            legacy_name = get_polymorphic_m2m_index_name(field.custom_object_type_id, field.name, legacy=True)
+
+            cursor.execute("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)", [qn(index_name)])
+            row = cursor.fetchone()
+            if row is not None and not row[0]:
+                # Left over from an interrupted concurrent build.
+                cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {qn(index_name)}")
+
+            cursor.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {qn(index_name)} "
+                f"ON {qn(table_name)} (content_type_id, object_id, source_id)"
+            )
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {qn(legacy_name)}")
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("netbox_custom_objects", "0024_customobjecttypefield_trigram_indexed"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_polymorphic_m2m_lookup_indexes, migrations.RunPython.noop, atomic=False),
+    ]
@@ -0,0 +1,81 @@
+"""
+Add a (target_id, source_id) index to every existing multiobject through table.
+
+The through tables' ``unique_together`` index is (source_id, target_id), which
+serves lookups by source only.  Lookups by target — the target model's reverse
+accessors, the linked objects views and the ``<field>`` filter — relied on the
+foreign key's single-column ``target_id`` index and then visited the heap for
+``source_id``.  New through tables are created with the composite index (and
+without the single-column one it supersedes); this migration brings existing
+tables in line.
+
+Through tables can be large, so the index is built with ``CREATE INDEX
+CONCURRENTLY``, which does not block writes.  That cannot run inside a
+transaction, hence ``atomic = False``.  A concurrent build that is interrupted
+leaves an INVALID index behind; it is dropped and rebuilt on the next run.  The
+superseded ``target_id`` index is only dropped once the composite index exists.
+
+Polymorphic multiobject through tables have no ``target_id`` column and are
+handled by migration 0025.  The reverse is a no-op.
+"""
+
+from django.db import migrations
+
+
+def add_m2m_reverse_lookup_indexes(apps, schema_editor):
+    """Build the (target_id, source_id) index on each existing non-polymorphic through table."""
+    from netbox_custom_objects.field_types import (  # noqa: PLC0415
+        M2M_REVERSE_INDEX_COLUMNS,
+        get_m2m_reverse_index_name,
+        safe_table_name,
+    )
+
+    CustomObjectTypeField = apps.get_model("netbox_custom_objects", "CustomObjectTypeField")
+    fields = CustomObjectTypeField.objects.filter(type="multiobject", is_polymorphic=False)
+    connection = schema_editor.connection
+    qn = schema_editor.quote_name
+
+    with connection.cursor() as cursor:
+        existing_tables = set(connection.introspection.table_names(cursor))
+        for field in fields:
+            table_name = safe_table_name(f"custom_objects_{field.custom_object_type_id}_{field.name}")
+            if table_name not in existing_tables:
+                continue
+            index_name = get_m2m_reverse_index_name(table_name)
+
+            cursor.execute("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)", [qn(index_name)])
+            row = cursor.fetchone()
+            if row is not None and not row[0]:
+                # Left over from an interrupted concurrent build.
+                cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {qn(index_name)}")
+
+            constraints = connection.introspection.get_constraints(cursor, table_name)
+            # Matched by columns rather than name: a field renamed after its
+            # table was created keeps the index under the old name.
+            if not any(c["index"] and c["columns"] == M2M_REVERSE_INDEX_COLUMNS for c in constraints.values()):
+                cursor.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {qn(index_name)} "
+                    f"ON {qn(table_name)} (target_id, source_id)"
+                )
+
+            for name, constraint in constraints.items():
+                if (
+                    constraint["index"]
+                    and not constraint["unique"]
+                    and not constraint["primary_key"]
+                    and constraint["columns"] == ["target_id"]
+                ):
+                    cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {qn(name)}")
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("netbox_custom_objects", "0025_polymorphic_m2m_lookup_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_m2m_reverse_lookup_indexes, migrations.RunPython.noop, atomic=False),
+    ]
@@ -3,6 +3,7 @@ import decimal
 import logging
 import re
 import threading
+import time
 from datetime import date, datetime
 
 from packaging.version import Version, InvalidVersion
@@ -16,6 +17,7 @@ from django.conf import settings
 
 # from django.contrib.contenttypes.management import create_contenttypes
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist
 from django.core.validators import RegexValidator, ValidationError
 from django.db import DEFAULT_DB_ALIAS, connection, connections, IntegrityError, models, transaction
@@ -23,7 +25,7 @@ from django.db.utils import OperationalError, ProgrammingError
 from django.db.models import Q
 from django.db.models.fields.related import ForeignKey, ManyToManyField
 from django.db.models.functions import Lower
-from django.db.models.signals import m2m_changed, pre_delete, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
@@ -79,13 +81,23 @@ from netbox_custom_objects.field_types import (
     FIELD_TYPE_CLASS, LazyForeignKey, safe_table_name,
     PolymorphicObjectReverseDescriptor, PolymorphicMultiObjectReverseDescriptor,
 )
-from netbox_custom_objects.jobs import ReindexCustomObjectTypeJob
+from netbox_custom_objects.indexes import (
+    build_index,
+    normalize_index_definitions,
+    remove_field_from_indexes,
+    rename_field_in_indexes,
+    sync_indexes,
+    validate_index_definitions,
+)
+from netbox_custom_objects.jobs import RebuildSearchVectorJob, ReindexCustomObjectTypeJob
 from netbox_custom_objects.mixin_migration import heal_unmasked_fields
+from netbox_custom_objects.search_vector import drop_search_vector, search_vector_reads
 from netbox_custom_objects.utilities import (
     _suppress_clear_cache,
     extract_cot_id_from_model_name,
     generate_model,
 )
+from netbox_custom_objects.write_version import schedule_write_version_bump
 
 logger = logging.getLogger(__name__)
 
@@ -454,6 +466,34 @@ def _schema_alter_field(old_fi, new_fi, model, schema_editor, schema_conn, exist
     schema_editor.alter_field(model, old_mf, new_mf)
 
 
+def _schema_sync_field_index(old_fi, new_fi, model, schema_editor, schema_conn):
+    """Create, drop or replace the indexes declared by ``indexed`` and
+    ``trigram_indexed``; idempotent.
+
+    *old_fi* is None for a new field.  Call after the column is added or
+    altered, so *model* carries the field under its new name.  An index that
+    only needs to follow a rename is left alone — PostgreSQL carries it over.
+    """
+    new_indexes = {i.name: i for i in FIELD_TYPE_CLASS[new_fi.type]().get_indexes(new_fi)}
+    old_indexes = (
+        {i.name: i for i in FIELD_TYPE_CLASS[old_fi.type]().get_indexes(old_fi)}
+        if old_fi is not None else {}
+    )
+    if not new_indexes and not old_indexes:
+        return
+
+    with schema_conn.cursor() as cursor:
+        existing = schema_conn.introspection.get_constraints(cursor, model._meta.db_table)
+    for name, old_index in old_indexes.items():
+        new_index = new_indexes.get(name)
+        if name in existing and (new_index is None or type(new_index) is not type(old_index)):
+            schema_editor.remove_index(model, old_index)
+            del existing[name]
+    for name, new_index in new_indexes.items():
+        if name not in existing:
+            schema_editor.add_index(model, new_index)
+
+
 def _rename_or_create_m2m_through(old_fi, new_fi, model, schema_editor, schema_conn, existing_tables):
     """Rename the through-table for a renamed M2M field, or create the new one
     if the old table is absent (sync/merge against a schema that never had it).
@@ -586,6 +626,33 @@ def _set_with_collision_preference(result, key, value):
     result[key] = value
 
 
+class CustomObjectQuerySet(RestrictedQuerySet):
+    """
+    Queryset of the generated custom object models.
+
+    ``update()`` (which ``bulk_update()`` also goes through) and
+    ``bulk_create()`` write rows without sending model signals, so they bump
+    the type's write version themselves.
+    """
+
+    def _bump_write_version(self):
+        cot_id = _custom_object_type_id_for(self.model)
+        if cot_id is not None:
+            schedule_write_version_bump(cot_id, using=self.db)
+
+    def update(self, **kwargs):
+        rows = super().update(**kwargs)
+        if rows:
+            self._bump_write_version()
+        return rows
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        if objs:
+            self._bump_write_version()
+        return objs
+
+
 class CustomObject(
     OwnerMixin,
     BookmarksMixin,
@@ -625,7 +692,7 @@ class CustomObject(
         _generated_table_model (property): Indicates this is a generated table model
     """
 
-    objects = RestrictedQuerySet.as_manager()
+    objects = CustomObjectQuerySet.as_manager()
 
     class Meta:
         abstract = True
@@ -1201,6 +1268,37 @@ class CustomObjectType(NetBoxModel):
             "Can only be set when the type is created."
         ),
     )
+    restrict_quick_search = models.BooleanField(
+        default=False,
+        verbose_name=_("restrict quick search"),
+        help_text=_(
+            "Limit the quick search (q) filter to fields with a non-zero search weight. "
+            "By default it searches every text, choice, numeric and date field."
+        ),
+    )
+    full_text_search = models.BooleanField(
+        default=False,
+        verbose_name=_("full-text search"),
+        help_text=_(
+            "Serve the quick search (q) filter from an indexed full-text search column built "
+            "from the fields with a non-zero search weight. The column is built in the background."
+        ),
+    )
+    search_vector_signature = models.TextField(
+        blank=True,
+        editable=False,
+        help_text=_("The searchable fields the full-text search column was last built from."),
+    )
+    indexes = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name=_("indexes"),
+        help_text=_(
+            "Named composite indexes, each a list of fields with an optional partial condition on "
+            'select fields, e.g. [{"name": "site_status", "fields": ["site", "status"], '
+            '"condition": {"status": ["active"]}}]'
+        ),
+    )
 
     class Meta:
         verbose_name = "Custom Object Type"
@@ -1247,6 +1345,11 @@ class CustomObjectType(NetBoxModel):
                     )
                 })
 
+        if self.indexes:
+            fields = self.fields.select_related("choice_set") if self.pk else []
+            validate_index_definitions(self.indexes, fields)
+            self.indexes = normalize_index_definitions(self.indexes)
+
         # Enforce max number of COTs that may be created (max_custom_object_types)
         if not self.pk:
             max_cots = get_plugin_config("netbox_custom_objects", "max_custom_object_types")
@@ -1292,6 +1395,8 @@ class CustomObjectType(NetBoxModel):
             else:
                 cls._model_cache.clear()
                 cls._through_model_cache.clear()
+            # A stale cache_timestamp may mean another worker changed a field's targets.
+            _forget_referencing_types()
 
         # Clear Django apps registry cache to ensure newly created models are recognized
         apps.get_models.cache_clear()
@@ -1694,7 +1799,10 @@ class CustomObjectType(NetBoxModel):
         # Generate the model outside the lock to avoid holding it during expensive operations
         model_name = self.get_table_model_name(self.pk)
 
-        # TODO: Add other fields with "index" specified
+        # Per-field indexes (CustomObjectTypeField.indexed/trigram_indexed) and the type's
+        # composite indexes, filled in once the fields are generated below.  The
+        # DDL is done by the save paths; declaring them keeps _meta in step
+        # with the table.
         indexes = []
 
         meta = type(
@@ -1727,6 +1835,9 @@ class CustomObjectType(NetBoxModel):
         )
 
         attrs.update(**field_attrs)
+        for field_object in field_attrs["_field_objects"].values():
+            indexes.extend(field_object["type"].get_indexes(field_object["field"]))
+        indexes.extend(build_index(self, definition) for definition in self.indexes or [])
 
         # Track which fields were skipped due to recursion for after_model_generation
         if '_skipped_fields' not in attrs:
@@ -2029,13 +2140,55 @@ class CustomObjectType(NetBoxModel):
     def save(self, *args, **kwargs):
         needs_db_create = self._state.adding
 
-        super().save(*args, **kwargs)
-
+        # Switching full-text search on or off (re)builds or drops the search
+        # vector column in the background, and changed index definitions are
+        # applied to the table.  Field saves only bump cache_timestamp through
+        # update_fields, so skip the lookup for them.
+        update_fields = kwargs.get("update_fields")
+        saves_full_text_search = update_fields is None or "full_text_search" in update_fields
+        saves_indexes = update_fields is None or "indexes" in update_fields
+        previous = None
+        if not needs_db_create and (saves_full_text_search or saves_indexes):
+            previous = CustomObjectType.objects.filter(pk=self.pk).values(
+                "full_text_search", "indexes"
+            ).first()
         if needs_db_create:
-            self.create_model()
+            full_text_search_changed = self.full_text_search
+        else:
+            full_text_search_changed = bool(
+                previous and saves_full_text_search and previous["full_text_search"] != self.full_text_search
+            )
+        old_indexes = previous["indexes"] if previous else []
+        indexes_changed = (
+            (needs_db_create or (previous is not None and saves_indexes))
+            and normalize_index_definitions(old_indexes) != normalize_index_definitions(self.indexes)
+        )
+
+        if indexes_changed:
+            # Index DDL and the row share one atomic, so a definition the
+            # database rejects is not persisted either.
+            schema_conn = _get_schema_connection()
+            with transaction.atomic(using=schema_conn.alias):
+                super().save(*args, **kwargs)
+                if needs_db_create:
+                    self.create_model()
+                else:
+                    self.clear_model_cache(self.id)
+                model = self.get_model()
+                with schema_conn.schema_editor() as schema_editor:
+                    sync_indexes(self, model, old_indexes, self.indexes, schema_editor)
         else:
-            # Clear the model cache when the CustomObjectType is modified
-            self.clear_model_cache(self.id)
+            super().save(*args, **kwargs)
+
+            if needs_db_create:
+                self.create_model()
+            else:
+                # Clear the model cache when the CustomObjectType is modified
+                self.clear_model_cache(self.id)
+
+        if full_text_search_changed:
+            _cot_id = self.id
+            transaction.on_commit(lambda: RebuildSearchVectorJob.enqueue(cot_id=_cot_id))
 
     def delete(self, *args, **kwargs):
         # COT is going away — every branch's cached class is stale.
@@ -2320,6 +2473,22 @@ class CustomObjectTypeField(CloningMixin, ExportTemplatesMixin, ChangeLoggedMode
         default=False,
         help_text=_("The value of this field must be unique for the assigned object"),
     )
+    indexed = models.BooleanField(
+        verbose_name=_("indexed"),
+        default=False,
+        help_text=_(
+            "Create a database index on this field to speed up filtering and ordering by it "
+            "(GIN for multiple selection and JSON fields)"
+        ),
+    )
+    trigram_indexed = models.BooleanField(
+        verbose_name=_("trigram indexed"),
+        default=False,
+        help_text=_(
+            "Create a trigram (pg_trgm) index on this field so case-insensitive substring "
+            "filters (contains, starts with, ends with) can use an index on large types"
+        ),
+    )
     search_weight = models.PositiveSmallIntegerField(
         verbose_name=_("search weight"),
         default=500,
@@ -2678,6 +2847,30 @@ class CustomObjectTypeField(CloningMixin, ExportTemplatesMixin, ChangeLoggedMode
                 }
             )
 
+        # Only types with a single indexable column can be indexed; unique fields
+        # already have the unique constraint's index.
+        if self.indexed:
+            if FIELD_TYPE_CLASS[self.type].index_type is None or self.is_polymorphic:
+                raise ValidationError(
+                    {"indexed": _("Fields of type {type} cannot be indexed").format(type=self.get_type_display())}
+                )
+            if self.unique:
+                raise ValidationError(
+                    {"indexed": _("Unique fields are indexed by their uniqueness constraint")}
+                )
+
+        # Trigram indexes serve the case-insensitive substring filters of text-like
+        # fields; with filtering disabled there is nothing for them to serve.
+        if self.trigram_indexed:
+            if not FIELD_TYPE_CLASS[self.type].trigram_indexable or self.is_polymorphic:
+                raise ValidationError(
+                    {"trigram_indexed": _("Trigram indexes are supported only for text, long text and URL fields")}
+                )
+            if self.filter_logic == CustomFieldFilterLogicChoices.FILTER_DISABLED:
+                raise ValidationError(
+                    {"trigram_indexed": _("Trigram indexes serve filters; filtering is disabled for this field")}
+                )
+
         # Uniqueness can not be enforced for boolean or multiobject fields
         if self.unique and self.type in [CustomFieldTypeChoices.TYPE_BOOLEAN, CustomFieldTypeChoices.TYPE_MULTIOBJECT]:
             raise ValidationError(
@@ -3560,6 +3753,7 @@ class CustomObjectTypeField(CloningMixin, ExportTemplatesMixin, ChangeLoggedMode
                             field_type.create_polymorphic_m2m_table(self, model, schema_editor)
                     else:
                         _schema_add_field(self, model, schema_editor, schema_conn)
+                        _schema_sync_field_index(None, self, model, schema_editor, schema_conn)
                         _apply_deferred_co_field(self)
                 else:
                     if self.type == CustomObjectFieldTypeChoices.TYPE_COORDINATES:
@@ -3580,7 +3774,18 @@ class CustomObjectTypeField(CloningMixin, ExportTemplatesMixin, ChangeLoggedMode
                                 {"name": _("Cannot rename a polymorphic field after creation.")}
                             )
                     else:
+                        # PostgreSQL refuses to change the type of a column the
+                        # generated search vector reads; drop the vector first
+                        # (it is rebuilt in the background, see below) and clear
+                        # its signature so ``q`` falls back until then.
+                        if self.type != self._original_type and search_vector_reads(self.custom_object_type, self):
+                            drop_search_vector(model, schema_editor)
+                            CustomObjectType.objects.using(schema_conn.alias).filter(
+                                pk=self.custom_object_type_id
+                            ).update(search_vector_signature="")
+                            self.custom_object_type.search_vector_signature = ""
                         _schema_alter_field(self.original, self, model, schema_editor, schema_conn)
+                        _schema_sync_field_index(self.original, self, model, schema_editor, schema_conn)
 
             # Rewrite historical audit-data keys so any future replay can
             # resolve old or new name to the current field name.
@@ -3590,6 +3795,15 @@ class CustomObjectTypeField(CloningMixin, ExportTemplatesMixin, ChangeLoggedMode
                 and self._original_name != self.name
             ):
                 _rename_objectchange_field_key(self, self._original_name, self.name)
+                # PostgreSQL carries the type's composite indexes over to the
+                # renamed column; only their definitions need the new name.
+                if self.custom_object_type.indexes:
+                    self.custom_object_type.indexes = rename_field_in_indexes(
+                        self.custom_object_type.indexes, self._original_name, self.name
+                    )
+                    CustomObjectType.objects.using(schema_conn.alias).filter(
+                        pk=self.custom_object_type_id
+                    ).update(indexes=self.custom_object_type.indexes)
 
             # FK-constraint decision inside the atomic so a rollback discards it too.
             should_ensure_fk = False
@@ -3674,6 +3888,13 @@ class CustomObjectTypeField(CloningMixin, ExportTemplatesMixin, ChangeLoggedMode
         if needs_reindex:
             _cot_id = self.custom_object_type_id
             transaction.on_commit(lambda: ReindexCustomObjectTypeJob.enqueue(cot_id=_cot_id))
+        # The search vector's expression is fixed at build time, so it is
+        # rebuilt whenever the set of searchable fields (or their types) changes.
+        if self.custom_object_type.full_text_search and (
+            needs_reindex or (not is_new and self.type != self._original_type)
+        ):
+            _cot_id = self.custom_object_type_id
+            transaction.on_commit(lambda: RebuildSearchVectorJob.enqueue(cot_id=_cot_id))
 
     def delete(self, *args, **kwargs):
         field_type = FIELD_TYPE_CLASS[self.type]()
@@ -3725,6 +3946,16 @@ class CustomObjectTypeField(CloningMixin, ExportTemplatesMixin, ChangeLoggedMode
                     del apps.all_models[APP_LABEL][through_name]
             apps.clear_cache()
 
+        # The column's composite indexes were dropped with it; forget their
+        # definitions.  update() rather than save(): there is no DDL to run.
+        if self.custom_object_type.indexes:
+            remaining = remove_field_from_indexes(self.custom_object_type.indexes, self.name)
+            if remaining != self.custom_object_type.indexes:
+                self.custom_object_type.indexes = remaining
+                CustomObjectType.objects.using(schema_conn.alias).filter(
+                    pk=self.custom_object_type_id
+                ).update(indexes=remaining)
+
         # Clear the model cache for this CustomObjectType when a field is deleted
         self.custom_object_type.clear_model_cache(self.custom_object_type.id)
 
@@ -3745,6 +3976,10 @@ class CustomObjectTypeField(CloningMixin, ExportTemplatesMixin, ChangeLoggedMode
         if self.search_weight > 0:
             _cot_id = self.custom_object_type_id
             transaction.on_commit(lambda: ReindexCustomObjectTypeJob.enqueue(cot_id=_cot_id))
+            # Dropping the column took the search vector with it (DROP COLUMN
+            # ... CASCADE); q falls back to per-field search until it is rebuilt.
+            if self.custom_object_type.full_text_search:
+                transaction.on_commit(lambda: RebuildSearchVectorJob.enqueue(cot_id=_cot_id))
 
 
 class CustomObjectObjectTypeManager(ObjectTypeManager):
@@ -4008,3 +4243,120 @@ def clear_cache_on_field_delete(sender, instance, **kwargs):
     """
     if instance.custom_object_type_id:
         CustomObjectType.clear_model_cache(instance.custom_object_type_id)
+
+
+# Write-version counters (see write_version.py).  Connected without a sender
+# because generated models are created at runtime; the isinstance() checks keep
+# the cost for unrelated NetBox models to a single type test.
+
+
+def _custom_object_type_id_for(model):
+    cot = getattr(model, "custom_object_type", None)
+    return getattr(cot, "pk", None)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def bump_write_version_on_custom_object_write(sender, instance, using=None, **kwargs):
+    """Bump the owning type's write version after a custom object is saved or deleted."""
+    if not isinstance(instance, CustomObject):
+        return
+    cot_id = _custom_object_type_id_for(sender)
+    if cot_id is not None:
+        schedule_write_version_bump(cot_id, using=using)
+
+
+_REFERENCING_TYPES_CACHE_KEY = "netbox_custom_objects:referencing_types"
+# Backstop only: the map is invalidated when object fields change.
+_REFERENCING_TYPES_CACHE_TIMEOUT = 300
+# Per-process copy of the map, keyed like the shared entry: {key: (expires_at, map)}.
+# Dropped when a field changes in this process or a stale cache_timestamp is seen;
+# the short timeout bounds how long a change made by another worker goes unnoticed.
+_referencing_types_local = {}
+_REFERENCING_TYPES_LOCAL_TIMEOUT = 60
+
+
+def _referencing_types_cache_key():
+    branch_id = CustomObjectType._active_branch_id()
+    return f"{_REFERENCING_TYPES_CACHE_KEY}:{branch_id if branch_id is not None else 'main'}"
+
+
+def _forget_referencing_types():
+    _referencing_types_local.clear()
+
+
+def _referencing_type_ids(content_type_id):
+    """
+    Return the ids of the custom object types with an object or multi-object
+    field that can point at ``content_type_id``.
+
+    The map is held in process, so a save of a model that no field references
+    touches neither the shared cache nor the database.  On a local miss it is
+    read from the shared cache, and built from the fields only if that misses too.
+    """
+    key = _referencing_types_cache_key()
+    entry = _referencing_types_local.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1].get(content_type_id, ())
+    referencing = cache.get(key)
+    if referencing is None:
+        referencing = {}
+        rows = CustomObjectTypeField.objects.filter(
+            type__in=[CustomFieldTypeChoices.TYPE_OBJECT, CustomFieldTypeChoices.TYPE_MULTIOBJECT],
+        ).values_list("custom_object_type_id", "related_object_type_id", "related_object_types")
+        for cot_id, related_object_type_id, related_object_types_id in rows:
+            for target in (related_object_type_id, related_object_types_id):
+                if target is not None:
+                    referencing.setdefault(target, set()).add(cot_id)
+        cache.set(key, referencing, _REFERENCING_TYPES_CACHE_TIMEOUT)
+    _referencing_types_local[key] = (time.monotonic() + _REFERENCING_TYPES_LOCAL_TIMEOUT, referencing)
+    return referencing.get(content_type_id, ())
+
+
+@receiver(post_save, sender=CustomObjectTypeField)
+@receiver(post_delete, sender=CustomObjectTypeField)
+@receiver(m2m_changed, sender=CustomObjectTypeField.related_object_types.through)
+def invalidate_referencing_types(sender, **kwargs):
+    """Drop the map of referencing types when an object field may have changed its targets."""
+    _forget_referencing_types()
+    cache.delete(_referencing_types_cache_key())
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def bump_write_version_on_referenced_object_write(sender, instance, using=None, **kwargs):
+    """
+    Bump the write versions of the types whose rows reference objects of
+    ``sender`` when one is saved or deleted.
+
+    List rows embed a nested representation (``display``, ``name``) of the
+    objects they reference, and deleting a referenced object nulls ``SET_NULL``
+    references through the deletion collector, which sends no signal for the
+    referencing rows.
+    """
+    from netbox_custom_objects import _is_migrating  # noqa: PLC0415
+
+    if _is_migrating.get() or sender is ObjectChange or sender._meta.auto_created:
+        return
+    content_type_id = ContentType.objects.get_for_model(sender).pk
+    for cot_id in _referencing_type_ids(content_type_id):
+        schedule_write_version_bump(cot_id, using=using)
+
+
+@receiver(m2m_changed)
+def bump_write_version_on_custom_object_m2m(sender, instance, action, model, using=None, **kwargs):
+    """Bump write versions when a custom object's relationships (or tags) change.
+
+    Covers both directions: the source instance (forward managers, tags) and,
+    for reverse managers, the custom object model on the other side.
+    """
+    if not action.startswith("post_"):
+        return
+    cot_ids = set()
+    if isinstance(instance, CustomObject):
+        cot_ids.add(_custom_object_type_id_for(type(instance)))
+    if isinstance(model, type) and issubclass(model, CustomObject):
+        cot_ids.add(_custom_object_type_id_for(model))
+    cot_ids.discard(None)
+    for cot_id in cot_ids:
+        schedule_write_version_bump(cot_id, using=using)
@@ -0,0 +1,163 @@
+"""
+Approximate row counts for custom object list views.
+
+Every paginated list of a custom object type normally runs an exact
+``SELECT count(*)`` over ``custom_objects_<id>``, which dominates response time
+on tables with tens of millions of rows.  When the ``approximate_count_threshold``
+plugin setting is configured, list views ask PostgreSQL for an estimate first:
+
+* unfiltered querysets use ``pg_class.reltuples`` (maintained by VACUUM/ANALYZE);
+* filtered querysets use the planner's row estimate from ``EXPLAIN``.
+
+If the estimate is at least the threshold it is used as the count and the
+response is flagged as approximate; otherwise the exact count runs as before,
+so small tables and selective filters keep precise numbers.
+"""
+import json
+import logging
+
+from django.db import connections
+from django.db.utils import DatabaseError
+from django.utils.functional import cached_property
+from netbox.api.pagination import OptionalLimitOffsetPagination
+from netbox.plugins import get_plugin_config
+from utilities.paginator import EnhancedPaginator
+
+__all__ = (
+    "ApproximateCountLimitOffsetPagination",
+    "ApproximateCountPaginator",
+    "estimate_count",
+    "get_approximate_count_threshold",
+    "get_list_count",
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_approximate_count_threshold():
+    """Return the configured threshold, or ``None`` when the feature is disabled."""
+    threshold = get_plugin_config("netbox_custom_objects", "approximate_count_threshold")
+    if threshold is None:
+        return None
+    try:
+        return max(int(threshold), 0)
+    except (TypeError, ValueError):
+        logger.warning("approximate_count_threshold=%r is not an integer; ignoring", threshold)
+        return None
+
+
+def _is_unfiltered(queryset):
+    query = queryset.query
+    return not query.where and not query.distinct and not query.is_sliced and not query.combinator
+
+
+def estimate_count(queryset):
+    """
+    Return PostgreSQL's row estimate for ``queryset``, or ``None`` if unavailable.
+
+    The estimate is read on the queryset's own database alias so that, under
+    netbox-branching, the branch schema's table statistics are used.
+    """
+    connection = connections[queryset.db]
+    try:
+        with connection.cursor() as cursor:
+            if _is_unfiltered(queryset):
+                # to_regclass() honours search_path (branch schemas) and returns
+                # NULL rather than raising if the table is missing.
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                    [connection.ops.quote_name(queryset.model._meta.db_table)],
+                )
+                row = cursor.fetchone()
+                # reltuples is -1 for a table that has never been vacuumed or analyzed.
+                if row is None or row[0] is None or row[0] < 0:
+                    return None
+                return int(row[0])
+
+            sql, params = queryset.order_by().query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+    except (DatabaseError, LookupError, TypeError, ValueError) as exc:
+        logger.debug("count estimate for %s failed: %s", queryset.model._meta.db_table, exc)
+        return None
+
+
+def get_list_count(queryset):
+    """
+    Count ``queryset`` for pagination, returning ``(count, is_approximate)``.
+
+    Falls back to an exact ``count()`` when the feature is disabled, no
+    estimate is available, or the estimate is below the threshold.
+    """
+    threshold = get_approximate_count_threshold()
+    if threshold is not None:
+        estimate = estimate_count(queryset)
+        if estimate is not None and estimate >= threshold:
+            return estimate, True
+    return queryset.count(), False
+
+
+class ApproximateCountPaginator(EnhancedPaginator):
+    """
+    UI paginator that counts via :func:`get_list_count`.
+
+    django-tables2 hands the paginator its ``BoundRows`` wrapper rather than the
+    queryset, so the underlying queryset is unwrapped from ``rows.data.data``.
+    ``count_is_approximate`` is exposed for the list template.
+    """
+
+    count_is_approximate = False
+
+    @cached_property
+    def count(self):
+        table_data = getattr(self.object_list, "data", None)
+        queryset = getattr(table_data, "data", None)
+        if not hasattr(queryset, "query"):
+            return super().count
+        count, self.count_is_approximate = get_list_count(queryset)
+        return count
+
+
+class ApproximateCountLimitOffsetPagination(OptionalLimitOffsetPagination):
+    """
+    REST pagination that counts via :func:`get_list_count`.
+
+    When the feature is enabled, list responses carry a ``count_is_approximate``
+    flag next to ``count``.
+    """
+
+    count_is_approximate = False
+
+    def get_queryset_count(self, queryset):
+        count, self.count_is_approximate = get_list_count(queryset)
+        return count
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page = super().paginate_queryset(queryset, request, view)
+        if self.count_is_approximate:
+            if self.count == 0 or self.offset > self.count:
+                # super() returns an empty page without querying when the offset
+                # is past the count, but an estimate may be too low: fetch the
+                # page regardless.
+                end = self.offset + self.limit if self.limit else None
+                page = list(queryset[self.offset:end])
+            # Keep next/previous links coherent with what was actually returned:
+            # a full page implies at least one more row, whatever the estimate says.
+            seen = self.offset + len(page)
+            if self.limit and len(page) == self.limit:
+                seen += 1
+            self.count = max(self.count, seen)
+        return page
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if get_approximate_count_threshold() is not None:
+            response.data = {
+                "count": response.data["count"],
+                "count_is_approximate": self.count_is_approximate,
+                **{k: v for k, v in response.data.items() if k != "count"},
+            }
+        return response
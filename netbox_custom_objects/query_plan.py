@@ -0,0 +1,232 @@
+"""
+Query plan inspection for custom object list filters.
+
+:func:`explain_list_query` builds the queryset the REST list endpoint
+(``CustomObjectViewSet``) would run for a set of query parameters — the
+type's generated FilterSet applied to ``custom_objects_<id>``, then the
+``ordering`` parameter as DRF's ``OrderingFilter`` applies it, then one page
+of results — and returns its SQL, PostgreSQL's plan for it, the indexes the
+plan uses and suggestions for fields worth indexing.  The polymorphic
+multi-object relations the list endpoint prefetches are separate queries,
+not part of the plan; they are listed under ``prefetch_related``.
+
+The plan is requested as ``EXPLAIN (FORMAT JSON)``.  With ``analyze`` the
+query is executed (``EXPLAIN ANALYZE``, with buffer statistics) under a
+statement timeout, inside a transaction that is rolled back.
+
+Suggestions are made only when the plan reads the type's table with a
+sequential scan, and only for fields filtered on: ``indexed`` for equality
+and range filters, ``trigram_indexed`` for case-insensitive substring filters
+and ``full_text_search`` on the type for the quick search (``q``).  On a small
+table PostgreSQL prefers a sequential scan whatever indexes exist, so the
+suggestions matter for large tables.
+
+Exposed through the staff-only ``<slug>/explain/`` API endpoint and the
+``explain_custom_objects`` management command.
+"""
+import json
+import logging
+
+from django.core.exceptions import ValidationError
+from django.db import connections, router, transaction
+from django.utils.translation import gettext as _
+from extras.choices import CustomFieldFilterLogicChoices, CustomFieldTypeChoices
+from netbox.config import get_config
+from rest_framework.settings import api_settings
+
+from netbox_custom_objects.field_types import FIELD_TYPE_CLASS, get_polymorphic_m2m_field_names
+from netbox_custom_objects.filtersets import get_filterset_class
+
+__all__ = (
+    "EXPLAIN_STATEMENT_TIMEOUT",
+    "ORDERING_PARAMETER",
+    "PAGINATION_PARAMETERS",
+    "explain_list_query",
+    "format_plan",
+)
+
+logger = logging.getLogger(__name__)
+
+# Milliseconds an EXPLAIN ANALYZE may run before PostgreSQL cancels it.
+EXPLAIN_STATEMENT_TIMEOUT = 30_000
+
+# Query parameters that select the page rather than filter the rows.
+PAGINATION_PARAMETERS = ("limit", "offset")
+
+# Query parameter that orders the rows (DRF's OrderingFilter).
+ORDERING_PARAMETER = api_settings.ORDERING_PARAM
+
+# FilterSet lookup suffixes compiled to UPPER(col) LIKE / = UPPER(value),
+# which a trigram index serves and a B-tree index does not.
+_SUBSTRING_LOOKUPS = ("ic", "nic", "isw", "nisw", "iew", "niew", "ie", "nie")
+
+# Field types whose bare filter uses the field's filter logic.
+_TEXT_TYPES = (
+    CustomFieldTypeChoices.TYPE_TEXT,
+    CustomFieldTypeChoices.TYPE_LONGTEXT,
+    CustomFieldTypeChoices.TYPE_URL,
+)
+
+
+def _page_bounds(params):
+    """Return ``(offset, limit)`` as the list endpoint's paginator would apply them."""
+    config = get_config()
+    try:
+        limit = int(params.get("limit", config.PAGINATE_COUNT))
+        offset = int(params.get("offset", 0))
+    except (TypeError, ValueError):
+        raise ValidationError(_("limit and offset must be integers."))
+    max_page_size = config.MAX_PAGE_SIZE or 1000
+    if limit <= 0 or limit > max_page_size:
+        limit = max_page_size
+    return max(offset, 0), limit
+
+
+def _ordering(model, params):
+    """
+    Return the ``ordering`` terms the list endpoint's ``OrderingFilter`` would
+    apply, dropping terms that do not name a field as it does.
+    """
+    names = {field.name for field in model._meta.concrete_fields}
+    terms = [term.strip() for term in params.get(ORDERING_PARAMETER, "").split(",")]
+    return [term for term in terms if term.lstrip("-") in names]
+
+
+def _walk(node):
+    yield node
+    for child in node.get("Plans", ()):
+        yield from _walk(child)
+
+
+def _plan_summary(plan, table):
+    """Return ``(indexes used, whether ``table`` is read by a sequential scan)``."""
+    indexes = []
+    seq_scan = False
+    for node in _walk(plan):
+        if node.get("Index Name") and node["Index Name"] not in indexes:
+            indexes.append(node["Index Name"])
+        if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") == table:
+            seq_scan = True
+    return indexes, seq_scan
+
+
+def _suggestions(custom_object_type, fields, params):
+    """Index suggestions for the fields ``params`` filter on."""
+    fields_by_name = {field.name: field for field in fields}
+    suggestions = []
+    seen = set()
+
+    def suggest(name, attribute, reason):
+        if (name, attribute) not in seen:
+            seen.add((name, attribute))
+            suggestions.append({"field": name, "attribute": attribute, "reason": reason})
+
+    for key in params:
+        if key in PAGINATION_PARAMETERS or key == ORDERING_PARAMETER:
+            continue
+        if key == "q":
+            if not custom_object_type.full_text_search:
+                suggest(None, "full_text_search", _(
+                    "The quick search is matched against every searchable field; enable full-text search "
+                    "on the type to serve it from an index."
+                ))
+            continue
+        name, _sep, lookup = key.partition("__")
+        field = fields_by_name.get(name)
+        if field is None or field.is_polymorphic:
+            continue
+        field_type = FIELD_TYPE_CLASS[field.type]
+        substring = lookup in _SUBSTRING_LOOKUPS or (
+            not lookup and field.type in _TEXT_TYPES
+            and field.filter_logic == CustomFieldFilterLogicChoices.FILTER_LOOSE
+        )
+        if substring:
+            if field_type.trigram_indexable and not field.trigram_indexed:
+                suggest(field.name, "trigram_indexed", _(
+                    "Case-insensitive substring filters cannot use a B-tree index; a trigram index serves them."
+                ))
+        elif field_type.index_type and not field.indexed and not field.unique:
+            suggest(field.name, "indexed", _("Filtered on without an index."))
+    return suggestions
+
+
+def explain_list_query(custom_object_type, params, analyze=False, using=None):
+    """
+    Explain the list query for ``custom_object_type`` filtered by ``params``
+    (a ``QueryDict`` or mapping of query parameters).
+
+    Returns a dict with ``sql`` and ``params`` (the page query), ``plan`` (the
+    JSON plan's root node), ``indexes_used``, ``sequential_scan``,
+    ``suggestions`` and ``prefetch_related``; with ``analyze``, also
+    ``planning_time`` and ``execution_time`` in milliseconds.  Raises
+    ``ValidationError`` for invalid filter parameters.
+    """
+    model = custom_object_type.get_model()
+    prefetches = get_polymorphic_m2m_field_names(model)
+    queryset = model.objects.all()
+    if prefetches:
+        queryset = queryset.prefetch_related(*prefetches)
+    filterset = get_filterset_class(model)(params, queryset)
+    if not filterset.is_valid():
+        raise ValidationError(filterset.errors)
+    queryset = filterset.qs
+    if ordering := _ordering(model, params):
+        queryset = queryset.order_by(*ordering)
+    offset, limit = _page_bounds(params)
+    queryset = queryset[offset:offset + limit]
+
+    using = using or router.db_for_read(model)
+    connection = connections[using]
+    sql, sql_params = queryset.query.get_compiler(using=using).as_sql()
+    options = "FORMAT JSON, ANALYZE, BUFFERS" if analyze else "FORMAT JSON"
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        if analyze:
+            cursor.execute(f"SET LOCAL statement_timeout = {int(EXPLAIN_STATEMENT_TIMEOUT)}")
+        cursor.execute(f"EXPLAIN ({options}) {sql}", sql_params)
+        document = cursor.fetchone()[0]
+        # EXPLAIN ANALYZE executes the query; leave nothing it did behind.
+        transaction.set_rollback(True, using=using)
+    if isinstance(document, str):
+        document = json.loads(document)
+    result = document[0]
+
+    table = model._meta.db_table
+    indexes, seq_scan = _plan_summary(result["Plan"], table)
+    explanation = {
+        "sql": sql,
+        "params": [value if isinstance(value, (int, float, bool, type(None))) else str(value) for value in sql_params],
+        "plan": result["Plan"],
+        "indexes_used": indexes,
+        "sequential_scan": seq_scan,
+        "suggestions": (
+            _suggestions(custom_object_type, custom_object_type.fields.all(), params) if seq_scan else []
+        ),
+        "prefetch_related": prefetches,
+    }
+    if analyze:
+        explanation["planning_time"] = result.get("Planning Time")
+        explanation["execution_time"] = result.get("Execution Time")
+    logger.debug("Explained list query for custom object type %s: %s", custom_object_type.pk, sql)
+    return explanation
+
+
+def format_plan(plan, depth=0):
+    """Render a JSON plan node and its children as indented text lines, much like ``EXPLAIN``'s text format."""
+    label = plan["Node Type"]
+    if plan.get("Index Name"):
+        label += f" using {plan['Index Name']}"
+    if plan.get("Relation Name"):
+        label += f" on {plan['Relation Name']}"
+    label += f"  (cost={plan['Startup Cost']:.2f}..{plan['Total Cost']:.2f} rows={plan['Plan Rows']})"
+    if "Actual Total Time" in plan:
+        label += (
+            f" (actual time={plan['Actual Total Time']:.3f} rows={plan['Actual Rows']} loops={plan['Actual Loops']})"
+        )
+    indent = "  " * depth
+    lines = [f"{indent}{'-> ' if depth else ''}{label}"]
+    for key in ("Index Cond", "Recheck Cond", "Filter", "Join Filter", "Hash Cond"):
+        if key in plan:
+            lines.append(f"{indent}      {key}: {plan[key]}")
+    for child in plan.get("Plans", ()):
+        lines.extend(format_plan(child, depth + 1))
+    return lines
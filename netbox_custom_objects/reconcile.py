@@ -0,0 +1,288 @@
+"""
+Desired-state reconcile of a whole custom object type.
+
+The caller submits the complete set of rows a custom object type should
+contain, identified by a natural key (see :mod:`netbox_custom_objects.upsert`).
+The rows are staged in a temporary table with ``COPY`` and diffed against
+``custom_objects_<id>`` with set-based SQL:
+
+* rows whose key is absent from the table are inserted;
+* rows whose reconciled columns differ (``IS DISTINCT FROM``) are updated;
+* optionally, table rows whose key is absent from the input are deleted.
+
+Only the affected rows are loaded into Python, for their change log entries:
+updated rows are snapshotted before the ``UPDATE`` and ``post_save`` is sent
+for every inserted and updated row; deletions go through the ORM so cascades
+and ``pre_delete``/``post_delete`` behave as for any other delete.
+
+Reconciled columns are the fields named in the first row; every row must name
+the same fields.  Fields not named are left alone on update and take their
+default on insert.  Multi-object, polymorphic and tag fields cannot be
+reconciled.
+
+Values are validated as the API and forms validate them: the model field's
+``clean()`` (type conversion, choices, validators), then the custom field's
+own rules (``required``, choice set, regex, minimum and maximum).  References
+are checked with one query per related model.
+
+When reconciling for a ``user``, every row the reconcile would update, delete
+or create must be within the user's object permission constraints for that
+action, before and after the write; otherwise nothing is written.
+"""
+import logging
+import uuid
+
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied, ValidationError
+from django.db import connections, router, transaction
+from django.db.models.signals import post_save
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from netbox_custom_objects.upsert import natural_key_value, permitted_pks
+from netbox_custom_objects.write_version import schedule_write_version_bump
+
+__all__ = (
+    "ReconcileError",
+    "reconcile",
+)
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of per-row errors collected before giving up.
+MAX_REPORTED_ERRORS = 20
+
+
+class ReconcileError(Exception):
+    """The input could not be reconciled; ``errors`` lists ``(row index, message)``."""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("; ".join(f"row {index}: {message}" for index, message in errors))
+
+
+def _reconciled_fields(model, names, key_fields):
+    fields = []
+    for name in names:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            raise ReconcileError([(0, _("Unknown field: {name}").format(name=name))])
+        if not field.concrete or field.many_to_many or field.primary_key or field.name in ("created", "last_updated"):
+            raise ReconcileError([(0, _("Field {name} cannot be reconciled.").format(name=name))])
+        fields.append(field)
+    missing = [f.name for f in key_fields if f not in fields]
+    if missing:
+        raise ReconcileError([(0, _("Rows must include the key fields: {names}").format(names=", ".join(missing)))])
+    return fields
+
+
+def _convert(field, custom_field, raw):
+    """
+    Convert a raw input value of a non-relation field to its Python value,
+    validated by the model field and the custom field.
+    """
+    if raw == "":
+        raw = None
+    value = field.clean(raw, None)
+    if custom_field is not None:
+        custom_field.validate(value)
+    return value
+
+
+def _reference(field, custom_field, raw):
+    """Return the pk a raw relation value references (``None`` for none), without checking it exists."""
+    if isinstance(raw, dict):
+        raw = raw.get("id")
+    if raw is None or raw == "":
+        if custom_field is not None:
+            custom_field.validate(None)
+        return None
+    return field.target_field.to_python(raw)
+
+
+def _stage_rows(model, fields, key_fields, rows):
+    """Return ``[(db values...)]`` for ``rows``, raising ReconcileError on bad input."""
+    names = [f.name for f in fields]
+    key_positions = [fields.index(f) for f in key_fields]
+    custom_fields = {
+        custom_field.name: custom_field
+        for custom_field in model.custom_object_type.fields.select_related("choice_set")
+    }
+    staged = {}
+    errors = []
+    seen = set()
+    # related model -> {pk: [(row index, field name), ...]}
+    references = {}
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict) or sorted(row) != sorted(names):
+            errors.append((index, _("Every row must name exactly the fields: {names}").format(names=", ".join(names))))
+        else:
+            try:
+                values = []
+                for field in fields:
+                    raw = row[field.name]
+                    custom_field = custom_fields.get(field.name)
+                    if field in key_fields:
+                        values.append(natural_key_value(field, raw))
+                    elif field.is_relation:
+                        value = _reference(field, custom_field, raw)
+                        if value is not None:
+                            references.setdefault(field.related_model, {}).setdefault(value, []).append(
+                                (index, field.name)
+                            )
+                        values.append(value)
+                    else:
+                        values.append(_convert(field, custom_field, raw))
+            except (ValidationError, ValueError) as exc:
+                messages = getattr(exc, "messages", None) or [str(exc)]
+                errors.append((index, f"{field.name}: {' '.join(str(m) for m in messages)}"))
+            else:
+                key = tuple(values[position] for position in key_positions)
+                if key in seen:
+                    errors.append((index, _("Duplicate natural key.")))
+                else:
+                    seen.add(key)
+                    staged[index] = values
+        if len(errors) >= MAX_REPORTED_ERRORS:
+            break
+
+    # Reference existence, one query per related model.
+    for related_model, referenced in references.items():
+        existing = set(related_model._base_manager.filter(pk__in=list(referenced)).values_list("pk", flat=True))
+        for pk, uses in referenced.items():
+            if pk not in existing:
+                for index, name in uses:
+                    errors.append((index, f"{name}: " + _("Related object {pk} does not exist.").format(pk=pk)))
+    if errors:
+        raise ReconcileError(sorted(errors)[:MAX_REPORTED_ERRORS])
+    return list(staged.values())
+
+
+def _check_permitted(model, user, action, pks, using):
+    """Raise ``PermissionDenied`` unless ``user`` may ``action`` every row in ``pks``."""
+    pks = set(pks)
+    if pks - permitted_pks(model, user, action, pks, using):
+        raise PermissionDenied(
+            _("The reconcile would {action} objects outside your permissions.").format(action=action)
+        )
+
+
+def reconcile(model, key_fields, rows, delete=False, using=None, user=None):
+    """
+    Reconcile ``model``'s rows with ``rows`` and return the counts of each
+    action: ``{"created", "updated", "deleted", "unchanged"}``.
+
+    Runs in a single transaction.  Raises :class:`ReconcileError` if the input
+    is invalid, before anything is written, and ``PermissionDenied`` (rolling
+    everything back) if ``user`` is given and any affected row falls outside
+    the user's object permission constraints.
+    """
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    if not rows:
+        if not delete:
+            return {"created": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+        names = [f.name for f in key_fields]
+    else:
+        names = list(rows[0]) if isinstance(rows[0], dict) else []
+    fields = _reconciled_fields(model, names, key_fields)
+    staged = _stage_rows(model, fields, key_fields, rows)
+
+    table = qn(model._meta.db_table)
+    stage = qn(f"reconcile_{uuid.uuid4().hex}")
+    columns = [qn(f.column) for f in fields]
+    column_list = ", ".join(columns)
+    key_join = " AND ".join(f"t.{qn(f.column)} = s.{qn(f.column)}" for f in key_fields)
+    value_columns = [qn(f.column) for f in fields if f not in key_fields]
+
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        # CREATE TABLE AS ... WITH NO DATA copies the column types (and nothing
+        # else), so staged values are cast exactly as the real columns would be.
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {stage} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {table} WITH NO DATA"
+        )
+        with cursor.cursor.copy(f"COPY {stage} ({column_list}) FROM STDIN") as copy:
+            for values in staged:
+                copy.write_row([
+                    field.get_db_prep_save(value, connection) for field, value in zip(fields, values)
+                ])
+        cursor.execute(f"ANALYZE {stage}")
+
+        # Updates: snapshot the differing rows, then update them in one statement.
+        to_update = []
+        if value_columns:
+            distinct = (
+                f"({', '.join(f't.{c}' for c in value_columns)}) IS DISTINCT FROM "
+                f"({', '.join(f's.{c}' for c in value_columns)})"
+            )
+            cursor.execute(f"SELECT t.id FROM {table} t JOIN {stage} s ON {key_join} WHERE {distinct}")
+            to_update = list(model.objects.using(using).filter(pk__in=[r[0] for r in cursor.fetchall()]))
+            if user is not None:
+                _check_permitted(model, user, "change", [instance.pk for instance in to_update], using)
+            for instance in to_update:
+                instance.snapshot()
+            if to_update:
+                assignments = ", ".join(f"{c} = s.{c}" for c in value_columns)
+                cursor.execute(
+                    f"UPDATE {table} t SET {assignments}, {qn('last_updated')} = %s "
+                    f"FROM {stage} s WHERE {key_join} AND {distinct}",
+                    [timezone.now()],
+                )
+
+        # Inserts: columns that are not reconciled take the field default.
+        defaults = [
+            f for f in model._meta.concrete_fields
+            if not f.primary_key and f not in fields and f.name not in ("created", "last_updated")
+        ]
+        insert_columns = columns + [qn(f.column) for f in defaults] + [qn("created"), qn("last_updated")]
+        now = timezone.now()
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(insert_columns)}) "
+            f"SELECT {', '.join(f's.{c}' for c in columns)}"
+            f"{''.join(', %s' for _f in defaults)}, %s, %s "
+            f"FROM {stage} s WHERE NOT EXISTS (SELECT 1 FROM {table} t WHERE {key_join}) "
+            f"RETURNING id",
+            [f.get_db_prep_save(f.get_default(), connection) for f in defaults] + [now, now],
+        )
+        created_ids = [r[0] for r in cursor.fetchall()]
+        if user is not None:
+            _check_permitted(model, user, "add", created_ids, using)
+            _check_permitted(model, user, "change", [instance.pk for instance in to_update], using)
+
+        deleted = 0
+        if delete:
+            cursor.execute(
+                f"SELECT t.id FROM {table} t WHERE NOT EXISTS (SELECT 1 FROM {stage} s WHERE {key_join})"
+            )
+            delete_ids = [r[0] for r in cursor.fetchall()]
+            if user is not None:
+                _check_permitted(model, user, "delete", delete_ids, using)
+            for instance in model.objects.using(using).filter(pk__in=delete_ids):
+                instance.snapshot()
+                instance.delete()
+                deleted += 1
+
+        # Change logging and the other post_save receivers, as for save().
+        for instance in to_update:
+            instance.refresh_from_db(fields=[f.name for f in fields] + ["last_updated"])
+            post_save.send(
+                sender=model, instance=instance, created=False, update_fields=None, raw=False, using=using,
+            )
+        for instance in model.objects.using(using).filter(pk__in=created_ids):
+            post_save.send(
+                sender=model, instance=instance, created=True, update_fields=None, raw=False, using=using,
+            )
+
+        # The raw UPDATE and INSERT bypass the model signals the write version
+        # is otherwise bumped from.
+        if to_update or created_ids or deleted:
+            schedule_write_version_bump(model.custom_object_type.pk, using=using)
+
+    return {
+        "created": len(created_ids),
+        "updated": len(to_update),
+        "deleted": deleted,
+        "unchanged": len(staged) - len(to_update) - len(created_ids),
+    }
@@ -47,6 +47,7 @@ from enum import Enum
 from typing import TYPE_CHECKING
 
 from netbox_custom_objects import constants
+from netbox_custom_objects.indexes import normalize_index_definitions
 from netbox_custom_objects.models import CustomObjectType
 
 if TYPE_CHECKING:
@@ -274,7 +275,7 @@ def _compare_cot_attrs(cot, type_def: dict) -> dict[str, tuple]:
     """
     Return ``{attr: (db_value, schema_value)}`` for COT-level attributes
     that differ.  Absent schema keys are treated as empty string (same
-    convention as the exporter).
+    convention as the exporter); absent ``indexes`` as an empty list.
     """
     changes: dict[str, tuple] = {}
     for attr in _COT_ATTRS:
@@ -285,6 +286,11 @@ def _compare_cot_attrs(cot, type_def: dict) -> dict[str, tuple]:
         schema_val = type_def.get(attr) or ""
         if db_val != schema_val:
             changes[attr] = (db_val, schema_val)
+    # Index definitions compare in canonical form; absent means none.
+    db_indexes = normalize_index_definitions(cot.indexes)
+    schema_indexes = normalize_index_definitions(type_def.get("indexes"))
+    if db_indexes != schema_indexes:
+        changes["indexes"] = (db_indexes, schema_indexes)
     return changes
 
 
@@ -17,6 +17,10 @@ FK-ordering problems when multiple new COTs reference each other:
     CustomObjectTypeField.save() / delete() mechanisms, which encapsulate all
     required DDL.
 
+  Phase 3 — Indexes
+    The COT-level composite index definitions are applied last, as they may
+    reference fields added or renamed in Phase 2.
+
   Finalisation
     schema_document is updated on every affected COT so that tombstone records
     are persisted for future export/diff cycles, and next_schema_id is synced
@@ -35,6 +39,7 @@ from django.db import transaction
 from extras.models import CustomFieldChoiceSet
 
 from netbox_custom_objects import constants
+from netbox_custom_objects.indexes import normalize_index_definitions, validate_index_definitions
 from netbox_custom_objects.models import CustomObjectType, CustomObjectTypeField
 from netbox_custom_objects.schema.comparator import FieldOp, diff_document
 from netbox_custom_objects.schema.format import (
@@ -454,13 +459,15 @@ def _phase1_cots(ordered_diffs, type_defs_by_slug) -> dict:
             logger.info("Created new COT %r (slug=%r)", cot.name, cot.slug)
         else:
             cot = CustomObjectType.objects.get(slug=diff.slug)
-            if diff.cot_changes:
-                for attr, (_db_val, schema_val) in diff.cot_changes.items():
+            # Index definitions are applied in Phase 3.
+            changes = {attr: vals for attr, vals in diff.cot_changes.items() if attr != "indexes"}
+            if changes:
+                for attr, (_db_val, schema_val) in changes.items():
                     setattr(cot, attr, schema_val)
-                cot.save(update_fields=list(diff.cot_changes.keys()))
+                cot.save(update_fields=list(changes.keys()))
                 logger.info(
                     "Updated COT %r attrs: %s",
-                    diff.slug, list(diff.cot_changes.keys()),
+                    diff.slug, list(changes.keys()),
                 )
 
         cot_map[diff.slug] = cot
@@ -491,6 +498,29 @@ def _phase2_fields(ordered_diffs, cot_map, *, allow_destructive: bool) -> None:
                 _apply_field_alter(cot, fc)
 
 
+def _phase3_indexes(ordered_diffs, cot_map, type_defs_by_slug) -> None:
+    """
+    Phase 3: apply COT-level index definitions.
+
+    Runs after Phase 2 so that every field an index names exists under its
+    schema name.  ``CustomObjectType.save()`` creates and drops the indexes.
+    """
+    for diff in ordered_diffs:
+        if diff.is_new:
+            indexes = type_defs_by_slug[diff.slug].get("indexes")
+            if not indexes:
+                continue
+        elif "indexes" in diff.cot_changes:
+            indexes = diff.cot_changes["indexes"][1]
+        else:
+            continue
+        cot = cot_map[diff.slug]
+        validate_index_definitions(indexes, cot.fields.select_related("choice_set"))
+        cot.indexes = normalize_index_definitions(indexes)
+        cot.save(update_fields=["indexes"])
+        logger.info("Applied %d index definition(s) to COT %r", len(indexes), diff.slug)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -530,6 +560,7 @@ def apply_diffs(
     with transaction.atomic():
         cot_map = _phase1_cots(ordered, type_defs_by_slug)
         _phase2_fields(ordered, cot_map, allow_destructive=allow_destructive)
+        _phase3_indexes(ordered, cot_map, type_defs_by_slug)
 
         # Finalise: persist schema_document and sync next_schema_id counters.
         for diff in ordered:
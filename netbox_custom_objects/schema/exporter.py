@@ -24,6 +24,7 @@ Notes
 import logging
 
 from netbox_custom_objects import constants
+from netbox_custom_objects.indexes import normalize_index_definitions
 from netbox_custom_objects.schema.format import (
     CHOICES_TO_SCHEMA_TYPE,
     CUSTOM_OBJECTS_APP_LABEL_SLUG,
@@ -44,6 +45,8 @@ _BASE_ATTRS = (
     "primary",
     "required",
     "unique",
+    "indexed",
+    "trigram_indexed",
     "default",
     "weight",
     "search_weight",
@@ -191,6 +194,8 @@ def export_cot(cot) -> dict:
         result["description"] = cot.description
     if cot.group_name:
         result["group_name"] = cot.group_name
+    if cot.indexes:
+        result["indexes"] = normalize_index_definitions(cot.indexes)
 
     # Active + deprecated fields, ordered by schema_id for stable output.
     exported_fields = []
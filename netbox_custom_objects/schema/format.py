@@ -72,6 +72,8 @@ FIELD_DEFAULTS = {
     "primary": False,
     "required": False,
     "unique": False,
+    "indexed": False,
+    "trigram_indexed": False,
     "default": None,
     "weight": 100,
     "search_weight": 500,
@@ -125,6 +127,8 @@ FIELD_BASE_ATTRS = (
     "primary",
     "required",
     "unique",
+    "indexed",
+    "trigram_indexed",
     "default",
     "weight",
     "search_weight",
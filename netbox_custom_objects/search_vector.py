@@ -0,0 +1,210 @@
+"""
+Full-text search for custom object types.
+
+A type with ``full_text_search`` enabled carries a stored generated ``tsvector``
+column on its table, built by PostgreSQL from every text-like field with a
+non-zero search weight and indexed with GIN.  The quick search (``q``) filter
+then matches ``websearch_to_tsquery()`` against that column, an index lookup,
+instead of OR-ing one ``icontains`` predicate per field (a sequential scan).
+
+Because the column is generated, the database keeps it current on every
+``INSERT``/``UPDATE``, including the set-based upsert and reconcile paths.  Its
+expression is fixed when it is built, though, so adding, removing or
+re-weighting a searchable field rebuilds it in the background
+(:class:`~netbox_custom_objects.jobs.RebuildSearchVectorJob`).  The fields the
+current column was built from are recorded in
+``CustomObjectType.search_vector_signature``; while that does not match the
+type's fields, ``q`` falls back to the per-field search.
+
+Field search weights map onto the four ``tsvector`` weights (lower NetBox
+weights are more important): up to 100 → ``A``, up to 500 → ``B``, up to 1000 →
+``C``, anything else → ``D``.  Multiple selection, date, object and
+polymorphic fields are not included.
+"""
+import logging
+
+from django.db import connections, transaction
+from django.db.models import BooleanField
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+from extras.choices import CustomFieldTypeChoices
+
+__all__ = (
+    "SEARCH_VECTOR_COLUMN",
+    "SEARCH_VECTOR_CONFIG",
+    "build_search_vector",
+    "drop_search_vector",
+    "get_search_vector_fields",
+    "search_vector_active",
+    "search_vector_filter",
+    "search_vector_reads",
+    "search_vector_signature",
+)
+
+logger = logging.getLogger(__name__)
+
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+# Text search configuration.  "simple" lowercases but does not stem or drop
+# stop words, which suits identifiers (hostnames, serials) better than a
+# language dictionary.
+SEARCH_VECTOR_CONFIG = "simple"
+
+# Field types included in the vector.  Each must have an IMMUTABLE conversion
+# to a tsvector, as required for a generated column; date and array columns
+# only have STABLE text casts and are left out.
+_TEXT_TYPES = (
+    CustomFieldTypeChoices.TYPE_TEXT,
+    CustomFieldTypeChoices.TYPE_LONGTEXT,
+    CustomFieldTypeChoices.TYPE_URL,
+    CustomFieldTypeChoices.TYPE_SELECT,
+)
+_NUMERIC_TYPES = (
+    CustomFieldTypeChoices.TYPE_INTEGER,
+    CustomFieldTypeChoices.TYPE_DECIMAL,
+)
+SEARCH_VECTOR_TYPES = _TEXT_TYPES + _NUMERIC_TYPES + (CustomFieldTypeChoices.TYPE_JSON,)
+
+
+def _weight_letter(search_weight):
+    if search_weight <= 100:
+        return "A"
+    if search_weight <= 500:
+        return "B"
+    if search_weight <= 1000:
+        return "C"
+    return "D"
+
+
+def get_search_vector_fields(fields):
+    """Return ``[(field, weight letter)]`` for the fields that feed the vector."""
+    return [
+        (field, _weight_letter(field.search_weight))
+        for field in fields
+        if field.search_weight and field.type in SEARCH_VECTOR_TYPES and not field.is_polymorphic
+    ]
+
+
+def search_vector_signature(fields):
+    """
+    Identify the vector built from ``fields``.  Field ids rather than names are
+    used: a rename does not change the generated column (PostgreSQL tracks the
+    column, not its name), while a type or weight change does.
+    """
+    return ",".join(
+        f"{field.pk}:{field.type}:{letter}" for field, letter in get_search_vector_fields(fields)
+    )
+
+
+def search_vector_reads(custom_object_type, field):
+    """True if the type's search vector column, as built, reads ``field``'s column."""
+    signature = custom_object_type.search_vector_signature
+    return bool(signature) and any(part.split(":")[0] == str(field.pk) for part in signature.split(","))
+
+
+def search_vector_active(custom_object_type, fields):
+    """True if ``q`` can use the type's search vector column as built."""
+    return bool(
+        custom_object_type.full_text_search
+        and custom_object_type.search_vector_signature
+        and custom_object_type.search_vector_signature == search_vector_signature(fields)
+    )
+
+
+def search_vector_filter(queryset, value):
+    """Filter ``queryset`` to the rows whose search vector matches ``value``."""
+    qn = connections[queryset.db].ops.quote_name
+    column = f"{qn(queryset.model._meta.db_table)}.{qn(SEARCH_VECTOR_COLUMN)}"
+    return queryset.filter(RawSQL(
+        f"{column} @@ websearch_to_tsquery(%s::regconfig, %s)",
+        (SEARCH_VECTOR_CONFIG, value),
+        output_field=BooleanField(),
+    ))
+
+
+def _vector_expression(model, fields, connection):
+    qn = connection.ops.quote_name
+    parts = []
+    for field, letter in get_search_vector_fields(fields):
+        column = qn(model._meta.get_field(field.name).column)
+        if field.type == CustomFieldTypeChoices.TYPE_JSON:
+            # to_tsvector(regconfig, jsonb) indexes the string values only.
+            document = f"coalesce({column}, '{{}}'::jsonb)"
+        elif field.type in _NUMERIC_TYPES:
+            document = f"coalesce({column}::text, '')"
+        else:
+            document = f"coalesce({column}, '')"
+        parts.append(
+            f"setweight(to_tsvector('{SEARCH_VECTOR_CONFIG}'::regconfig, {document}), '{letter}')"
+        )
+    return " || ".join(parts)
+
+
+def drop_search_vector(model, schema_editor):
+    """Drop ``model``'s search vector column (and with it, its GIN index) if present."""
+    qn = schema_editor.quote_name
+    schema_editor.execute(
+        f"ALTER TABLE {qn(model._meta.db_table)} DROP COLUMN IF EXISTS {qn(SEARCH_VECTOR_COLUMN)}"
+    )
+
+
+def _has_search_vector_column(model, connection):
+    with connection.cursor() as cursor:
+        columns = connection.introspection.get_table_description(cursor, model._meta.db_table)
+    return any(column.name == SEARCH_VECTOR_COLUMN for column in columns)
+
+
+def build_search_vector(custom_object_type):
+    """
+    Rebuild the search vector column of ``custom_object_type`` from its
+    current fields, or drop it if full-text search is off or no field is
+    searchable, and record the result in ``search_vector_signature``.  A
+    column already built from the current fields is left alone.
+
+    Adding a stored generated column rewrites the table under an ``ACCESS
+    EXCLUSIVE`` lock, which is why this runs in a background job.  Returns
+    the new signature.
+    """
+    # Deferred: models.py imports this module at the top level.
+    from netbox_custom_objects.models import CustomObjectType, _get_schema_connection  # noqa: PLC0415
+
+    schema_conn = _get_schema_connection()
+    model = custom_object_type.get_model()
+    fields = list(custom_object_type.fields.all())
+    signature = search_vector_signature(fields) if custom_object_type.full_text_search else ""
+    if (
+        signature
+        and signature == custom_object_type.search_vector_signature
+        and _has_search_vector_column(model, schema_conn)
+    ):
+        # Triggered by a change that does not touch the vector (e.g. a date
+        # field's weight); skip the table rewrite.
+        return signature
+
+    with transaction.atomic(using=schema_conn.alias), schema_conn.schema_editor() as schema_editor:
+        drop_search_vector(model, schema_editor)
+        if signature:
+            qn = schema_editor.quote_name
+            table = model._meta.db_table
+            schema_editor.execute(
+                f"ALTER TABLE {qn(table)} ADD COLUMN {qn(SEARCH_VECTOR_COLUMN)} tsvector "
+                f"GENERATED ALWAYS AS ({_vector_expression(model, fields, schema_conn)}) STORED"
+            )
+            schema_editor.execute(
+                f"CREATE INDEX {qn(f'{table}_{SEARCH_VECTOR_COLUMN}')} "
+                f"ON {qn(table)} USING gin ({qn(SEARCH_VECTOR_COLUMN)})"
+            )
+        # update() rather than save(): bump cache_timestamp so every worker
+        # rebuilds its FilterSet against the new column, without the model
+        # regeneration side effects of CustomObjectType.save().
+        CustomObjectType.objects.using(schema_conn.alias).filter(pk=custom_object_type.pk).update(
+            search_vector_signature=signature,
+            cache_timestamp=timezone.now(),
+        )
+
+    logger.info(
+        "Rebuilt search vector for custom object type %s (%s)",
+        custom_object_type.pk,
+        signature or "dropped",
+    )
+    return signature
@@ -7,9 +7,11 @@ from django.urls import reverse
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 from netbox.tables import NetBoxTable, columns
+from utilities.paginator import EnhancedPaginator
 from utilities.permissions import get_permission_for_model
 
 from netbox_custom_objects.models import CustomObject, CustomObjectType, CustomObjectTypeField
+from netbox_custom_objects.pagination import ApproximateCountPaginator, get_approximate_count_threshold
 from netbox_custom_objects.utilities import get_viewname
 
 __all__ = ("CustomObjectTable", "CustomObjectTypeFieldTable", "LinkedCustomObjectTable")
@@ -215,6 +217,12 @@ class CustomObjectTypeFieldTable(NetBoxTable):
     unique = columns.BooleanColumn(
         verbose_name=_('Unique')
     )
+    indexed = columns.BooleanColumn(
+        verbose_name=_('Indexed')
+    )
+    trigram_indexed = columns.BooleanColumn(
+        verbose_name=_('Trigram Indexed')
+    )
     is_cloneable = columns.BooleanColumn(
         verbose_name=_('Cloneable')
     )
@@ -236,6 +244,8 @@ class CustomObjectTypeFieldTable(NetBoxTable):
             "description",
             "required",
             "unique",
+            "indexed",
+            "trigram_indexed",
             "search_weight",
             "filter_logic",
             "default",
@@ -292,6 +302,13 @@ class CustomObjectTable(NetBoxTable):
             "last_updated",
         )
 
+    def paginate(self, paginator_class=EnhancedPaginator, *args, **kwargs):
+        # NetBoxTable.configure() always passes EnhancedPaginator; swap in the
+        # estimating subclass when approximate counts are enabled.
+        if paginator_class is EnhancedPaginator and get_approximate_count_threshold() is not None:
+            paginator_class = ApproximateCountPaginator
+        return super().paginate(paginator_class, *args, **kwargs)
+
 
 class LinkedCustomObjectTable(NetBoxTable):
     custom_object_type = tables.Column(
@@ -156,6 +156,14 @@ class ComparatorCOTAttrsTestCase(CustomObjectsTestCase, TestCase):
         result = diff_cot(type_def)
         self.assertEqual(result.field_changes, [])
 
+    def test_index_change_detected(self):
+        type_def = export_cot(self.cot)
+        type_def["indexes"] = [{"name": "by_name", "fields": ["-name"], "condition": {"status": "open"}}]
+        result = diff_cot(type_def)
+        self.assertEqual(result.cot_changes["indexes"], (
+            [], [{"name": "by_name", "fields": ["-name"], "condition": {"status": ["open"]}}],
+        ))
+
 
 class ComparatorFieldAddTestCase(CustomObjectsTestCase, TestCase):
     """Fields present in schema but absent from DB → ADD."""
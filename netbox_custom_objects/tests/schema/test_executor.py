@@ -5,6 +5,7 @@ Covers:
 - _build_dep_order: topological sort and circular-dependency detection
 - apply_document / apply_diffs: new COT creation
 - apply_document / apply_diffs: COT-level attribute updates
+- COT-level index definitions applied after field operations
 - Field ADD (including choice_set, object, malformed rot_str), ALTER, and REMOVE operations
 - Field ALTER: choice_set and related_object_type resolution
 - allow_destructive guard (DestructiveChangesError)
@@ -14,8 +15,11 @@ Covers:
 - Transaction atomicity: partial failure rolls back entirely
 """
 
+from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import SimpleTestCase, TransactionTestCase
 
+from netbox_custom_objects.indexes import get_index_name
 from netbox_custom_objects.schema.comparator import (
     COTDiff,
     FieldChange,
@@ -318,6 +322,51 @@ class ExecutorCOTAttrsTestCase(_ExecutorTestBase):
         self.assertEqual(self.cot.description, "Old description")
 
 
+class ExecutorIndexesTestCase(_ExecutorTestBase):
+    """Executor applies COT-level index definitions after the field operations."""
+
+    def setUp(self):
+        super().setUp()
+        self.cot = self.create_custom_object_type(name='indextest', slug='index-test')
+        self.create_custom_object_type_field(self.cot, name='serial', type='text')
+        self.cot.refresh_from_db()
+
+    def _index_names(self):
+        with connection.cursor() as cursor:
+            return set(connection.introspection.get_constraints(cursor, self.cot.get_model()._meta.db_table))
+
+    def test_index_on_field_added_in_same_apply(self):
+        type_def = export_cot(self.cot)
+        type_def["fields"].append({"id": self.cot.next_schema_id + 1, "name": "asset_tag", "type": "text"})
+        type_def["indexes"] = [{"name": "serial_tag", "fields": ["serial", "asset_tag"]}]
+        apply_document({"schema_version": "1", "types": [type_def]})
+        self.cot.refresh_from_db()
+        self.assertEqual(self.cot.indexes, type_def["indexes"])
+        self.assertIn(get_index_name(self.cot, type_def["indexes"][0]), self._index_names())
+        self.assertEqual(export_cot(self.cot)["indexes"], type_def["indexes"])
+
+    def test_index_removed(self):
+        self.cot.indexes = [{"name": "by_serial", "fields": ["serial"]}]
+        self.cot.save()
+        index_name = get_index_name(self.cot, self.cot.indexes[0])
+        self.assertIn(index_name, self._index_names())
+
+        type_def = export_cot(self.cot)
+        del type_def["indexes"]
+        apply_document({"schema_version": "1", "types": [type_def]})
+        self.cot.refresh_from_db()
+        self.assertEqual(self.cot.indexes, [])
+        self.assertNotIn(index_name, self._index_names())
+
+    def test_unknown_index_field_rolls_back(self):
+        type_def = export_cot(self.cot)
+        type_def["indexes"] = [{"name": "bad", "fields": ["nope"]}]
+        with self.assertRaises(ValidationError):
+            apply_document({"schema_version": "1", "types": [type_def]})
+        self.cot.refresh_from_db()
+        self.assertEqual(self.cot.indexes, [])
+
+
 # ---------------------------------------------------------------------------
 # Field ADD
 # ---------------------------------------------------------------------------
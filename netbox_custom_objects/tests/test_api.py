@@ -4,17 +4,21 @@ Tests for API code paths.
 import json
 import uuid
 from decimal import Decimal
+from unittest import mock
 
-from django.test import TestCase, RequestFactory
+from django.db import connection, transaction
+from django.test import TestCase, RequestFactory, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from utilities.testing import TestCase as NetBoxTestCase, create_test_user
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from netbox_custom_objects.api import serializers
 from netbox_custom_objects.models import CustomObjectType, CustomObjectTypeField
 from netbox_custom_objects.template_content import CustomObjectLink, LinkedCustomObject
-from .base import CustomObjectsTestCase, create_token
+from .base import CustomObjectsTestCase, TransactionCleanupMixin, create_token
 from core.models import ObjectType
 from dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Rack, Site
 from extras.models import Tag
@@ -514,10 +518,19 @@ class LinkedObjectsAPITest(CustomObjectsTestCase, TestCase):
             device_type=device_type, role=role, name='LO Device', site=site
         )
 
+        # Links are only reported from custom objects the user may view.
+        self.view_perm = ObjectPermission(name='linked-objects-view', actions=['view'])
+        self.view_perm.save()
+        self.view_perm.users.add(self.user)
+        self._grant_view(self.model)
+
     def tearDown(self):
         CustomObjectType.clear_model_cache()
         super().tearDown()
 
+    def _grant_view(self, model):
+        self.view_perm.object_types.add(ObjectType.objects.get_for_model(model))
+
     def _url(self, **params):
         base = reverse('plugins-api:netbox_custom_objects-api:linked-objects')
         if params:
@@ -603,6 +616,7 @@ class LinkedObjectsAPITest(CustomObjectsTestCase, TestCase):
             type='object',
         )
         model = cot.get_model()
+        self._grant_view(model)
         linked = model.objects.create(name='poly-gfk-linked', target=self.device)
 
         url = self._url(object_type='dcim.device', object_id=self.device.pk)
@@ -633,6 +647,7 @@ class LinkedObjectsAPITest(CustomObjectsTestCase, TestCase):
             type='multiobject',
         )
         model = cot.get_model()
+        self._grant_view(model)
         linked = model.objects.create(name='poly-m2m-linked')
         linked.targets.add(self.device)
 
@@ -659,6 +674,100 @@ class LinkedObjectsAPITest(CustomObjectsTestCase, TestCase):
         self.assertIn('field_name', result)
         self.assertIn('object', result)
 
+    def test_results_are_paginated_in_the_database(self):
+        """limit/offset page through links across fields, with a total count."""
+        fk_linked = [
+            self.model.objects.create(name=f'page-fk-{i}', device=self.device) for i in range(3)
+        ]
+        m2m_linked = self.model.objects.create(name='page-m2m')
+        m2m_linked.devices.add(self.device)
+
+        url = self._url(object_type='dcim.device', object_id=self.device.pk, limit=2)
+        response = self.client.get(url, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 4)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNotNone(response.data['next'])
+
+        url = self._url(object_type='dcim.device', object_id=self.device.pk, limit=2, offset=2)
+        second_page = self.client.get(url, **self.header).data['results']
+        seen = {
+            (r['field_name'], r['object']['id'])
+            for r in response.data['results'] + second_page
+        }
+        expected = {('device', obj.pk) for obj in fk_linked} | {('devices', m2m_linked.pk)}
+        self.assertEqual(seen, expected)
+
+    def test_batch_lookup_maps_each_target(self):
+        """The batch endpoint maps every requested id to its linking custom objects."""
+        other_device = Device.objects.create(
+            device_type=self.device.device_type, role=self.device.role,
+            name='LO Device 2', site=self.device.site,
+        )
+        fk_linked = self.model.objects.create(name='batch-fk', device=self.device)
+        m2m_linked = self.model.objects.create(name='batch-m2m')
+        m2m_linked.devices.add(self.device, other_device)
+
+        url = reverse('plugins-api:netbox_custom_objects-api:linked-objects-batch')
+        response = self.client.post(
+            url,
+            {'object_type': 'dcim.device', 'object_ids': [self.device.pk, other_device.pk, 999999]},
+            content_type='application/json',
+            **self.header,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['results']
+        self.assertEqual(
+            {(r['field_name'], r['object_id']) for r in results[str(self.device.pk)]},
+            {('device', fk_linked.pk), ('devices', m2m_linked.pk)},
+        )
+        self.assertEqual(
+            [(r['field_name'], r['object_id']) for r in results[str(other_device.pk)]],
+            [('devices', m2m_linked.pk)],
+        )
+        self.assertEqual(results['999999'], [])
+        self.assertEqual(results[str(self.device.pk)][0]['custom_object_type']['slug'], self.cot.slug)
+
+    def test_links_from_objects_the_user_cannot_view_are_hidden(self):
+        """Both endpoints only report custom objects within the user's view permission."""
+        visible = self.model.objects.create(name='visible', device=self.device)
+        hidden = self.model.objects.create(name='hidden', device=self.device)
+        hidden.devices.add(self.device)
+        self.view_perm.constraints = {'name': 'visible'}
+        self.view_perm.save()
+
+        response = self.client.get(self._url(object_type='dcim.device', object_id=self.device.pk), **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['results'][0]['object']['id'], visible.pk)
+
+        url = reverse('plugins-api:netbox_custom_objects-api:linked-objects-batch')
+        response = self.client.post(
+            url, {'object_type': 'dcim.device', 'object_ids': [self.device.pk]},
+            content_type='application/json', **self.header,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(r['field_name'], r['object_id']) for r in response.data['results'][str(self.device.pk)]],
+            [('device', visible.pk)],
+        )
+
+        # No view permission on the type at all: it is skipped.
+        self.view_perm.object_types.clear()
+        response = self.client.post(
+            url, {'object_type': 'dcim.device', 'object_ids': [self.device.pk]},
+            content_type='application/json', **self.header,
+        )
+        self.assertEqual(response.data['results'][str(self.device.pk)], [])
+
+    def test_batch_lookup_requires_id_list(self):
+        url = reverse('plugins-api:netbox_custom_objects-api:linked-objects-batch')
+        response = self.client.post(
+            url, {'object_type': 'dcim.device', 'object_ids': 'x'},
+            content_type='application/json', **self.header,
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 
 class CustomObjectTypeAPITest(CustomObjectsTestCase, TestCase):
     """
@@ -1224,6 +1333,47 @@ class ContextFieldApiTestCase(CustomObjectsTestCase, TestCase):
         self.assertIsNotNone(response.data['_context'])
         self.assertEqual(response.data['_context']['display'], 'Dave')
 
+    # --- Batched rendering ---
+
+    def test_object_context_field_rendered_without_per_row_queries(self):
+        """Object-typed context fields are prefetched once for a list, not fetched per row."""
+        cot = CustomObjectsTestCase.create_custom_object_type(
+            name='ctxapiobject', slug='ctx-api-object'
+        )
+        CustomObjectsTestCase.create_custom_object_type_field(
+            cot, name='name', type='text', primary=True
+        )
+        CustomObjectsTestCase.create_custom_object_type_field(
+            cot, name='site', type='object', context=True,
+            related_object_type=ObjectType.objects.get(app_label='dcim', model='site'),
+        )
+        model = cot.get_model()
+        for i in range(6):
+            site = Site.objects.create(name=f'Ctx Site {i}', slug=f'ctx-site-{i}')
+            model.objects.create(name=f'Row {i}', site=site)
+
+        serializer_class = serializers.get_serializer_class(model)
+        request = RequestFactory().get('/')
+        request.user = self.user
+
+        def render(count):
+            instances = list(model.objects.order_by('pk')[:count])
+            serializer = serializer_class(
+                instances, many=True, fields=['id', '_context'], context={'request': request}
+            )
+            with CaptureQueriesContext(connection) as ctx:
+                data = serializer.data
+            return data, len(ctx.captured_queries)
+
+        render(1)  # prime per-process caches
+        _, few = render(2)
+        data, many = render(6)
+        self.assertEqual(few, many)
+        self.assertEqual(
+            [row['_context']['display'] for row in data],
+            [f'Ctx Site {i}' for i in range(6)],
+        )
+
 
 # ---------------------------------------------------------------------------
 # PEP 440 version string validation — API layer (issue #392)
@@ -2019,6 +2169,284 @@ class ConfigContextAPITest(CustomObjectsTestCase, TestCase):
         self.assertNotIn('local_context_data', response.data)
 
 
+class ApproximateCountAPITest(CustomObjectsTestCase, TestCase):
+    """Opt-in estimated counts on the custom object list endpoint."""
+
+    def setUp(self):
+        super().setUp()
+        self.cot = CustomObjectType.objects.create(name='approx', slug='approx')
+        self.create_custom_object_type_field(
+            self.cot, name='name', label='Name', type='text', primary=True, required=True,
+        )
+        self.model = self.cot.get_model()
+        for i in range(3):
+            self.model.objects.create(name=f'row-{i}')
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {connection.ops.quote_name(self.model._meta.db_table)}')
+
+        perm = ObjectPermission(name='view-approx', actions=['view'])
+        perm.save()
+        perm.users.add(self.user)
+        perm.object_types.add(ObjectType.objects.get_for_model(self.model))
+        token = create_token(self.user)
+        self.header = {'HTTP_AUTHORIZATION': f'Token {token}'}
+        self.client = APIClient()
+        self.url = reverse(
+            'plugins-api:netbox_custom_objects-api:customobject-list',
+            kwargs={'custom_object_type': self.cot.slug},
+        )
+
+    def _get(self, threshold, query=''):
+        with mock.patch(
+            'netbox_custom_objects.pagination.get_plugin_config', return_value=threshold,
+        ):
+            response = self.client.get(f'{self.url}{query}', **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_disabled_by_default(self):
+        response = self.client.get(self.url, **self.header)
+        self.assertEqual(response.data['count'], 3)
+        self.assertNotIn('count_is_approximate', response.data)
+
+    def test_unfiltered_list_uses_table_statistics(self):
+        response = self._get(0)
+        self.assertTrue(response.data['count_is_approximate'])
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(len(response.data['results']), 3)
+
+    def test_filtered_list_uses_planner_estimate(self):
+        response = self._get(0, '?name=row-1')
+        self.assertTrue(response.data['count_is_approximate'])
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_estimate_below_threshold_counts_exactly(self):
+        response = self._get(1_000_000)
+        self.assertFalse(response.data['count_is_approximate'])
+        self.assertEqual(response.data['count'], 3)
+
+    def test_underestimate_still_returns_pages_past_the_estimate(self):
+        with mock.patch('netbox_custom_objects.pagination.estimate_count', return_value=1):
+            response = self._get(0, '?offset=2&limit=1')
+        self.assertTrue(response.data['count_is_approximate'])
+        self.assertEqual(len(response.data['results']), 1)
+        # The count is raised to cover the rows actually returned.
+        self.assertGreaterEqual(response.data['count'], 3)
+
+
+class ListETagAPITest(CustomObjectsTestCase, TestCase):
+    """List-level ETags and the shared list response cache, driven by write versions."""
+
+    def setUp(self):
+        super().setUp()
+        self.cot = CustomObjectType.objects.create(name='etag', slug='etag')
+        self.create_custom_object_type_field(
+            self.cot, name='name', label='Name', type='text', primary=True, required=True,
+        )
+        self.model = self.cot.get_model()
+        self.model.objects.create(name='first')
+
+        perm = ObjectPermission(name='view-etag', actions=['view'])
+        perm.save()
+        perm.users.add(self.user)
+        perm.object_types.add(ObjectType.objects.get_for_model(self.model))
+        token = create_token(self.user)
+        self.header = {'HTTP_AUTHORIZATION': f'Token {token}'}
+        self.client = APIClient()
+        self.url = reverse(
+            'plugins-api:netbox_custom_objects-api:customobject-list',
+            kwargs={'custom_object_type': self.cot.slug},
+        )
+
+    def test_list_returns_etag_and_304_when_unchanged(self):
+        response = self.client.get(self.url, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('W/"'))
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_write_changes_list_etag(self):
+        etag = self.client.get(self.url, **self.header)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.model.objects.create(name='second')
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['count'], 2)
+
+    def test_query_string_is_part_of_etag(self):
+        etag = self.client.get(self.url, **self.header)['ETag']
+        response = self.client.get(f'{self.url}?name=first', HTTP_IF_NONE_MATCH=etag, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_response_cache_serves_until_write(self):
+        with mock.patch('netbox_custom_objects.api.views.get_plugin_config', return_value=60):
+            self.assertEqual(self.client.get(self.url, **self.header).data['count'], 1)
+
+            # The cached body is served while the version is unchanged ...
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {connection.ops.quote_name(self.model._meta.db_table)}')
+            cached = self.client.get(self.url, **self.header)
+            self.assertEqual(cached.data['count'], 1)
+
+            # ... and is dropped once a write bumps it.
+            with self.captureOnCommitCallbacks(execute=True):
+                self.model.objects.create(name='second')
+            fresh = self.client.get(self.url, **self.header)
+            self.assertEqual(fresh.data['count'], 1)
+            self.assertEqual(fresh.data['results'][0]['name'], 'second')
+
+    def test_queryset_update_changes_list_etag(self):
+        etag = self.client.get(self.url, **self.header)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.model.objects.filter(name='first').update(name='renamed')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['name'], 'renamed')
+
+    def test_referenced_object_changes_list_etag(self):
+        # Rows embed the referenced site's nested representation, and deleting
+        # the site nulls the reference without a signal for the row.
+        self.create_custom_object_type_field(
+            self.cot, name='site', label='Site', type='object',
+            related_object_type=ObjectType.objects.get_for_model(Site),
+        )
+        model = self.cot.get_model()
+        site = Site.objects.create(name='Old name', slug='old-name')
+        model.objects.update(site=site)
+
+        etag = self.client.get(self.url, **self.header)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            site.name = 'New name'
+            site.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        etag = response['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            site.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_unreferenced_model_save_skips_cache(self):
+        # The first save loads the map of referenced types into the process.
+        Manufacturer.objects.create(name='Warm', slug='warm')
+        with mock.patch('netbox_custom_objects.models.cache') as cache_mock:
+            Manufacturer.objects.create(name='Unreferenced', slug='unreferenced')
+        cache_mock.get.assert_not_called()
+
+    def test_new_object_field_is_picked_up_by_loaded_map(self):
+        site = Site.objects.create(name='Old name', slug='old-name')
+        self.create_custom_object_type_field(
+            self.cot, name='site', label='Site', type='object',
+            related_object_type=ObjectType.objects.get_for_model(Site),
+        )
+        self.cot.get_model().objects.update(site=site)
+
+        etag = self.client.get(self.url, **self.header)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            site.name = 'New name'
+            site.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class BatchedRelationalValidationTest(CustomObjectsTestCase, TestCase):
+    """Related ids in a write payload are resolved with one query per target model."""
+
+    def setUp(self):
+        super().setUp()
+        self.cot = CustomObjectsTestCase.create_complex_custom_object_type(
+            name='BatchedInput', slug='batched-input',
+        )
+        self.model = self.cot.get_model()
+
+        manufacturer = Manufacturer.objects.create(name='BI Manufacturer', slug='bi-manufacturer')
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model='BI Type', slug='bi-type')
+        role = DeviceRole.objects.create(name='BI Role', slug='bi-role', color='ffffff')
+        site = Site.objects.create(name='BI Site', slug='bi-site')
+        self.devices = [
+            Device.objects.create(device_type=device_type, role=role, name=f'BI Device {i}', site=site)
+            for i in range(6)
+        ]
+
+        perm = ObjectPermission(name='add-batched-input', actions=['add'])
+        perm.save()
+        perm.users.add(self.user)
+        perm.object_types.add(ObjectType.objects.get_for_model(self.model))
+        token = create_token(self.user)
+        self.header = {'HTTP_AUTHORIZATION': f'Token {token}'}
+        self.client = APIClient()
+        self.url = reverse(
+            'plugins-api:netbox_custom_objects-api:customobject-list',
+            kwargs={'custom_object_type': self.cot.slug},
+        )
+
+    def _validate(self, payload):
+        serializer_class = serializers.get_serializer_class(self.model)
+        request = RequestFactory().post(self.url)
+        request.user = self.user
+        serializer = serializer_class(data=payload, context={'request': request})
+        with CaptureQueriesContext(connection) as ctx:
+            valid = serializer.is_valid()
+        return serializer, valid, len(ctx.captured_queries)
+
+    def test_query_count_independent_of_id_count(self):
+        self._validate({'name': 'warm-up', 'devices': [self.devices[0].pk]})  # prime per-process caches
+        _, valid, few = self._validate({
+            'name': 'few', 'device': self.devices[0].pk, 'devices': [self.devices[1].pk],
+        })
+        self.assertTrue(valid)
+        serializer, valid, many = self._validate({
+            'name': 'many', 'device': self.devices[0].pk, 'devices': [d.pk for d in self.devices],
+        })
+        self.assertTrue(valid, serializer.errors)
+        self.assertEqual(few, many)
+        self.assertEqual(
+            [d.pk for d in serializer.validated_data['devices']],
+            [d.pk for d in self.devices],
+        )
+        self.assertEqual(serializer.validated_data['device'], self.devices[0])
+
+    def test_bulk_payload_resolves_references_once(self):
+        serializer_class = serializers.get_serializer_class(self.model)
+        request = RequestFactory().post(self.url)
+        request.user = self.user
+        payload = [
+            {'name': f'bulk-{i}', 'device': self.devices[i].pk, 'devices': [d.pk for d in self.devices]}
+            for i in range(len(self.devices))
+        ]
+        serializer = serializer_class(data=payload, many=True, context={'request': request})
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        device_table = connection.ops.quote_name(Device._meta.db_table)
+        device_queries = [q for q in ctx.captured_queries if f'FROM {device_table}' in q['sql']]
+        self.assertEqual(len(device_queries), 1)
+        self.assertEqual(serializer.validated_data[2]['device'], self.devices[2])
+
+    def test_unknown_id_is_rejected(self):
+        serializer, valid, _ = self._validate({
+            'name': 'missing', 'devices': [self.devices[0].pk, 999999],
+        })
+        self.assertFalse(valid)
+        self.assertIn('devices', serializer.errors)
+
+    def test_create_via_api(self):
+        response = self.client.post(
+            self.url,
+            {'name': 'api', 'devices': [d.pk for d in self.devices]},
+            format='json',
+            **self.header,
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        obj = self.model.objects.get(pk=response.data['id'])
+        self.assertEqual(obj.devices.count(), len(self.devices))
+
+
 class NullOptionalObjectFieldTest(CustomObjectsTestCase, TestCase):
     """
     POST/PATCH with explicit null on a non-required object or multiobject field
@@ -2296,3 +2724,419 @@ class CoordinatesFieldAPITest(CustomObjectsTestCase, NetBoxTestCase):
         obj.refresh_from_db()
         self.assertIsNone(obj.location_latitude)
         self.assertIsNone(obj.location_longitude)
+
+
+class IncludeRelatedAPITest(CustomObjectsTestCase, TestCase):
+    """``include=`` side-loads referenced objects into a de-duplicated ``included`` section."""
+
+    def setUp(self):
+        super().setUp()
+        self.cot = CustomObjectsTestCase.create_complex_custom_object_type(
+            name='IncludeDoc', slug='include-doc',
+        )
+        self.model = self.cot.get_model()
+
+        manufacturer = Manufacturer.objects.create(name='Inc Manufacturer', slug='inc-manufacturer')
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model='Inc Type', slug='inc-type')
+        role = DeviceRole.objects.create(name='Inc Role', slug='inc-role', color='ffffff')
+        site = Site.objects.create(name='Inc Site', slug='inc-site')
+        self.devices = [
+            Device.objects.create(device_type=device_type, role=role, name=f'Inc Device {i}', site=site)
+            for i in range(3)
+        ]
+        for i in range(2):
+            obj = self.model.objects.create(name=f'row-{i}', device=self.devices[0])
+            obj.devices.set(self.devices[1:])
+
+        perm = ObjectPermission(name='include-view', actions=['view'])
+        perm.save()
+        perm.users.add(self.user)
+        perm.object_types.add(ObjectType.objects.get_for_model(self.model), ObjectType.objects.get_for_model(Device))
+        token = create_token(self.user)
+        self.header = {'HTTP_AUTHORIZATION': f'Token {token}'}
+        self.client = APIClient()
+        self.url = reverse(
+            'plugins-api:netbox_custom_objects-api:customobject-list',
+            kwargs={'custom_object_type': self.cot.slug},
+        )
+
+    def test_list_includes_each_target_once(self):
+        response = self.client.get(f'{self.url}?include=device,devices', **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        included = response.data['included']
+        self.assertEqual(
+            sorted((item['object_type'], item['id']) for item in included),
+            sorted(('dcim.device', d.pk) for d in self.devices),
+        )
+        self.assertNotIn('ETag', response)
+
+    def test_detail_includes_targets(self):
+        obj = self.model.objects.first()
+        url = reverse(
+            'plugins-api:netbox_custom_objects-api:customobject-detail',
+            kwargs={'pk': obj.pk, 'custom_object_type': self.cot.slug},
+        )
+        response = self.client.get(f'{url}?include=device', **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual([item['id'] for item in response.data['included']], [self.devices[0].pk])
+
+    def test_unknown_include_field_rejected(self):
+        response = self.client.get(f'{self.url}?include=name', **self.header)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('include', response.data)
+
+
+class UpsertAPITest(CustomObjectsTestCase, TestCase):
+    """Create-or-update by natural key on the custom object upsert endpoint."""
+
+    def setUp(self):
+        super().setUp()
+        self.cot = CustomObjectType.objects.create(name='upsert', slug='upsert')
+        self.create_custom_object_type_field(
+            self.cot, name='hostname', label='Hostname', type='text', primary=True, required=True, unique=True,
+        )
+        self.create_custom_object_type_field(self.cot, name='ram', label='RAM', type='integer')
+        self.model = self.cot.get_model()
+
+        perm = ObjectPermission(name='upsert-perm', actions=['view', 'add', 'change'])
+        perm.save()
+        perm.users.add(self.user)
+        perm.object_types.add(ObjectType.objects.get_for_model(self.model))
+        token = create_token(self.user)
+        self.header = {'HTTP_AUTHORIZATION': f'Token {token}'}
+        self.client = APIClient()
+        self.url = reverse(
+            'plugins-api:netbox_custom_objects-api:customobject-upsert',
+            kwargs={'custom_object_type': self.cot.slug},
+        )
+
+    def _upsert(self, payload, key='hostname'):
+        return self.client.post(f'{self.url}?key={key}', payload, format='json', **self.header)
+
+    def test_creates_updates_and_skips_unchanged(self):
+        from core.models import ObjectChange
+        existing = self.model.objects.create(hostname='web-01', ram=16)
+        same = self.model.objects.create(hostname='web-02', ram=32)
+
+        response = self._upsert([
+            {'hostname': 'web-01', 'ram': 64},
+            {'hostname': 'web-02', 'ram': 32},
+            {'hostname': 'web-03', 'ram': 8},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            (response.data['created'], response.data['updated'], response.data['unchanged']), (1, 1, 1),
+        )
+        self.assertEqual(
+            [r['status'] for r in response.data['results']], ['updated', 'unchanged', 'created'],
+        )
+        self.assertEqual(response.data['results'][0]['id'], existing.pk)
+        existing.refresh_from_db()
+        self.assertEqual(existing.ram, 64)
+        self.assertEqual(self.model.objects.get(hostname='web-03').ram, 8)
+
+        object_type = ObjectType.objects.get_for_model(self.model)
+        changes = ObjectChange.objects.filter(changed_object_type=object_type)
+        self.assertEqual(changes.filter(changed_object_id=existing.pk).count(), 1)
+        self.assertFalse(changes.filter(changed_object_id=same.pk).exists())
+        self.assertEqual(changes.filter(action='create').count(), 1)
+
+    def test_relations_logged_with_row_change(self):
+        # Tags and multi-object values are merged into the row's own change
+        # record: exactly one ObjectChange per written row, with its action.
+        from core.models import ObjectChange
+        self.create_custom_object_type_field(
+            self.cot, name='sites', label='Sites', type='multiobject', related_object_type=self.get_site_object_type(),
+        )
+        self.model = self.cot.get_model()
+        site = Site.objects.create(name='Site 1', slug='site-1')
+        tag = Tag.objects.create(name='Edge', slug='edge')
+        existing = self.model.objects.create(hostname='web-01', ram=16)
+
+        tags = [{'id': tag.id, 'name': tag.name, 'slug': tag.slug, 'color': tag.color}]
+        response = self._upsert([
+            {'hostname': 'web-01', 'ram': 16, 'tags': tags, 'sites': [site.pk]},
+            {'hostname': 'web-02', 'ram': 8, 'tags': tags, 'sites': [site.pk]},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        created = self.model.objects.get(hostname='web-02')
+        self.assertEqual(list(created.sites.all()), [site])
+
+        changes = ObjectChange.objects.filter(changed_object_type=ObjectType.objects.get_for_model(self.model))
+        actions = changes.values_list('action', flat=True)
+        self.assertEqual(list(actions.filter(changed_object_id=existing.pk)), ['update'])
+        self.assertEqual(list(actions.filter(changed_object_id=created.pk)), ['create'])
+
+    def test_key_must_be_backed_by_unique_constraint(self):
+        response = self._upsert([{'hostname': 'web-01', 'ram': 1}], key='ram')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('key', response.data)
+
+    def test_invalid_row_rejects_whole_request(self):
+        response = self._upsert([
+            {'hostname': 'web-01', 'ram': 1},
+            {'hostname': 'web-02', 'ram': 'lots'},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('ram', response.data[1])
+        self.assertFalse(self.model.objects.exists())
+
+    def _constrain_permission(self, constraints):
+        ObjectPermission.objects.filter(name='upsert-perm').update(constraints=constraints)
+
+    def test_row_outside_change_constraint_is_rejected(self):
+        self._constrain_permission({'ram__lt': 100})
+        hidden = self.model.objects.create(hostname='db-01', ram=512)
+        response = self._upsert([
+            {'hostname': 'web-01', 'ram': 8},
+            {'hostname': 'db-01', 'ram': 16},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('non_field_errors', response.data[1])
+        hidden.refresh_from_db()
+        self.assertEqual(hidden.ram, 512)
+        self.assertFalse(self.model.objects.filter(hostname='web-01').exists())
+
+    def test_write_leaving_constraint_is_rolled_back(self):
+        self._constrain_permission({'ram__lt': 100})
+        existing = self.model.objects.create(hostname='web-01', ram=16)
+        response = self._upsert([{'hostname': 'web-01', 'ram': 512}])
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        existing.refresh_from_db()
+        self.assertEqual(existing.ram, 16)
+
+        response = self._upsert([{'hostname': 'web-02', 'ram': 512}])
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(self.model.objects.filter(hostname='web-02').exists())
+
+    def test_concurrently_inserted_row_reported_as_update(self):
+        # Simulate a concurrent insert landing between the batch load and the
+        # write: the row is matched as missing, then conflicts on insert.
+        from netbox_custom_objects import upsert
+
+        fetch_existing = upsert.fetch_existing
+
+        def fetch_then_insert(model, *args, **kwargs):
+            existing = fetch_existing(model, *args, **kwargs)
+            model.objects.create(hostname='web-01', ram=16)
+            return existing
+
+        with mock.patch.object(upsert, 'fetch_existing', side_effect=fetch_then_insert):
+            response = self._upsert([{'hostname': 'web-01', 'ram': 64}])
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.data['results'][0]['status'], 'updated')
+        self.assertEqual(response.data['created'], 0)
+        self.assertEqual(self.model.objects.get(hostname='web-01').ram, 64)
+
+
+class OpenAPISchemaTest(CustomObjectsTestCase, TestCase):
+    """Per-type OpenAPI fragments are generated once and reused until the type changes."""
+
+    def setUp(self):
+        super().setUp()
+        from netbox_custom_objects.api import openapi
+        self.openapi = openapi
+        openapi.clear_schema_cache()
+        self.cot = CustomObjectsTestCase.create_custom_object_type(name='SchemaDoc', slug='schema-doc')
+        CustomObjectsTestCase.create_custom_object_type_field(self.cot, name='name', type='text', primary=True)
+
+    def tearDown(self):
+        self.openapi.clear_schema_cache()
+        super().tearDown()
+
+    def _postprocess(self):
+        return self.openapi.postprocess_schema(
+            result={'paths': {}, 'components': {}}, generator=None, request=None, public=True,
+        )
+
+    def test_paths_added_for_each_type(self):
+        result = self._postprocess()
+        self.assertIn('/api/plugins/custom-objects/schema-doc/', result['paths'])
+        self.assertIn('/api/plugins/custom-objects/schema-doc/{id}/', result['paths'])
+
+    def test_fragment_regenerated_only_when_type_changes(self):
+        generate = self.openapi._generate_fragment
+        with mock.patch.object(self.openapi, '_generate_fragment', wraps=generate) as spy:
+            self._postprocess()
+            self._postprocess()
+            self.assertEqual(spy.call_count, 1)
+
+            CustomObjectsTestCase.create_custom_object_type_field(self.cot, name='extra', type='text')
+            self._postprocess()
+            self.assertEqual(spy.call_count, 2)
+
+    def test_hook_registered_once(self):
+        from drf_spectacular.settings import spectacular_settings
+        from netbox_custom_objects import _register_openapi_hook
+
+        _register_openapi_hook()
+        _register_openapi_hook()
+        hooks = spectacular_settings.POSTPROCESSING_HOOKS
+        self.assertEqual(hooks.count(self.openapi.postprocess_schema), 1)
+        self.assertIs(hooks[0], self.openapi.postprocess_schema)
+
+    def test_paths_survive_spectacular_settings_override(self):
+        from django.conf import settings
+        from drf_spectacular.generators import SchemaGenerator
+
+        overridden = {**settings.SPECTACULAR_SETTINGS, 'TITLE': 'Overridden'}
+        with override_settings(SPECTACULAR_SETTINGS=overridden):
+            schema = SchemaGenerator().get_schema(request=None, public=True)
+        self.assertEqual(schema['info']['title'], 'Overridden')
+        self.assertIn('/api/plugins/custom-objects/schema-doc/', schema['paths'])
+
+
+class ChangeFeedAPITest(TransactionCleanupMixin, CustomObjectsTestCase, TransactionTestCase):
+    """
+    Cursor-based change feed over the change log of a custom object type.
+
+    A TransactionTestCase, since the feed holds back changes newer than the
+    start of the oldest transaction in progress.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.cot = CustomObjectType.objects.create(name='feed', slug='feed')
+        self.create_custom_object_type_field(
+            self.cot, name='name', label='Name', type='text', primary=True, required=True,
+        )
+        self.model = self.cot.get_model()
+
+        perm = ObjectPermission(name='feed-perm', actions=['view', 'add', 'change', 'delete'])
+        perm.save()
+        perm.users.add(self.user)
+        perm.object_types.add(ObjectType.objects.get_for_model(self.model))
+        token = create_token(self.user)
+        self.header = {'HTTP_AUTHORIZATION': f'Token {token}'}
+        self.client = APIClient()
+        self.list_url = reverse(
+            'plugins-api:netbox_custom_objects-api:customobject-list',
+            kwargs={'custom_object_type': self.cot.slug},
+        )
+        self.url = reverse(
+            'plugins-api:netbox_custom_objects-api:customobject-changes',
+            kwargs={'custom_object_type': self.cot.slug},
+        )
+
+    def _feed(self, **params):
+        from netbox_custom_objects.api import views
+        with mock.patch.object(views, 'CHANGE_FEED_SETTLE_SECONDS', 0):
+            response = self.client.get(self.url, params, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return response.data
+
+    def test_feed_pages_through_creates_updates_and_deletes(self):
+        created = self.client.post(self.list_url, {'name': 'one'}, format='json', **self.header).data
+        detail_url = reverse(
+            'plugins-api:netbox_custom_objects-api:customobject-detail',
+            kwargs={'pk': created['id'], 'custom_object_type': self.cot.slug},
+        )
+        self.client.patch(detail_url, {'name': 'uno'}, format='json', **self.header)
+        self.client.delete(detail_url, **self.header)
+
+        first = self._feed(limit=2)
+        self.assertEqual([c['action'] for c in first['results']], ['create', 'update'])
+        self.assertTrue(first['has_more'])
+
+        second = self._feed(limit=2, cursor=first['next_cursor'])
+        self.assertEqual([c['action'] for c in second['results']], ['delete'])
+        self.assertEqual(second['results'][0]['id'], created['id'])
+        self.assertFalse(second['has_more'])
+
+        empty = self._feed(cursor=second['next_cursor'])
+        self.assertEqual(empty['results'], [])
+        self.assertEqual(empty['next_cursor'], second['next_cursor'])
+
+    def test_uncommitted_change_not_skipped(self):
+        self.client.post(self.list_url, {'name': 'one'}, format='json', **self.header)
+        first = self._feed()
+        self.assertEqual(len(first['results']), 1)
+
+        # A change recorded after a transaction still in progress began is held
+        # back, and is returned after the cursor once that transaction commits.
+        with transaction.atomic():
+            self.client.post(self.list_url, {'name': 'two'}, format='json', **self.header)
+            held = self._feed(cursor=first['next_cursor'])
+            self.assertEqual(held['results'], [])
+            self.assertEqual(held['next_cursor'], first['next_cursor'])
+        committed = self._feed(cursor=first['next_cursor'])
+        self.assertEqual([c['data']['name'] for c in committed['results']], ['two'])
+
+    def test_invalid_cursor_rejected(self):
+        response = self.client.get(self.url, {'cursor': '!!'}, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class QueryPlanAPITest(CustomObjectsTestCase, TestCase):
+    """Staff-only EXPLAIN of a custom object type's list query."""
+
+    def setUp(self):
+        super().setUp()
+        self.cot = CustomObjectType.objects.create(name='plans', slug='plans')
+        self.create_custom_object_type_field(
+            self.cot, name='name', label='Name', type='text', primary=True, required=True,
+        )
+        self.create_custom_object_type_field(self.cot, name='count', label='Count', type='integer')
+        model = self.cot.get_model()
+        model.objects.create(name='rtr-01', count=1)
+        model.objects.create(name='sw-01', count=2)
+
+        token = create_token(self.user)
+        self.header = {'HTTP_AUTHORIZATION': f'Token {token}'}
+        self.client = APIClient()
+        self.url = reverse(
+            'plugins-api:netbox_custom_objects-api:customobject-explain',
+            kwargs={'custom_object_type': self.cot.slug},
+        )
+
+    def test_staff_only(self):
+        response = self.client.get(self.url, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_explain_filtered_list(self):
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(self.url, {'name__ic': 'rtr', 'count': 1}, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertIn(self.cot.get_database_table_name(), response.data['sql'])
+        self.assertIn('%rtr%', response.data['params'])
+        self.assertIn('Node Type', response.data['plan'])
+        self.assertNotIn('execution_time', response.data)
+        if response.data['sequential_scan']:
+            suggestions = {(s['field'], s['attribute']) for s in response.data['suggestions']}
+            self.assertEqual(suggestions, {('name', 'trigram_indexed'), ('count', 'indexed')})
+
+    def test_explain_applies_ordering(self):
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(self.url, {'ordering': '-count,bogus'}, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertIn('ORDER BY', response.data['sql'])
+        self.assertIn('"count" DESC', response.data['sql'])
+        self.assertNotIn('bogus', response.data['sql'])
+        # Ordering is not a filter, so it yields no index suggestions.
+        self.assertEqual(response.data['suggestions'], [])
+
+    def test_explain_analyze(self):
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(self.url, {'count': 2, 'analyze': 'true'}, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertIn('Actual Rows', response.data['plan'])
+        self.assertIsNotNone(response.data['execution_time'])
+
+    def test_invalid_filter_rejected(self):
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(self.url, {'count': 'many'}, **self.header)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_management_command(self):
+        from io import StringIO
+        from django.core.management import call_command
+
+        out = StringIO()
+        call_command('explain_custom_objects', self.cot.slug, 'name__ic=rtr', '--json', stdout=out)
+        self.assertIn('%rtr%', json.loads(out.getvalue())['params'])
@@ -382,6 +382,14 @@ class ComparatorFieldAlterTestCase(CustomObjectsTestCase, TestCase):
         self.assertIn("deprecated_since", fc.changed_attrs)
         self.assertIn("scheduled_removal", fc.changed_attrs)
 
+    def test_indexed_change_detected(self):
+        self.create_custom_object_type_field(
+            self.cot, name='hot_field', type='integer'
+        )
+        result = self._alter_field("hot_field", indexed=True)
+        fc = next(fc for fc in result.alters if fc.db_name == "hot_field")
+        self.assertEqual(fc.changed_attrs["indexed"], (False, True))
+
 
 class ComparatorWarningsTestCase(CustomObjectsTestCase, TestCase):
     """Warning conditions: untracked fields, ambiguous absences."""
@@ -6,6 +6,7 @@ from decimal import Decimal
 from unittest.mock import MagicMock
 
 import django_filters
+from django.db import connection
 from django.test import TestCase
 from django.utils import timezone
 
@@ -14,11 +15,12 @@ from dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Site
 from extras.choices import CustomFieldTypeChoices
 from extras.models import CustomFieldChoiceSet
 
+from netbox_custom_objects.dynamic_forms import build_filterset_form_class
 from netbox_custom_objects.field_types import MultiObjectFieldType, ObjectFieldType
 from netbox_custom_objects.filtersets import (
     ArrayContainsFilter, NonPolymorphicMultiObjectFilter, NonPolymorphicObjectFilter,
     PolymorphicMultiObjectFilter, PolymorphicObjectFilter,
-    build_filter_for_field, get_filterset_class,
+    build_filter_for_field, build_search_plan, get_filterset_class,
 )
 from netbox_custom_objects.models import CustomObjectTypeField
 from utilities.forms.fields import (
@@ -253,6 +255,15 @@ class MultiObjectFieldFiltersetTestCase(CustomObjectsTestCase, TestCase):
     def test_no_filter_returns_all(self):
         self.assertEqual(self._filterset({}).qs.count(), 4)
 
+    def test_through_table_has_reverse_lookup_index(self):
+        through = self.cot.get_model()._meta.get_field("sites").remote_field.through
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, through._meta.db_table)
+        indexes = [c["columns"] for c in constraints.values() if c["index"] and not c["unique"]]
+        self.assertIn(["target_id", "source_id"], indexes)
+        # Superseded by the composite index.
+        self.assertNotIn(["target_id"], indexes)
+
 
 # ---------------------------------------------------------------------------
 # Object field with a custom object type as target
@@ -603,6 +614,39 @@ class FiltersetAfterClearCacheTestCase(CustomObjectsTestCase, TestCase):
         self.assertEqual(fs.qs.count(), total)
 
 
+class FiltersetClassCacheTestCase(CustomObjectsTestCase, TestCase):
+    """get_filterset_class() builds once per model generation."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.cot = cls.create_custom_object_type(name="FSCache", slug="fs-cache")
+        cls.create_custom_object_type_field(
+            cls.cot, name="name", label="Name", type="text", primary=True, required=True
+        )
+
+    def test_class_reused_for_same_model(self):
+        model = self.cot.get_model()
+        self.assertIs(get_filterset_class(model), get_filterset_class(model))
+
+    def test_resolved_filters_reused_across_instances(self):
+        model = self.cot.get_model()
+        filterset_class = get_filterset_class(model)
+        with self.assertNumQueries(0):
+            first = filterset_class({}, model.objects.all())
+            second = filterset_class({}, model.objects.all())
+        self.assertEqual(set(first.filters), set(second.filters))
+        self.assertIn("name__isw", first.filters)
+        self.assertIsNot(first.filters["name"], second.filters["name"])
+
+    def test_rebuilt_after_schema_change(self):
+        filterset_class = get_filterset_class(self.cot.get_model())
+        self.create_custom_object_type_field(self.cot, name="extra", label="Extra", type="text")
+        self.cot.refresh_from_db()
+        rebuilt = get_filterset_class(self.cot.get_model())
+        self.assertIsNot(rebuilt, filterset_class)
+        self.assertIn("extra", rebuilt.base_filters)
+
 # ---------------------------------------------------------------------------
 # Typeahead search for non-text primary fields (issue #440)
 # ---------------------------------------------------------------------------
@@ -1170,6 +1214,19 @@ class JSONFieldFiltersetTestCase(ScalarFieldFiltersetTestCase, TestCase):
         cls.obj_match = model.objects.create(name='a', meta={'env': 'prod'})
         cls.obj_no_match = model.objects.create(name='b', meta={'env': 'staging'})
 
+    def test_has_key(self):
+        model = self.cot.get_model()
+        other = model.objects.create(name='c', meta={'owner': 'ops'})
+        pks = list(self._filterset({'meta__has_key': 'owner'}).qs.values_list('pk', flat=True))
+        self.assertEqual(pks, [other.pk])
+
+    def test_jsonb_containment(self):
+        pks = list(self._filterset({'meta__contains': '{"env": "prod"}'}).qs.values_list('pk', flat=True))
+        self.assertEqual(pks, [self.obj_match.pk])
+
+    def test_invalid_containment_document_rejected(self):
+        self.assertFalse(self._filterset({'meta__contains': '{env'}).is_valid())
+
 
 class SelectFieldFiltersetTestCase(ScalarFieldFiltersetTestCase, TestCase):
     """MultipleChoiceFilter with OR semantics is generated for TYPE_SELECT fields."""
@@ -1276,6 +1333,15 @@ class MultiSelectFieldFiltersetTestCase(ScalarFieldFiltersetTestCase, TestCase):
         fs_class = get_filterset_class(model)
         self.assertIsInstance(fs_class.base_filters.get('colors'), ArrayContainsFilter)
 
+    def test_contains_all(self):
+        pks = list(self._filterset({'colors__all': ['red', 'blue']}).qs.values_list('pk', flat=True))
+        self.assertEqual(pks, [self.obj_multi.pk])
+
+    def test_filter_form_exposes_containment_operators(self):
+        form_class = build_filterset_form_class(self.cot.get_model())
+        self.assertIn('colors', form_class.base_fields)
+        self.assertIn('colors__all', form_class.base_fields)
+
 
 # ---------------------------------------------------------------------------
 # Polymorphic Object field — filter form fields and filterset queryset
@@ -1462,6 +1528,22 @@ class PolymorphicMultiObjectFiltersetTestCase(CustomObjectsTestCase, TestCase):
     def test_no_filter_returns_all(self):
         self.assertEqual(self._filterset({}).qs.count(), 5)
 
+    def test_filter_is_exists_semijoin(self):
+        qs = self._filterset({"targets_dcim_device": [self.device1.pk]}).qs
+        sql = str(qs.query).upper()
+        self.assertIn("EXISTS", sql)
+        self.assertNotIn("DISTINCT", sql)
+
+    def test_through_table_has_lookup_index(self):
+        through = next(
+            t for t in self.cot.get_model()._through_models if t.__name__ == self.field.through_model_name
+        )
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, through._meta.db_table)
+        indexes = [c["columns"] for c in constraints.values() if c["index"] and not c["unique"]]
+        self.assertIn(["content_type_id", "object_id", "source_id"], indexes)
+        self.assertNotIn(["content_type_id", "object_id"], indexes)
+
     def test_filterset_has_per_type_filters(self):
         model = self.cot.get_model()
         fs_class = get_filterset_class(model)
@@ -1534,3 +1616,59 @@ class CoordinatesFieldFiltersetTestCase(CustomObjectsTestCase, TestCase):
 
     def test_no_filter_returns_all(self):
         self.assertEqual(self._filterset({}).qs.count(), 2)
+
+
+class RestrictedQuickSearchTestCase(CustomObjectsTestCase, TestCase):
+    """restrict_quick_search limits q to fields with a non-zero search weight."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.cot = cls.create_custom_object_type(name="QuickSearch", slug="quick-search")
+        cls.create_custom_object_type_field(
+            cls.cot, name="name", label="Name", type="text", primary=True, required=True
+        )
+        cls.create_custom_object_type_field(
+            cls.cot, name="notes", label="Notes", type="text", search_weight=0
+        )
+        cls.create_custom_object_type_field(cls.cot, name="size", label="Size", type="integer")
+
+        model = cls.cot.get_model()
+        cls.obj_name = model.objects.create(name="alpha-token", notes="", size=1)
+        cls.obj_notes = model.objects.create(name="beta", notes="mentions token", size=2)
+
+    def _search(self, value):
+        model = self.cot.get_model()
+        return get_filterset_class(model)({"q": value}, model.objects.all()).qs
+
+    def test_unrestricted_search_covers_every_field(self):
+        pks = set(self._search("token").values_list("pk", flat=True))
+        self.assertEqual(pks, {self.obj_name.pk, self.obj_notes.pk})
+
+    def test_restricted_search_skips_zero_weight_fields(self):
+        self.cot.restrict_quick_search = True
+        self.cot.save()
+        pks = set(self._search("token").values_list("pk", flat=True))
+        self.assertEqual(pks, {self.obj_name.pk})
+
+    def test_search_plan(self):
+        fields = list(self.cot.fields.all())
+        self.assertEqual(
+            [(name, lookup) for name, lookup, _parser in build_search_plan(fields)],
+            [("name", "icontains"), ("notes", "icontains"), ("size", "exact")],
+        )
+        self.assertEqual(
+            [name for name, _lookup, _parser in build_search_plan(fields, weighted_only=True)],
+            ["name", "size"],
+        )
+
+    def test_search_does_not_query_fields(self):
+        model = self.cot.get_model()
+        filterset_class = get_filterset_class(model)
+        with self.assertNumQueries(1):
+            list(filterset_class({"q": "2"}, model.objects.all()).qs)
+
+    def test_invalid_date_is_not_an_error(self):
+        self.create_custom_object_type_field(self.cot, name="due", label="Due", type="date")
+        self.cot.refresh_from_db()
+        self.assertEqual(self._search("2025-02-30").count(), 0)
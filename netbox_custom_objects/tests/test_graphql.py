@@ -299,6 +299,57 @@ class GraphQLLiveSchemaTestCase(CustomObjectsTestCase, TestCase):
         CustomObjectType.objects.filter(pk=cot.pk).delete()
         self.assertNotIn("custom_objects_temp_type", str(live_module.get_live_schema()))
 
+    def _built_type(self, cot):
+        from netbox_custom_objects.graphql import types as types_module
+
+        return next(gql_type for key, gql_type in types_module._type_cache.items() if key[1] == cot.pk)
+
+    def test_rebuild_reuses_unchanged_types(self):
+        # Editing one type rebuilds that type only; the others keep their built
+        # GraphQL type across the rebuild.
+        edited = self.create_simple_custom_object_type(name="Edited", slug="edited")
+        other = self.create_simple_custom_object_type(name="Untouched", slug="untouched")
+        first = live_module.get_live_schema()
+        edited_type, other_type = self._built_type(edited), self._built_type(other)
+
+        self.create_custom_object_type_field(edited, name="extra", label="Extra", type="text")
+        second = live_module.get_live_schema()
+        self.assertIsNot(first, second)
+        self.assertIs(self._built_type(other), other_type)
+        self.assertIsNot(self._built_type(edited), edited_type)
+        self.assertIn("extra", str(second))
+
+    def test_rebuild_refreshes_types_embedding_changed_type(self):
+        # A type embedding another custom object type through a relationship field
+        # is rebuilt when the embedded type changes, though its own
+        # cache_timestamp does not move.
+        target = self.create_simple_custom_object_type(name="Target", slug="target")
+        source = self.create_simple_custom_object_type(name="Source", slug="source")
+        target_ot = ObjectType.objects.get(
+            app_label="netbox_custom_objects",
+            model=target.get_table_model_name(target.id).lower(),
+        )
+        self.create_custom_object_type_field(
+            source, name="target", label="Target", type="object", related_object_type=target_ot
+        )
+        live_module.get_live_schema()
+        source_type = self._built_type(source)
+
+        self.create_custom_object_type_field(target, name="extra", label="Extra", type="text")
+        live_module.get_live_schema()
+        self.assertIsNot(self._built_type(source), source_type)
+
+    def test_deleted_type_pruned_from_type_cache(self):
+        from netbox_custom_objects.graphql import types as types_module
+        from netbox_custom_objects.models import CustomObjectType
+
+        cot = self.create_simple_custom_object_type(name="Gone", slug="gone")
+        live_module.get_live_schema()
+        self.assertTrue(any(key[1] == cot.pk for key in types_module._type_cache))
+        CustomObjectType.objects.filter(pk=cot.pk).delete()
+        live_module.get_live_schema()
+        self.assertFalse(any(key[1] == cot.pk for key in types_module._type_cache))
+
 
 class GraphQLSignalRegistrationTestCase(TestCase):
     """
@@ -572,6 +623,57 @@ class GraphQLEndpointTestCase(CustomObjectsTestCase, TestCase):
         self.assertEqual(target["id"], str(site.pk))
         self.assertEqual(target["siteName"], "PolySite")
 
+    def test_relationship_fields_batched_per_level(self):
+        # Each relationship field is loaded once for the whole page, so the query
+        # count does not grow with the number of objects.
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        site = self._make_site(name="BatchSite", slug="batchsite")
+        device = self._make_device(name="batch-dev")
+        cot = self.create_custom_object_type(name="Link", slug="link")
+        self.create_custom_object_type_field(
+            cot, name="name", label="Name", type="text", primary=True, required=True
+        )
+        self.create_custom_object_type_field(
+            cot, name="site", label="Site", type="object", related_object_type=self.get_site_object_type(),
+        )
+        self.create_custom_object_type_field(
+            cot, name="devices", label="Devices", type="multiobject",
+            related_object_type=self.get_device_object_type(),
+        )
+        self.create_polymorphic_field(
+            cot, [self.get_site_object_type(), self.get_device_object_type()],
+            name="targets", type="multiobject",
+        )
+        model = cot.get_model()
+        query = (
+            "{ custom_objects_link_list { name site { id } devices { id } "
+            "targets { ... on SiteType { id } ... on DeviceType { id } } } }"
+        )
+
+        def create(count):
+            for i in range(count):
+                instance = model.objects.create(name=f"link-{model.objects.count()}", site=site)
+                instance.devices.add(device)
+                instance.targets.add(site, device)
+
+        create(2)
+        self._gql(query)  # builds the live schema
+        with CaptureQueriesContext(connection) as small:
+            self._gql(query)
+        create(6)
+        with CaptureQueriesContext(connection) as large:
+            data = self._gql(query)
+
+        rows = data["custom_objects_link_list"]
+        self.assertEqual(len(rows), 8)
+        for row in rows:
+            self.assertEqual(row["site"]["id"], str(site.pk))
+            self.assertEqual([d["id"] for d in row["devices"]], [str(device.pk)])
+            self.assertEqual(len(row["targets"]), 2)
+        self.assertEqual(len(large.captured_queries), len(small.captured_queries))
+
     def test_multiple_types_in_one_schema(self):
         # Several custom object types must all be queryable from the same schema.
         a = self.create_simple_custom_object_type(name="Alpha", slug="alpha")
@@ -672,8 +774,8 @@ class GraphQLPermissionTestCase(CustomObjectsTestCase, TestCase):
         self.assertEqual(related["name"], "Secret")
 
     def test_multiobject_related_filtered_by_permission(self):
-        # The multi-object resolver filters related objects through the batched
-        # permission check (_filter_viewable).  Without view permission on Device
+        # The multi-object resolver loads related objects through the batched,
+        # restricted query of the request's loader.  Without view permission on Device
         # the list is empty; granting it makes the device appear.
         manufacturer = Manufacturer.objects.create(name="Mfr", slug="mfr")
         device_type = DeviceType.objects.create(
@@ -705,6 +807,32 @@ class GraphQLPermissionTestCase(CustomObjectsTestCase, TestCase):
         self.assertEqual(len(devices), 1)
         self.assertEqual(devices[0]["id"], str(device.pk))
 
+    def test_multiobject_related_in_default_ordering(self):
+        # Related objects are listed in the target model's default ordering as
+        # the database applies it (Device names sort naturally: dev2 < dev10).
+        manufacturer = Manufacturer.objects.create(name="Mfr", slug="mfr")
+        device_type = DeviceType.objects.create(
+            manufacturer=manufacturer, model="Model", slug="model"
+        )
+        role = DeviceRole.objects.create(name="Role", slug="role")
+        site = Site.objects.create(name="DevSite", slug="devsite")
+        devices = [
+            Device.objects.create(name=name, device_type=device_type, role=role, site=site)
+            for name in ("dev10", "dev2")
+        ]
+        cot = self.create_multi_object_custom_object_type(name="Rack", slug="rack")
+        model = cot.get_model()
+        instance = model.objects.create(name="R1")
+        instance.devices.add(*devices)
+
+        self._grant(model, "view-rack")
+        self._grant(Device, "view-dev")
+        payload = self._post("{ custom_objects_rack_list { name devices { name } } }")
+        self.assertNotIn("errors", payload, msg=str(payload.get("errors")))
+        names = [d["name"] for d in payload["data"]["custom_objects_rack_list"][0]["devices"]]
+        self.assertEqual(names, [d.name for d in instance.devices.all()])
+        self.assertEqual(names, ["dev2", "dev10"])
+
     def test_multiobject_related_filtered_to_permitted_subset(self):
         # The previous tests grant view on the whole model (all-or-nothing).  This
         # exercises the core security claim at object level: a *constrained*
@@ -750,10 +878,11 @@ class GraphQLPermissionTestCase(CustomObjectsTestCase, TestCase):
         # visible, not silently denied.
         from django.contrib.auth.models import AnonymousUser
 
-        from netbox_custom_objects.graphql.types import _filter_viewable
+        from netbox_custom_objects.graphql.loaders import RelationshipLoader
 
-        self.assertEqual(_filter_viewable(AnonymousUser(), [self.site]), [self.site])
-        self.assertEqual(_filter_viewable(None, [self.site]), [self.site])
+        site = {self.site.pk: self.site}
+        self.assertEqual(RelationshipLoader(AnonymousUser()).fetch_viewable(Site, [self.site.pk]), site)
+        self.assertEqual(RelationshipLoader(None).fetch_viewable(Site, [self.site.pk]), site)
 
     @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
     def test_related_anonymous_access_denied_without_exemption(self):
@@ -761,7 +890,59 @@ class GraphQLPermissionTestCase(CustomObjectsTestCase, TestCase):
         # again matching restrict()'s anonymous handling.
         from django.contrib.auth.models import AnonymousUser
 
-        from netbox_custom_objects.graphql.types import _filter_viewable
+        from netbox_custom_objects.graphql.loaders import RelationshipLoader
+
+        self.assertEqual(RelationshipLoader(AnonymousUser()).fetch_viewable(Site, [self.site.pk]), {})
+        self.assertEqual(RelationshipLoader(None).fetch_viewable(Site, [self.site.pk]), {})
+
+    def test_permission_verdicts_cached_per_request(self):
+        # Within one request's loader, an object is checked once: a later check
+        # of the same object — allowed or denied — issues no query.
+        from netbox_custom_objects.graphql.loaders import RelationshipLoader
+
+        other = Site.objects.create(name="Other", slug="other")
+        self._grant(Site, "view-site")
+        loader = RelationshipLoader(self.user)
+        self.assertEqual(loader.fetch_viewable(Site, [self.site.pk]), {self.site.pk: self.site})
+        with self.assertNumQueries(0):
+            self.assertEqual(loader.fetch_viewable(Site, [self.site.pk]), {self.site.pk: self.site})
+        with self.assertNumQueries(1):  # only the site not seen yet
+            self.assertEqual(
+                loader.fetch_viewable(Site, [self.site.pk, other.pk]),
+                {self.site.pk: self.site, other.pk: other},
+            )
+
+        # No view permission on Region: the denial is cached too.
+        region = Region.objects.create(name="Hidden", slug="hidden")
+        self.assertEqual(loader.fetch_viewable(Region, [region.pk]), {})
+        with self.assertNumQueries(0):
+            self.assertEqual(loader.fetch_viewable(Region, [region.pk]), {})
+
+    def test_related_object_shared_by_fields_checked_once(self):
+        # Two fields referencing the same site across many objects load it with
+        # one restricted query for the whole request.
+        self.create_custom_object_type_field(
+            self.cot, name="backup_site", label="Backup site", type="object",
+            related_object_type=self.get_site_object_type(),
+        )
+        model = self.cot.get_model()
+        for i in range(3):
+            model.objects.create(name=f"srv{i}", site=self.site, backup_site=self.site)
+        self._grant(model, "view-co")
+        self._grant(Site, "view-site")
+        query = "{ custom_objects_server_list { name site { id } backup_site { id } } }"
+        self._post(query)  # builds the live schema
+
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
 
-        self.assertEqual(_filter_viewable(AnonymousUser(), [self.site]), [])
-        self.assertEqual(_filter_viewable(None, [self.site]), [])
+        with CaptureQueriesContext(connection) as captured:
+            payload = self._post(query)
+        self.assertNotIn("errors", payload, msg=str(payload.get("errors")))
+        rows = payload["data"]["custom_objects_server_list"]
+        self.assertEqual(len(rows), 4)
+        self.assertTrue(all(row["site"] == {"id": str(self.site.pk)} for row in rows))
+        self.assertEqual(sum(row["backup_site"] is not None for row in rows), 3)
+        site_table = Site._meta.db_table
+        site_queries = [q for q in captured.captured_queries if f'FROM "{site_table}"' in q["sql"]]
+        self.assertEqual(len(site_queries), 1)
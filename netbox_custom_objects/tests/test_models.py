@@ -26,9 +26,10 @@ from netbox.search.backends import get_backend
 from netbox_custom_objects.api.serializers import get_serializer_class
 from netbox_custom_objects.constants import APP_LABEL
 from netbox_custom_objects.field_types import LazyForeignKey, ObjectFieldType, TextFieldType
-from netbox_custom_objects.jobs import ReindexCustomObjectTypeJob
+from netbox_custom_objects.jobs import RebuildSearchVectorJob, ReindexCustomObjectTypeJob
 from netbox_custom_objects.models import CustomObjectType, CustomObjectTypeField
 from netbox_custom_objects.utilities import extract_cot_id_from_model_name
+from users.models import ObjectPermission
 from .base import CustomObjectsTestCase
 
 
@@ -2649,3 +2650,211 @@ class DisplayExpressionFormValidationTestCase(CustomObjectsTestCase, TestCase):
         form = self._form('{% if make %}{{ make }}')  # missing {% endif %}
         form.is_valid()
         self.assertIn('display_expression', form.errors)
+
+
+class ReconcileTestCase(CustomObjectsTestCase, TestCase):
+    """Set-based desired-state reconcile of a custom object type."""
+
+    def setUp(self):
+        super().setUp()
+        self.cot = CustomObjectType.objects.create(name='reconciled', slug='reconciled')
+        self.create_custom_object_type_field(
+            self.cot, name='hostname', label='Hostname', type='text', primary=True, required=True, unique=True,
+        )
+        self.create_custom_object_type_field(self.cot, name='ram', label='RAM', type='integer')
+        self.model = self.cot.get_model()
+
+    def _reconcile(self, rows, delete=False):
+        from netbox_custom_objects.reconcile import reconcile
+        from netbox_custom_objects.upsert import resolve_natural_key
+        return reconcile(self.model, resolve_natural_key(self.model, 'hostname'), rows, delete=delete)
+
+    def test_creates_updates_and_deletes(self):
+        kept = self.model.objects.create(hostname='a', ram=1)
+        changed = self.model.objects.create(hostname='b', ram=2)
+        self.model.objects.create(hostname='gone', ram=3)
+
+        counts = self._reconcile(
+            [{'hostname': 'a', 'ram': 1}, {'hostname': 'b', 'ram': 20}, {'hostname': 'c', 'ram': None}],
+            delete=True,
+        )
+        self.assertEqual(counts, {'created': 1, 'updated': 1, 'deleted': 1, 'unchanged': 1})
+        self.assertEqual(
+            sorted(self.model.objects.values_list('hostname', 'ram')),
+            [('a', 1), ('b', 20), ('c', None)],
+        )
+        kept_last_updated = kept.last_updated
+        kept.refresh_from_db()
+        self.assertEqual(kept.last_updated, kept_last_updated)
+        changed.refresh_from_db()
+        self.assertEqual(changed.ram, 20)
+
+    def test_absent_rows_kept_without_delete(self):
+        self.model.objects.create(hostname='a', ram=1)
+        counts = self._reconcile([{'hostname': 'b', 'ram': 2}])
+        self.assertEqual(counts['deleted'], 0)
+        self.assertEqual(self.model.objects.count(), 2)
+
+    def test_invalid_input_writes_nothing(self):
+        from netbox_custom_objects.reconcile import ReconcileError
+        with self.assertRaises(ReconcileError) as cm:
+            self._reconcile([{'hostname': 'a', 'ram': 1}, {'hostname': 'a', 'ram': 'x'}])
+        self.assertEqual(cm.exception.errors[0][0], 1)
+        self.assertFalse(self.model.objects.exists())
+
+    def test_invalid_choice_rejected(self):
+        from netbox_custom_objects.reconcile import ReconcileError
+        self.create_custom_object_type_field(
+            self.cot, name='role', label='Role', type='select', choice_set=self.create_choice_set(),
+        )
+        self.model = self.cot.get_model()
+        with self.assertRaises(ReconcileError) as cm:
+            self._reconcile([{'hostname': 'a', 'role': 'choice1'}, {'hostname': 'b', 'role': 'nope'}])
+        self.assertEqual(cm.exception.errors[0][0], 1)
+        self.assertIn('role', cm.exception.errors[0][1])
+        self.assertFalse(self.model.objects.exists())
+
+    def test_missing_required_value_rejected(self):
+        from netbox_custom_objects.reconcile import ReconcileError
+        self.create_custom_object_type_field(self.cot, name='serial', label='Serial', type='text', required=True)
+        self.model = self.cot.get_model()
+        with self.assertRaises(ReconcileError) as cm:
+            self._reconcile([{'hostname': 'a', 'serial': 'x1'}, {'hostname': 'b', 'serial': ''}])
+        self.assertEqual(cm.exception.errors[0][0], 1)
+        self.assertIn('serial', cm.exception.errors[0][1])
+        self.assertFalse(self.model.objects.exists())
+
+    def test_rows_outside_permission_constraints_fail(self):
+        from django.core.exceptions import PermissionDenied
+
+        from netbox_custom_objects.reconcile import reconcile
+        from netbox_custom_objects.upsert import resolve_natural_key
+
+        perm = ObjectPermission(
+            name='reconcile-perm', actions=['view', 'add', 'change', 'delete'], constraints={'ram__lt': 100},
+        )
+        perm.save()
+        perm.users.add(self.user)
+        perm.object_types.add(ObjectType.objects.get_for_model(self.model))
+        key_fields = resolve_natural_key(self.model, 'hostname')
+        hidden = self.model.objects.create(hostname='hidden', ram=512)
+
+        # Updating, deleting or creating a row outside the constraint fails the
+        # whole reconcile.
+        for rows, delete in (
+            ([{'hostname': 'hidden', 'ram': 16}], False),
+            ([{'hostname': 'a', 'ram': 1}], True),
+            ([{'hostname': 'hidden', 'ram': 512}, {'hostname': 'b', 'ram': 1000}], False),
+        ):
+            with self.assertRaises(PermissionDenied):
+                reconcile(self.model, key_fields, rows, delete=delete, user=self.user)
+        hidden.refresh_from_db()
+        self.assertEqual(hidden.ram, 512)
+        self.assertEqual(list(self.model.objects.values_list('hostname', flat=True)), ['hidden'])
+
+        counts = reconcile(
+            self.model, key_fields, [{'hostname': 'hidden', 'ram': 512}, {'hostname': 'a', 'ram': 1}], user=self.user,
+        )
+        self.assertEqual(counts['created'], 1)
+
+
+class FullTextSearchTestCase(CustomObjectsTestCase, TestCase):
+    """Opt-in tsvector column backing the quick search filter."""
+
+    def setUp(self):
+        super().setUp()
+        self.cot = CustomObjectType.objects.create(name='fts', slug='fts')
+        self.title = self.create_custom_object_type_field(
+            self.cot, name='title', label='Title', type='text', primary=True, search_weight=100,
+        )
+        self.create_custom_object_type_field(self.cot, name='ram', label='RAM', type='integer', search_weight=500)
+        self.create_custom_object_type_field(self.cot, name='notes', label='Notes', type='text', search_weight=0)
+        model = self.cot.get_model()
+        self.router = model.objects.create(title='core router', ram=64, notes='uplink')
+        self.switch = model.objects.create(title='access switch', ram=8, notes='router closet')
+
+    def _enable(self):
+        self.cot.full_text_search = True
+        with patch.object(RebuildSearchVectorJob, 'enqueue') as mock_enqueue:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.cot.save()
+        mock_enqueue.assert_called_once_with(cot_id=self.cot.pk)
+        from netbox_custom_objects.search_vector import build_search_vector
+        build_search_vector(CustomObjectType.objects.get(pk=self.cot.pk))
+
+    def _search(self, value):
+        from netbox_custom_objects.filtersets import get_filterset_class
+        model = CustomObjectType.objects.get(pk=self.cot.pk).get_model()
+        return set(get_filterset_class(model)({'q': value}, model.objects.all()).qs.values_list('pk', flat=True))
+
+    def _has_column(self):
+        model = CustomObjectType.objects.get(pk=self.cot.pk).get_model()
+        with connection.cursor() as cursor:
+            columns = connection.introspection.get_table_description(cursor, model._meta.db_table)
+        return 'search_vector' in {column.name for column in columns}
+
+    def test_search_uses_vector_once_built(self):
+        # Substring search before the column exists.
+        self.assertEqual(self._search('rout'), {self.router.pk, self.switch.pk})
+        self._enable()
+        self.assertTrue(self._has_column())
+        # Whole words from weighted fields only: "router" in notes is not indexed.
+        self.assertEqual(self._search('router'), {self.router.pk})
+        self.assertEqual(self._search('rout'), set())
+        self.assertEqual(self._search('64'), {self.router.pk})
+        self.assertEqual(self._search('access -router'), {self.switch.pk})
+
+    def test_column_kept_current_by_database(self):
+        self._enable()
+        model = CustomObjectType.objects.get(pk=self.cot.pk).get_model()
+        model.objects.filter(pk=self.switch.pk).update(title='edge router')
+        self.assertEqual(self._search('router'), {self.router.pk, self.switch.pk})
+
+    def test_disabling_drops_column(self):
+        self._enable()
+        cot = CustomObjectType.objects.get(pk=self.cot.pk)
+        cot.full_text_search = False
+        with patch.object(RebuildSearchVectorJob, 'enqueue'):
+            cot.save()
+        from netbox_custom_objects.search_vector import build_search_vector
+        build_search_vector(cot)
+        self.assertFalse(self._has_column())
+        self.assertEqual(CustomObjectType.objects.get(pk=self.cot.pk).search_vector_signature, '')
+        self.assertEqual(self._search('rout'), {self.router.pk, self.switch.pk})
+
+    def test_deleting_searchable_field_falls_back_until_rebuilt(self):
+        self._enable()
+        field = CustomObjectTypeField.objects.get(pk=self.title.pk)
+        with patch.object(RebuildSearchVectorJob, 'enqueue') as mock_enqueue:
+            with self.captureOnCommitCallbacks(execute=True):
+                field.delete()
+        mock_enqueue.assert_called_once_with(cot_id=self.cot.pk)
+        # The stale signature no longer matches, so q does not touch the dropped column.
+        self.assertEqual(self._search('closet'), {self.switch.pk})
+
+    def test_changing_type_of_field_outside_vector_keeps_column(self):
+        from netbox_custom_objects.search_vector import build_search_vector
+        self._enable()
+        field = CustomObjectTypeField.objects.get(custom_object_type=self.cot, name='notes')
+        field.type = 'longtext'
+        with patch.object(RebuildSearchVectorJob, 'enqueue'):
+            with self.captureOnCommitCallbacks(execute=True):
+                field.save()
+        build_search_vector(CustomObjectType.objects.get(pk=self.cot.pk))
+        self.assertTrue(self._has_column())
+        self.assertEqual(self._search('router'), {self.router.pk})
+
+    def test_changing_type_of_field_in_vector_rebuilds_column(self):
+        from netbox_custom_objects.search_vector import build_search_vector
+        self._enable()
+        field = CustomObjectTypeField.objects.get(custom_object_type=self.cot, name='ram')
+        field.type = 'decimal'
+        with patch.object(RebuildSearchVectorJob, 'enqueue'):
+            with self.captureOnCommitCallbacks(execute=True):
+                field.save()
+        self.assertFalse(self._has_column())
+        # Falls back to the per-field search until the column is rebuilt.
+        self.assertEqual(self._search('rout'), {self.router.pk, self.switch.pk})
+        build_search_vector(CustomObjectType.objects.get(pk=self.cot.pk))
+        self.assertTrue(self._has_column())
+        self.assertEqual(self._search('router'), {self.router.pk})
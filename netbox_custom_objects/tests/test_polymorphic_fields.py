@@ -1013,6 +1013,87 @@ class PolymorphicThroughModelRegistrationTest(
         self.assertIsNotNone(through)
 
 
+# ---------------------------------------------------------------------------
+# prefetch_related support
+# ---------------------------------------------------------------------------
+
+class PolymorphicM2MPrefetchTest(
+    TransactionCleanupMixin, CustomObjectsTestCase, TransactionTestCase
+):
+    """prefetch_related() batches polymorphic M2M lookups across a page of sources."""
+
+    def setUp(self):
+        super().setUp()
+        site_ot = ObjectType.objects.get(app_label="dcim", model="site")
+        prefix_ot = ObjectType.objects.get(app_label="ipam", model="prefix")
+
+        self.cot = CustomObjectType.objects.create(
+            name="PrefetchTest", slug="prefetch-test",
+            verbose_name_plural="Prefetch Tests",
+        )
+        CustomObjectTypeField.objects.create(
+            custom_object_type=self.cot,
+            name="name", type="text", primary=True, required=True,
+        )
+        m2m_field = CustomObjectTypeField.objects.create(
+            custom_object_type=self.cot,
+            name="links", type="multiobject", is_polymorphic=True,
+        )
+        m2m_field.related_object_types.set([site_ot, prefix_ot])
+        self.model = self.cot.get_model()
+
+        self.site = Site.objects.create(name="Prefetch Site", slug="prefetch-site")
+        self.prefix = Prefix.objects.create(
+            prefix="10.20.0.0/24", status=PrefixStatusChoices.STATUS_ACTIVE
+        )
+        self.objs = []
+        for i in range(3):
+            obj = self.model.objects.create(name=f"prefetch-{i}")
+            self.objs.append(obj)
+        # Shared site across all sources; prefix only on the first.
+        self.objs[0].links.set([self.site, self.prefix])
+        self.objs[1].links.set([self.site])
+
+    def test_prefetch_uses_constant_queries(self):
+        """Through table + one query per target model, independent of page size."""
+        with self.assertNumQueries(4):  # sources, through rows, sites, prefixes
+            objs = list(self.model.objects.order_by("pk").prefetch_related("links"))
+        with self.assertNumQueries(0):
+            results = {obj.name: [str(o) for o in obj.links.all()] for obj in objs}
+            counts = {obj.name: obj.links.count() for obj in objs}
+            exists = {obj.name: obj.links.exists() for obj in objs}
+
+        self.assertEqual(
+            results["prefetch-0"],
+            [str(o) for o in sorted([self.site, self.prefix], key=str)],
+        )
+        self.assertEqual(results["prefetch-1"], [str(self.site)])
+        self.assertEqual(results["prefetch-2"], [])
+        self.assertEqual(counts, {"prefetch-0": 2, "prefetch-1": 1, "prefetch-2": 0})
+        self.assertEqual(exists, {"prefetch-0": True, "prefetch-1": True, "prefetch-2": False})
+
+    def test_prefetched_results_match_unprefetched(self):
+        """Prefetched and per-instance lookups return the same objects in the same order."""
+        prefetched = self.model.objects.order_by("pk").prefetch_related("links")
+        for obj, fresh in zip(prefetched, self.model.objects.order_by("pk")):
+            self.assertEqual(
+                [(type(o), o.pk) for o in obj.links.all()],
+                [(type(o), o.pk) for o in fresh.links.all()],
+            )
+
+    def test_write_invalidates_prefetched_cache(self):
+        """add()/remove()/set()/clear() drop the prefetched result for that field."""
+        obj = self.model.objects.prefetch_related("links").get(pk=self.objs[2].pk)
+        self.assertEqual(obj.links.count(), 0)
+
+        obj.links.add(self.site)
+        self.assertEqual([o.pk for o in obj.links.all()], [self.site.pk])
+
+        obj = self.model.objects.prefetch_related("links").get(pk=self.objs[2].pk)
+        obj.links.clear()
+        self.assertFalse(obj.links.exists())
+
+
 # ---------------------------------------------------------------------------
 # Referenced-object deletion
 # ---------------------------------------------------------------------------
@@ -10,6 +10,7 @@ from unittest.mock import patch
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
 from django.core.management import call_command
 from django.db import IntegrityError, connection
 from django.test import TransactionTestCase
@@ -19,7 +20,8 @@ from core.models import ObjectType
 from dcim.models import Site
 from extras.choices import CustomFieldTypeChoices
 from netbox_custom_objects.constants import APP_LABEL
-from netbox_custom_objects.field_types import FIELD_TYPE_CLASS
+from netbox_custom_objects.field_types import FIELD_TYPE_CLASS, get_field_index_name
+from netbox_custom_objects.indexes import get_index_name
 from netbox_custom_objects.models import CustomObjectType, CustomObjectTypeField
 from users.models import ObjectPermission
 
@@ -285,6 +287,144 @@ class SchemaOperationsTestCase(TransactionCleanupMixin, CustomObjectsTestCase, T
         self.assertNotIn('location_latitude', columns)
         self.assertNotIn('location_longitude', columns)
 
+    def _db_indexes(self, model):
+        with connection.cursor() as cursor:
+            return connection.introspection.get_constraints(cursor, model._meta.db_table)
+
+    def test_indexed_field_creates_and_drops_index(self):
+        """indexed=True creates a btree index that follows renames and is dropped when unset."""
+        cot = self.create_custom_object_type(name='indexed', slug='indexed')
+        field = self.create_custom_object_type_field(
+            cot, name='serial', label='Serial', type='text', indexed=True,
+        )
+        index_name = get_field_index_name(field)
+
+        index = self._db_indexes(cot.get_model()).get(index_name)
+        self.assertIsNotNone(index)
+        self.assertEqual(index['columns'], ['serial'])
+        # Django's introspection reports btree indexes as Index.suffix ("idx").
+        self.assertEqual(index['type'], 'idx')
+        self.assertIn(index_name, {i.name for i in cot.get_model()._meta.indexes})
+
+        field = CustomObjectTypeField.objects.get(pk=field.pk)
+        field.name = 'serial_number'
+        field.save()
+        self.assertEqual(self._db_indexes(cot.get_model())[index_name]['columns'], ['serial_number'])
+
+        field = CustomObjectTypeField.objects.get(pk=field.pk)
+        field.indexed = False
+        field.save()
+        self.assertNotIn(index_name, self._db_indexes(cot.get_model()))
+        self.assertEqual(cot.get_model()._meta.indexes, [])
+
+    def test_indexed_json_field_uses_gin(self):
+        cot = self.create_custom_object_type(name='indexedjson', slug='indexed-json')
+        field = self.create_custom_object_type_field(
+            cot, name='attrs', label='Attrs', type='json', indexed=True,
+        )
+        self.assertEqual(self._db_indexes(cot.get_model())[get_field_index_name(field)]['type'], 'gin')
+
+    def test_indexed_rejected_for_unsupported_types(self):
+        cot = self.create_custom_object_type(name='indexedbad', slug='indexed-bad')
+        for kwargs in ({'type': 'longtext'}, {'type': 'text', 'unique': True}):
+            field = CustomObjectTypeField(
+                custom_object_type=cot, name='notes', label='Notes', indexed=True, **kwargs,
+            )
+            with self.assertRaises(ValidationError):
+                field.clean()
+
+    def test_trigram_index_serves_substring_filters(self):
+        """trigram_indexed creates a pg_trgm GIN index the icontains/istartswith filters can use."""
+        cot = self.create_custom_object_type(name='trigram', slug='trigram')
+        field = self.create_custom_object_type_field(
+            cot, name='hostname', label='Hostname', type='text', trigram_indexed=True,
+        )
+        index_name = get_field_index_name(field, 'trgm')
+        model = cot.get_model()
+        self.assertEqual(self._db_indexes(model)[index_name]['type'], 'gin')
+        self.assertIn(index_name, {i.name for i in model._meta.indexes})
+
+        # The table is empty, so keep the planner off the sequential scan.
+        with connection.cursor() as cursor:
+            cursor.execute('SET enable_seqscan = off')
+        try:
+            for lookup in ('icontains', 'istartswith', 'iendswith'):
+                plan = model.objects.filter(**{f'hostname__{lookup}': 'rtr-01'}).explain()
+                self.assertIn(index_name, plan, lookup)
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute('RESET enable_seqscan')
+
+        field = CustomObjectTypeField.objects.get(pk=field.pk)
+        field.trigram_indexed = False
+        field.save()
+        self.assertNotIn(index_name, self._db_indexes(cot.get_model()))
+
+    def test_trigram_index_rejected(self):
+        cot = self.create_custom_object_type(name='trigrambad', slug='trigram-bad')
+        for kwargs in ({'type': 'integer'}, {'type': 'text', 'filter_logic': 'disabled'}):
+            field = CustomObjectTypeField(
+                custom_object_type=cot, name='notes', label='Notes', trigram_indexed=True, **kwargs,
+            )
+            with self.assertRaises(ValidationError):
+                field.clean()
+
+    def test_composite_partial_index_lifecycle(self):
+        """COT index definitions are created, follow field renames and go with a dropped field."""
+        cot = self.create_custom_object_type(name='composite', slug='composite')
+        choice_set = self.create_choice_set(name='Composite Status')
+        self.create_custom_object_type_field(cot, name='serial', label='Serial', type='text')
+        status = self.create_custom_object_type_field(
+            cot, name='status', label='Status', type='select', choice_set=choice_set,
+        )
+        cot = CustomObjectType.objects.get(pk=cot.pk)
+        cot.indexes = [
+            {'name': 'open_serials', 'fields': ['-serial'], 'condition': {'status': 'choice1'}},
+            {'name': 'serial_status', 'fields': ['serial', 'status']},
+        ]
+        cot.full_clean()
+        cot.save()
+        index_name = get_index_name(cot, {'name': 'serial_status'})
+        partial_name = get_index_name(cot, {'name': 'open_serials'})
+
+        indexes = self._db_indexes(cot.get_model())
+        self.assertEqual(indexes[index_name]['columns'], ['serial', 'status'])
+        self.assertEqual(indexes[partial_name]['orders'], ['DESC'])
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT indexdef FROM pg_indexes WHERE indexname = %s', [partial_name])
+            self.assertIn('WHERE', cursor.fetchone()[0])
+        self.assertIn(index_name, {i.name for i in cot.get_model()._meta.indexes})
+
+        status = CustomObjectTypeField.objects.get(pk=status.pk)
+        status.name = 'state'
+        status.save()
+        cot.refresh_from_db()
+        self.assertEqual(cot.indexes[1]['fields'], ['serial', 'state'])
+        self.assertEqual(self._db_indexes(cot.get_model())[index_name]['columns'], ['serial', 'state'])
+
+        CustomObjectTypeField.objects.get(pk=status.pk).delete()
+        cot.refresh_from_db()
+        self.assertEqual(cot.indexes, [])
+        indexes = self._db_indexes(cot.get_model())
+        self.assertNotIn(index_name, indexes)
+        self.assertNotIn(partial_name, indexes)
+
+    def test_composite_index_validation(self):
+        cot = self.create_custom_object_type(name='compositebad', slug='composite-bad')
+        self.create_custom_object_type_field(cot, name='serial', label='Serial', type='text')
+        self.create_custom_object_type_field(cot, name='notes', label='Notes', type='longtext')
+        cot = CustomObjectType.objects.get(pk=cot.pk)
+        for indexes in (
+            [{'name': 'missing', 'fields': ['nope']}],
+            [{'name': 'long_text', 'fields': ['notes']}],
+            [{'name': 'Bad Name', 'fields': ['serial']}],
+            [{'name': 'dup', 'fields': ['serial']}, {'name': 'dup', 'fields': ['-serial']}],
+            [{'name': 'cond', 'fields': ['serial'], 'condition': {'serial': 'x'}}],
+        ):
+            cot.indexes = indexes
+            with self.assertRaises(ValidationError):
+                cot.clean()
+
 
 class PolymorphicMultiObjectConcurrencyTestCase(TransactionCleanupMixin, CustomObjectsTestCase, TransactionTestCase):
     """
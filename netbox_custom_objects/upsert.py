@@ -0,0 +1,289 @@
+"""
+Create-or-update ("upsert") of custom objects by natural key.
+
+A natural key is one or more fields of a custom object type that are backed by
+a database unique constraint or unique index — a single field marked
+*must be unique*, or a composite unique index.  Rows are matched on it, so a
+sync job can send its full data set without first looking up which objects
+exist.
+
+The write is set-based: after the existing rows of a batch are loaded in one
+query, each row is compared with its incoming values, unchanged rows are
+skipped, and every new or changed row is written by a single
+``INSERT ... ON CONFLICT (<key>) DO UPDATE`` per batch.  ``bulk_create()`` sends
+no model signals, so ``post_save`` is sent explicitly for each written row
+after its relations are set; change logging, event rules, search caching and
+the type's write version then behave exactly as they do for ``save()``.
+
+A row missing when its batch was loaded may have been inserted concurrently
+before the write; ``ON CONFLICT`` then turns it into an update.  Which rows
+were really inserted is read back from each new row version's ``xmax`` (zero
+for a fresh insert), so such rows are reported and change-logged as updates.
+
+Object permission constraints are checked on both sides of the write: matched
+rows must be within the user's ``change`` constraints before the write (see
+:func:`permitted_pks`), and the caller checks every written row against its
+``add`` or ``change`` constraints afterwards, inside the transaction.
+"""
+import logging
+from functools import reduce
+from operator import or_
+
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, router
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_save
+from django.utils.translation import gettext as _
+
+from netbox_custom_objects.field_types import get_polymorphic_m2m_field_names
+
+__all__ = (
+    "UPSERT_CREATED",
+    "UPSERT_UNCHANGED",
+    "UPSERT_UPDATED",
+    "fetch_existing",
+    "get_to_many_field_names",
+    "get_unique_keys",
+    "natural_key_value",
+    "permitted_pks",
+    "resolve_natural_key",
+    "write_batch",
+)
+
+logger = logging.getLogger(__name__)
+
+UPSERT_CREATED = "created"
+UPSERT_UPDATED = "updated"
+UPSERT_UNCHANGED = "unchanged"
+
+
+def get_unique_keys(model, using=None):
+    """
+    Return the field-name tuples of ``model`` that are backed by a unique
+    constraint or unique index (the primary key excluded).
+
+    Read from the database catalogue rather than ``_meta`` so composite unique
+    indexes created outside the model definition are found too.
+    """
+    connection = connections[using or router.db_for_write(model)]
+    columns = {f.column: f.name for f in model._meta.concrete_fields}
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+    keys = []
+    for constraint in constraints.values():
+        if not constraint["unique"] or constraint["primary_key"]:
+            continue
+        names = tuple(columns.get(column) for column in constraint["columns"])
+        if names and None not in names:
+            keys.append(names)
+    return keys
+
+
+def get_to_many_field_names(model):
+    """Names of the fields whose values are written through a related manager."""
+    names = {f.name for f in model._meta.many_to_many}
+    names.update(get_polymorphic_m2m_field_names(model))
+    return names
+
+
+def resolve_natural_key(model, names, using=None):
+    """
+    Validate a natural key given as field names (a list or a comma-separated
+    string) and return its model fields, in the order given.
+
+    Raises ``ValueError`` if a name is unknown, not a single-column field, or
+    the set of fields is not covered exactly by a unique constraint.
+    """
+    if isinstance(names, str):
+        names = [name.strip() for name in names.split(",") if name.strip()]
+    if not names:
+        raise ValueError(_("A natural key of one or more field names is required."))
+    if len(set(names)) != len(names):
+        raise ValueError(_("Natural key fields must not repeat."))
+
+    fields = []
+    for name in names:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            raise ValueError(_("Unknown field: {name}").format(name=name))
+        if not field.concrete or field.many_to_many or field.primary_key:
+            raise ValueError(_("Field {name} cannot be part of a natural key.").format(name=name))
+        fields.append(field)
+
+    if frozenset(names) not in {frozenset(key) for key in get_unique_keys(model, using)}:
+        raise ValueError(
+            _("No unique constraint covers exactly the fields {names}.").format(names=", ".join(names))
+        )
+    return fields
+
+
+def natural_key_value(field, raw):
+    """
+    Convert the raw (request) value of a natural key field to its database
+    value.  Object fields accept a primary key or ``{"id": <pk>}``.
+
+    Raises ``ValueError`` for a null value and Django's ``ValidationError`` for
+    an unparsable one.
+    """
+    if isinstance(raw, dict) and field.is_relation:
+        raw = raw.get("id")
+    if raw is None or raw == "":
+        raise ValueError(_("Natural key fields must have a value."))
+    if field.is_relation:
+        return field.target_field.to_python(raw)
+    return field.to_python(raw)
+
+
+def fetch_existing(model, key_fields, keys, prefetch=(), using=None):
+    """
+    Load the rows of ``model`` matching ``keys`` (tuples ordered like
+    ``key_fields``) in one query, returning ``{key: instance}``.
+    """
+    if not keys:
+        return {}
+    if len(key_fields) == 1:
+        condition = Q(**{f"{key_fields[0].attname}__in": [key[0] for key in keys]})
+    else:
+        condition = reduce(or_, (
+            Q(**{field.attname: value for field, value in zip(key_fields, key)}) for key in keys
+        ))
+    queryset = model.objects.using(using or router.db_for_write(model)).filter(condition)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return {
+        tuple(getattr(instance, field.attname) for field in key_fields): instance
+        for instance in queryset
+    }
+
+
+def permitted_pks(model, user, action, pks, using=None):
+    """
+    Return the subset of ``pks`` whose rows ``user`` may ``action`` under its
+    object permission constraints.
+    """
+    if not pks:
+        return set()
+    queryset = model.objects.using(using or router.db_for_write(model)).restrict(user, action)
+    return set(queryset.filter(pk__in=pks).values_list("pk", flat=True))
+
+
+def _column_values(model, name, value, instance):
+    """Return ``(new, current)`` database values of field ``name`` for comparison."""
+    field = model._meta.get_field(name)
+    if isinstance(field, GenericForeignKey):
+        ct_attname = model._meta.get_field(field.ct_field).attname
+        current = (getattr(instance, ct_attname), getattr(instance, field.fk_field))
+        if value is None:
+            return (None, None), current
+        return (ContentType.objects.get_for_model(value).pk, value.pk), current
+    if field.is_relation:
+        return (value.pk if value is not None else None), getattr(instance, field.attname)
+    return value, getattr(instance, field.attname)
+
+
+def _identities(objects):
+    return {(type(obj)._meta.label_lower, obj.pk) for obj in objects or ()}
+
+
+def write_batch(model, key_fields, rows, using=None, batch_size=None):
+    """
+    Write one batch of upsert rows and return ``[(instance, status), ...]``
+    in input order.
+
+    ``rows`` is a list of ``(instance, values)`` pairs: ``instance`` is the
+    existing object matched on the natural key (``None`` for a new one) and
+    ``values`` maps field names to validated values, as produced by the custom
+    object serializer.  To-many values (multi-object fields and tags) replace
+    the current set.  Call inside a transaction.
+    """
+    using = using or router.db_for_write(model)
+    to_many = get_to_many_field_names(model) | {"tags"}
+    key_names = {field.name for field in key_fields}
+
+    results = []
+    pending = []
+    for instance, values in rows:
+        values = dict(values)
+        relations = {name: values.pop(name) for name in list(values) if name in to_many}
+
+        if instance is None:
+            instance = model()
+            for name, value in values.items():
+                setattr(instance, name, value)
+            results.append([instance, UPSERT_CREATED])
+            pending.append((instance, True, relations))
+            continue
+
+        changed = any(
+            new != current
+            for new, current in (_column_values(model, name, value, instance) for name, value in values.items())
+        )
+        relations = {
+            name: value for name, value in relations.items()
+            if _identities(getattr(instance, name).all()) != _identities(value)
+        }
+        if not changed and not relations:
+            results.append([instance, UPSERT_UNCHANGED])
+            continue
+
+        instance.snapshot()
+        for name, value in values.items():
+            setattr(instance, name, value)
+        results.append([instance, UPSERT_UPDATED])
+        pending.append((instance, False, relations))
+
+    if not pending:
+        return [tuple(result) for result in results]
+
+    # bulk_create() runs pre_save(add=True), which would stamp a new `created`
+    # on updated rows in memory; the column itself is excluded from the UPDATE.
+    created_at = {id(instance): instance.created for instance, is_new, _relations in pending if not is_new}
+    update_fields = [
+        field.name for field in model._meta.concrete_fields
+        if not field.primary_key and field.name not in key_names and field.name != "created"
+    ]
+    model.objects.using(using).bulk_create(
+        [instance for instance, _is_new, _relations in pending],
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=[field.name for field in key_fields],
+        update_fields=update_fields,
+    )
+    new = [instance for instance, is_new, _relations in pending if is_new]
+    if new:
+        # A concurrent insert of the same key may have won: the row was then
+        # updated, and its new version carries the locking transaction in xmax.
+        inserted = {
+            pk: (was_inserted, created)
+            for pk, was_inserted, created in model.objects.using(using)
+            .filter(pk__in=[instance.pk for instance in new])
+            .annotate(_inserted=RawSQL("xmax = 0", (), output_field=BooleanField()))
+            .values_list("pk", "_inserted", "created")
+        }
+        statuses = {id(result[0]): result for result in results}
+        for index, (instance, is_new, relations) in enumerate(pending):
+            if is_new and not inserted[instance.pk][0]:
+                created_at[id(instance)] = inserted[instance.pk][1]
+                statuses[id(instance)][1] = UPSERT_UPDATED
+                pending[index] = (instance, False, relations)
+
+    # As the object serializer's create()/update() do: post_save first, so the
+    # change logging handler records the row's ObjectChange, then the to-many
+    # relations, whose m2m_changed handler merges into that same record rather
+    # than logging one of its own.
+    for instance, is_new, relations in pending:
+        if not is_new:
+            instance.created = created_at[id(instance)]
+        if "tags" in relations:
+            instance._tags = relations["tags"] or []
+        post_save.send(
+            sender=model, instance=instance, created=is_new, update_fields=None, raw=False, using=using,
+        )
+        for name, value in relations.items():
+            getattr(instance, name).set(value or [])
+
+    return [tuple(result) for result in results]
@@ -572,7 +572,13 @@ class CustomObjectListView(CustomObjectTableMixin, generic.ObjectListView):
             CustomObjectType, slug=custom_object_type
         )
         model = self.custom_object_type.get_model_with_serializer()
-        return model.objects.all()
+        queryset = model.objects.all()
+        # Batch polymorphic multi-object relationships for the whole page
+        # instead of 1 + (#types) queries per row and field.
+        poly_m2m_names = field_types.get_polymorphic_m2m_field_names(model)
+        if poly_m2m_names:
+            queryset = queryset.prefetch_related(*poly_m2m_names)
+        return queryset
 
     def get_filterset(self):
         return get_filterset_class(self.queryset.model)
@@ -0,0 +1,86 @@
+"""
+Per-CustomObjectType write-version counters.
+
+Each custom object type carries a monotonically increasing *write version*
+(per branch context) that is bumped after every committed write to its rows:
+``post_save`` / ``post_delete`` on the generated model, ``m2m_changed`` on its
+relationships, ``post_save`` / ``post_delete`` on the objects its rows
+reference (their nested representation is embedded in list rows, and
+``SET_NULL`` cascades send no signal for the referencing rows), and explicit
+bumps from code paths that bypass model signals (``QuerySet.update()`` and
+``bulk_create()`` on ``CustomObjectQuerySet``, raw SQL).  Readers use the
+version as a cheap "has anything changed?" token for list ETags and the shared
+list response cache — neither needs to touch the CO table to validate.
+
+Counters live in Django's cache (Redis in a standard NetBox deployment) so all
+workers share them.  A missing counter — first use, eviction or a cache flush —
+is re-seeded from the wall clock in milliseconds rather than from zero, so a
+re-seeded counter can never step back onto a version that was already handed
+out and produce a false cache hit.
+"""
+import logging
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+__all__ = (
+    "bump_write_version",
+    "get_write_version",
+    "schedule_write_version_bump",
+)
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "netbox_custom_objects:write_version"
+
+
+def _cache_key(cot_id, branch_id):
+    return f"{_KEY_PREFIX}:{cot_id}:{branch_id if branch_id is not None else 'main'}"
+
+
+def _seed():
+    return time.time_ns() // 1_000_000
+
+
+def _active_branch_id():
+    from netbox_custom_objects.models import CustomObjectType  # noqa: PLC0415
+    return CustomObjectType._active_branch_id()
+
+
+def get_write_version(cot_id, branch_id=None):
+    """Return the current write version for ``cot_id`` in ``branch_id`` (``None`` = main)."""
+    key = _cache_key(cot_id, branch_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _seed(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_write_version(cot_id, branch_id=None):
+    """Increment the write version for ``cot_id``.  Safe to call outside a transaction."""
+    key = _cache_key(cot_id, branch_id)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Key missing: seed it, then increment so concurrent bumpers still advance it.
+        cache.add(key, _seed(), timeout=None)
+        try:
+            return cache.incr(key)
+        except ValueError:
+            logger.warning("write version for COT %s could not be bumped", cot_id)
+            return None
+
+
+def schedule_write_version_bump(cot_id, using=None):
+    """
+    Bump ``cot_id``'s write version (in the active branch) once the current
+    transaction on ``using`` commits.
+
+    Bumping before commit would let a concurrent reader cache the pre-write
+    rows under the post-write version; ``on_commit`` runs the bump immediately
+    when no transaction is open.
+    """
+    branch_id = _active_branch_id()
+    transaction.on_commit(lambda: bump_write_version(cot_id, branch_id), using=using)